@@ -0,0 +1 @@
+""" zoom_client benchmarks """
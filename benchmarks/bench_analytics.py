@@ -0,0 +1,132 @@
+"""
+Benchmark of the NumPy participant analytics, measuring per-meeting and
+per-user aggregation, concurrency sweeps and hourly heatmaps over generated
+participant columns (10M rows by default), the time to build a table from
+participant records, and the pure-python loop over dictionaries it replaces
+
+usage: python -m benchmarks.bench_analytics [--rows 10000000]
+    [--records 1000000] [--meetings 100000] [--output results.json]
+"""
+
+import argparse
+import json
+import platform
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import numpy as np
+
+from zoom_client.analytics import ParticipantTable, to_datetimes
+
+# january 2021 in epoch seconds
+START = 1_609_459_200
+SPAN = 31 * 24 * 3600
+
+
+def make_columns(rows, meetings, users, seed=0):
+    """participant table of rows sessions spread over meetings and users"""
+    rng = np.random.default_rng(seed)
+    meeting_codes = rng.integers(0, meetings, rows)
+    meeting_starts = START + rng.integers(0, SPAN, meetings)
+    starts = meeting_starts[meeting_codes] + rng.integers(0, 600, rows)
+    ends = starts + rng.integers(60, 3600, rows)
+
+    return ParticipantTable(
+        meeting_codes,
+        [f"m{i}" for i in range(meetings)],
+        rng.integers(0, users, rows),
+        [f"u{i}" for i in range(users)],
+        starts,
+        ends,
+    )
+
+
+def make_records(table, count):
+    """(meeting_uuid, participant) records shaped like streamed participants"""
+    joins = to_datetimes(table.starts[:count]).astype(str)
+    leaves = to_datetimes(table.ends[:count]).astype(str)
+
+    for i in range(count):
+        yield table.meetings[table.meeting_codes[i]], {
+            "id": table.users[table.user_codes[i]],
+            "user_name": "Participant",
+            "join_time": joins[i] + "Z",
+            "leave_time": leaves[i] + "Z",
+        }
+
+
+def dict_loop(records):
+    """per-meeting attendee minutes and sessions the way it was done before"""
+    minutes, sessions = defaultdict(float), defaultdict(int)
+    for meeting_uuid, participant in records:
+        join = datetime.strptime(participant["join_time"], "%Y-%m-%dT%H:%M:%SZ")
+        leave = datetime.strptime(participant["leave_time"], "%Y-%m-%dT%H:%M:%SZ")
+        minutes[meeting_uuid] += (leave - join).total_seconds() / 60
+        sessions[meeting_uuid] += 1
+
+    return minutes, sessions
+
+
+def timed(func, repeat=3):
+    """return the best seconds taken by func over several runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main(argv=None):
+    """run the benchmark, print the results and save them as json"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--meetings", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--output", default="bench_analytics.json")
+    args = parser.parse_args(argv)
+
+    table = make_columns(args.rows, args.meetings, args.users)
+    records = min(args.records, args.rows)
+
+    results = {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "rows": args.rows,
+        "meetings": args.meetings,
+        "users": args.users,
+        "table_bytes": sum(
+            x.nbytes
+            for x in (table.meeting_codes, table.user_codes, table.starts, table.ends)
+        ),
+        "by_meeting_seconds": timed(table.by_meeting),
+        "by_user_seconds": timed(table.by_user),
+        "hourly_heatmap_seconds": timed(table.hourly_heatmap),
+        "timeline_seconds": timed(lambda: table.timeline("m0")),
+        "records": records,
+        "from_records_seconds": timed(
+            lambda: ParticipantTable.from_records(make_records(table, records)),
+            repeat=1,
+        ),
+        "dict_loop_seconds": timed(
+            lambda: dict_loop(make_records(table, records)), repeat=1
+        ),
+        "generate_records_seconds": timed(
+            lambda: sum(1 for _ in make_records(table, records)), repeat=1
+        ),
+    }
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(results, output, indent=2)
+
+    print(json.dumps(results, indent=2))
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Benchmark of client workloads against the local mock Zoom api server,
+measuring wall time, throughput and peak memory of get_current_users,
+get_past_meetings, batch_update_users and add_members
+
+The server and each workload run in separate processes so the memory
+measured is that of the client alone. Results are written as json for
+comparison between versions.
+
+usage: python -m benchmarks.bench_client [--sizes 1000 10000 100000]
+    [--latency SECONDS] [--throttle-every N] [--zoom-rate-limits]
+    [--output results.json]
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+from datetime import datetime, timezone
+
+from tests.mock_zoom import MockZoomServer, MockZoomState
+from zoom_client.client import Client
+
+# rate limits high enough that the client, not pacing, is measured
+UNLIMITED_RATE_LIMITS = {
+    "light": [100_000, 1],
+    "medium": [100_000, 1],
+    "heavy": [100_000, 1],
+    "resource_intensive": [100_000, 1],
+}
+
+
+def state_options(case, count):
+    """mock server data needed by a workload of count records"""
+    return {
+        "get_current_users": {"users": count},
+        "get_past_meetings": {"meetings": count},
+        "batch_update_users": {},
+        "add_members": {},
+    }[case]
+
+
+def run_workload(zoom, case, count):
+    """run a workload, returning the number of records it handled"""
+    if case == "get_current_users":
+        return len(zoom.users.get_current_users())
+
+    if case == "get_past_meetings":
+        return len(zoom.dashboard.get_past_meetings("2021-01-01", "2021-01-31"))
+
+    if case == "batch_update_users":
+        report = zoom.users.batch_update_users([f"u{i}" for i in range(count)])
+        return report.succeeded
+
+    zoom.group.add_members("g1", [f"user{i}@example.edu" for i in range(count)])
+    return count
+
+
+def serve(options, server_options, ready, stop):
+    """run the mock server until stop is set"""
+    state = MockZoomState(**options)
+    state.retry_after = server_options["retry_after"]
+
+    with MockZoomServer(state) as server:
+        ready.put(server.url)
+        stop.wait()
+
+
+def measure(url, case, count, config_extra, results):
+    """run one workload in this (fresh) process and report its measurements"""
+    config_data = {
+        "root_request_url": url,
+        "api_key": "key",
+        "api_secret": "secret",
+        "data_type": "JSON",
+    }
+    config_data.update(config_extra)
+
+    with Client(config_data) as zoom:
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        records = run_workload(zoom, case, count)
+        wall_time = time.perf_counter() - start
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        endpoints = zoom.metrics.snapshot()["endpoints"].values()
+        requests = sum(x["requests"] for x in endpoints)
+
+    results.put(
+        {
+            "case": case,
+            "records": records,
+            "requests": requests,
+            "retries": zoom.retry_stats.snapshot()["retries"],
+            "wall_time": wall_time,
+            "records_per_second": records / wall_time,
+            "requests_per_second": requests / wall_time,
+            # ru_maxrss is reported in kilobytes on linux
+            "peak_memory_bytes": (rss_after - rss_before) * 1024,
+        }
+    )
+
+
+def run_case(context, case, count, args):
+    """run one workload against a freshly started mock server"""
+    ready, results, stop = context.Queue(), context.Queue(), context.Event()
+    server = context.Process(
+        target=serve,
+        args=(
+            dict(
+                state_options(case, count),
+                latency=args.latency,
+                throttle_every=args.throttle_every,
+            ),
+            {"retry_after": args.retry_after},
+            ready,
+            stop,
+        ),
+        daemon=True,
+    )
+    server.start()
+
+    try:
+        config_extra = {"retry": {"backoff_factor": 0.05}}
+        if not args.zoom_rate_limits:
+            config_extra["rate_limits"] = UNLIMITED_RATE_LIMITS
+
+        worker = context.Process(
+            target=measure, args=(ready.get(), case, count, config_extra, results)
+        )
+        worker.start()
+        result = results.get()
+        worker.join()
+    finally:
+        stop.set()
+        server.join()
+
+    return dict(result, size=count)
+
+
+def main(argv=None):
+    """run the benchmark, print the results and save them as json"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        default=[
+            "get_current_users",
+            "get_past_meetings",
+            "batch_update_users",
+            "add_members",
+        ],
+    )
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--throttle-every", type=int, default=0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--zoom-rate-limits", action="store_true")
+    parser.add_argument("--output", default="bench_client.json")
+    args = parser.parse_args(argv)
+
+    context = multiprocessing.get_context("spawn")
+    runs = []
+    for case in args.cases:
+        for count in args.sizes:
+            run = run_case(context, case, count, args)
+            print(json.dumps(run), file=sys.stderr)
+            runs.append(run)
+
+    results = {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "latency": args.latency,
+        "throttle_every": args.throttle_every,
+        "zoom_rate_limits": args.zoom_rate_limits,
+        "runs": runs,
+    }
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(results, output, indent=2)
+
+    print(json.dumps(results, indent=2))
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
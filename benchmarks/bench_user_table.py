@@ -0,0 +1,99 @@
+"""
+Benchmark of the columnar UserTable against the list of user dictionaries
+gathered by Users.get_current_users, measuring memory held per 100k users
+and the time taken to compute account metrics
+
+usage: python -m benchmarks.bench_user_table [number of users]
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+from zoom_client.user_table import UserTable
+
+
+def make_user(i):
+    """user dictionary shaped like a /users listing record"""
+    return json.loads(
+        json.dumps(
+            {
+                "id": f"z8{i:020d}",
+                "first_name": f"First{i}",
+                "last_name": f"Last{i}",
+                "email": f"user{i}@colorado.edu",
+                "type": 1 + i % 3,
+                "pmi": 1000000000 + i,
+                "timezone": "America/Denver",
+                "verified": 1,
+                "dept": f"Department {i % 120}",
+                "created_at": "2019-08-26T16:20:44Z",
+                "last_login_time": f"2021-0{1 + i % 9}-1{i % 10}T10:00:00Z",
+                "last_client_version": "5.4.58891.1207(mac)",
+                "pic_url": f"https://lh3.googleusercontent.com/a-/{i:032d}",
+                "language": "en-US",
+                "phone_number": "",
+                "status": "active" if i % 7 else "inactive",
+                "role_id": "2",
+                "group_ids": [f"group{i % 40}"],
+            }
+        )
+    )
+
+
+def measure(build):
+    """return (result, bytes allocated and held by build())"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return result, held
+
+
+def timed(func, repeat=5):
+    """return the best seconds taken by func over several runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main(count=100_000):
+    """run the benchmark and print results as json"""
+    users, dict_bytes = measure(lambda: [make_user(i) for i in range(count)])
+    # built from freshly decoded users so no strings are shared with the list
+    table, table_bytes = measure(
+        lambda: UserTable.from_users(make_user(i) for i in range(count))
+    )
+
+    results = {
+        "users": count,
+        "dict_list_bytes": dict_bytes,
+        "user_table_bytes": table_bytes,
+        "dict_list_bytes_per_100k": dict_bytes * 100_000 // count,
+        "user_table_bytes_per_100k": table_bytes * 100_000 // count,
+        "dict_list_type_counts_seconds": timed(
+            lambda: Counter(user["type"] for user in users)
+        ),
+        "user_table_type_counts_seconds": timed(table.type_counts),
+        "dict_list_status_counts_seconds": timed(
+            lambda: Counter(user["status"] for user in users)
+        ),
+        "user_table_status_counts_seconds": timed(table.status_counts),
+    }
+
+    print(json.dumps(results, indent=2))
+
+    return results
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -35,4 +35,5 @@ setuptools.setup(
     packages=["zoom_client", "zoom_client.modules"],
     python_requires=">=3.6",
     install_requires=INSTALL_REQUIRES,
+    extras_require={"analytics": ["numpy"], "async": ["aiohttp"]},
 )
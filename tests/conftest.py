@@ -0,0 +1,63 @@
+""" shared pytest fixtures and fakes for zoom_client tests """
+
+import pytest
+from tests.mock_zoom import MockZoomServer, MockZoomState
+from zoom_client.transport import Transport
+
+
+class FakeResponse:
+    """minimal stand-in for requests.Response"""
+
+    def __init__(self, status_code, headers=None, payload=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.payload = payload or {}
+
+    def json(self):
+        """return the payload"""
+        return self.payload
+
+    def close(self):
+        """nothing to release"""
+
+
+class FakeTransport(Transport):
+    """
+    transport recording requests and answering with a scripted list of
+    responses, raising once the script runs out
+    """
+
+    def __init__(self, responses=()):
+        self.responses = list(responses)
+        self.requests = []
+        self.closed = False
+
+    def request(self, method, url, params=None, data=None, headers=None, stream=False):
+        self.requests.append((method, url, params, data))
+        if not self.responses:
+            raise RuntimeError("not sent")
+
+        return self.responses.pop(0)
+
+    def close(self):
+        self.closed = True
+
+
+def pytest_configure(config):
+    """register the zoom_state marker"""
+    config.addinivalue_line(
+        "markers", "zoom_state(**kwargs): MockZoomState served by the server fixture"
+    )
+
+
+@pytest.fixture(name="server")
+def fixture_server(request):
+    """
+    fixture mock zoom api server, serving the MockZoomState arguments of the
+    closest zoom_state marker (module wide through pytestmark)
+    """
+    marker = request.node.get_closest_marker("zoom_state")
+    state = MockZoomState(**(marker.kwargs if marker else {}))
+
+    with MockZoomServer(state) as server:
+        yield server
@@ -0,0 +1,303 @@
+""" local stand-in Zoom API server for tests """
+
+import calendar
+import json
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class ParticipantLists:
+    """participants of each meeting, built when a meeting is first requested"""
+
+    def __init__(self, meetings, count):
+        self.start_times = {x["uuid"]: x["start_time"] for x in meetings}
+        self.count = count
+        self.lists = {}
+
+    def __contains__(self, meeting_uuid):
+        return meeting_uuid in self.start_times
+
+    def __getitem__(self, meeting_uuid):
+        if meeting_uuid not in self.lists:
+            start = datetime.strptime(
+                self.start_times[meeting_uuid], "%Y-%m-%dT%H:%M:%SZ"
+            )
+
+            def minutes(offset):
+                return (start + timedelta(minutes=offset)).strftime(
+                    "%Y-%m-%dT%H:%M:%SZ"
+                )
+
+            # participants join over the first ten minutes and leave one by one
+            self.lists[meeting_uuid] = [
+                {
+                    "id": f"p{j}",
+                    "user_name": f"participant {j}",
+                    "join_time": minutes(j % 10),
+                    "leave_time": minutes(30 + j),
+                }
+                for j in range(self.count)
+            ]
+
+        return self.lists[meeting_uuid]
+
+
+class MockZoomState:
+    """data served by the mock server and a log of requests received"""
+
+    def __init__(
+        self, users=0, meetings=0, participants=0, latency=0.0, throttle_every=0
+    ):
+        """
+        params:
+            users: number of users served
+            meetings: number of past meetings served
+            participants: number of participants of each meeting
+            latency: seconds every request is delayed by
+            throttle_every: answer every nth request with 429 and Retry-After,
+                0 to never throttle
+        """
+        self.users = [
+            {"id": f"u{i}", "email": f"user{i}@example.edu", "type": 1 + i % 3}
+            for i in range(users)
+        ]
+        # meetings are spread over january 2021, every fifth one spanning midnight
+        self.meetings = []
+        for i in range(meetings):
+            start = datetime(2021, 1, 1 + i % 31, 23 if i % 5 == 0 else 10, 30)
+            self.meetings.append(
+                {
+                    "uuid": f"m{i}",
+                    "id": i,
+                    "start_time": start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "end_time": (start + timedelta(hours=1)).strftime(
+                        "%Y-%m-%dT%H:%M:%SZ"
+                    ),
+                }
+            )
+        self.participants = ParticipantLists(self.meetings, participants)
+        self.groups = {}
+        self.failures = {}
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = 1
+        self.requests = []
+        self.lock = threading.Lock()
+
+
+class MockZoomHandler(BaseHTTPRequestHandler):
+    """request handler emulating the Zoom api endpoints used by zoom_client"""
+
+    protocol_version = "HTTP/1.1"
+    state = None
+
+    def setup(self):
+        super().setup()
+        # avoid delayed-ack stalls between the header and body writes
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """silence request logging"""
+
+    def _reply(self, status, payload=None, headers=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _parse(self):
+        url = urlparse(self.path)
+        params = {key: value[0] for key, value in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split("/") if part][1:]
+
+        with self.state.lock:
+            self.state.requests.append((self.command, "/".join(parts), params))
+
+            # scripted failures as {path: [(status, payload[, headers]), ...]}
+            failures = self.state.failures.get("/".join(parts))
+            failure = failures.pop(0) if failures else None
+
+            throttle_every = self.state.throttle_every
+            if throttle_every and len(self.state.requests) % throttle_every == 0:
+                failure = (
+                    429,
+                    {"code": 429, "message": "Too many requests"},
+                    {"Retry-After": str(self.state.retry_after)},
+                )
+
+        if self.state.latency:
+            time.sleep(self.state.latency)
+
+        return parts, params, failure
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    @staticmethod
+    def _page_number(records, key, params):
+        page_size = int(params.get("page_size", 30))
+        page_number = int(params.get("page_number", 1))
+        page_count = max((len(records) + page_size - 1) // page_size, 1)
+        start = (page_number - 1) * page_size
+
+        return {
+            "page_count": page_count,
+            "page_number": page_number,
+            "page_size": page_size,
+            "total_records": len(records),
+            key: records[start : start + page_size],
+        }
+
+    @staticmethod
+    def _next_page_token(records, key, params):
+        page_size = int(params.get("page_size", 30))
+        start = int(params.get("next_page_token") or 0)
+        end = start + page_size
+
+        return {
+            "page_size": page_size,
+            "total_records": len(records),
+            "next_page_token": str(end) if end < len(records) else "",
+            key: records[start:end],
+        }
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """serve listings and single records"""
+        parts, params, failure = self._parse()
+
+        if failure:
+            self._reply(*failure)
+        elif parts == ["users"]:
+            self._reply(200, self._page_number(self.state.users, "users", params))
+        elif parts[0] == "users" and len(parts) == 2:
+            user = next((x for x in self.state.users if x["id"] == parts[1]), None)
+            if user:
+                self._reply(200, user)
+            else:
+                self._reply(404, {"code": 1001, "message": "User does not exist"})
+        elif parts == ["metrics", "meetings"]:
+            meetings = [
+                x
+                for x in self.state.meetings
+                if x["start_time"][:10] <= params["to"]
+                and x["end_time"][:10] >= params["from"]
+            ]
+            self._reply(200, self._next_page_token(meetings, "meetings", params))
+        elif parts[:2] == ["metrics", "meetings"] and parts[-1] == "participants":
+            if len(parts) != 4 or parts[2] not in self.state.participants:
+                self._reply(404, {"code": 3001, "message": "Meeting does not exist"})
+            else:
+                participants = self.state.participants[parts[2]]
+                self._reply(
+                    200, self._next_page_token(participants, "participants", params)
+                )
+        elif parts[0] == "groups" and parts[-1] == "members":
+            members = self.state.groups.get(parts[1], [])
+            self._reply(200, self._page_number(members, "members", params))
+        elif parts == ["report", "daily"]:
+            year, month = int(params["year"]), int(params["month"])
+            dates = [
+                {
+                    "date": f"{year}-{month:02d}-{day:02d}",
+                    "new_users": day % 3,
+                    "meetings": day,
+                    "participants": 3 * day,
+                    "meeting_minutes": 30 * day,
+                }
+                for day in range(1, calendar.monthrange(year, month)[1] + 1)
+            ]
+            self._reply(200, {"year": year, "month": month, "dates": dates})
+        else:
+            self._reply(404, {"code": 404, "message": "Not found"})
+
+    def do_PATCH(self):  # pylint: disable=invalid-name
+        """accept user updates"""
+        _, _, failure = self._parse()
+        self._body()
+        self._reply(*(failure or (204,)))
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """accept group member additions"""
+        parts, _, failure = self._parse()
+        members = self._body().get("members", [])
+        if failure:
+            self._reply(*failure)
+            return
+
+        group = self.state.groups.setdefault(parts[1], [])
+
+        with self.state.lock:
+            for member in members:
+                group.append({"id": member["email"], "email": member["email"]})
+
+        self._reply(201, {"ids": ",".join(x["email"] for x in members)})
+
+    def do_DELETE(self):  # pylint: disable=invalid-name
+        """accept user and group member deletions"""
+        parts, _, failure = self._parse()
+
+        if failure:
+            self._reply(*failure)
+            return
+
+        if parts[0] == "groups":
+            with self.state.lock:
+                self.state.groups[parts[1]] = [
+                    x
+                    for x in self.state.groups.get(parts[1], [])
+                    if x["id"] != parts[3]
+                ]
+
+        self._reply(204)
+
+
+class MockZoomServer:
+    """threaded mock Zoom api server, usable as a context manager"""
+
+    def __init__(self, state=None):
+        self.state = state or MockZoomState()
+        handler = type("Handler", (MockZoomHandler,), {"state": self.state})
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.05,), daemon=True
+        )
+
+    @property
+    def url(self):
+        """root request url of the server"""
+        return f"http://127.0.0.1:{self.server.server_address[1]}/v2/"
+
+    def config(self, **extra):
+        """client config data pointing at the server"""
+        config_data = {
+            "root_request_url": self.url,
+            "api_key": "key",
+            "api_secret": "secret",
+            "data_type": "JSON",
+            "rate_limits": {
+                "light": [1000, 1],
+                "medium": [1000, 1],
+                "heavy": [1000, 1],
+                "resource_intensive": [1000, 1],
+            },
+        }
+        config_data.update(extra)
+
+        return config_data
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,133 @@
+""" pytest tests for zoom_client participant analytics """
+
+import pytest
+from tests.mock_zoom import MockZoomServer, MockZoomState
+from zoom_client.client import Client
+
+np = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from zoom_client.analytics import MeetingTable, ParticipantTable, concurrency_sweep
+
+
+def session(user, join, leave):
+    """participant record joining and leaving at times on 2021-01-04"""
+    return {
+        "id": user,
+        "user_name": user.upper(),
+        "join_time": f"2021-01-04T{join}:00Z",
+        "leave_time": f"2021-01-04T{leave}:00Z" if leave else "",
+    }
+
+
+@pytest.fixture(name="table")
+def fixture_table():
+    """fixture participant table of two meetings"""
+    return ParticipantTable.from_records(
+        [
+            ("a", session("p1", "10:00", "10:30")),
+            ("a", session("p2", "10:10", "10:20")),
+            ("a", session("p1", "10:40", "10:50")),
+            # joins as p1 leaves, which must not count as three at once
+            ("a", session("p3", "10:30", "11:00")),
+            ("b", session("p1", "10:30", "12:15")),
+            ("b", {"user_name": "Guest", "join_time": "2021-01-04T11:00:00Z"}),
+        ]
+    )
+
+
+def test_by_meeting(table):
+    """sessions, distinct participants, minutes and peaks per meeting"""
+    meetings = table.by_meeting()
+
+    assert list(meetings["meeting_uuid"]) == ["a", "b"]
+    assert list(meetings["sessions"]) == [4, 2]
+    assert list(meetings["participants"]) == [3, 2]
+    assert list(meetings["rejoins"]) == [1, 0]
+    assert list(meetings["attendee_minutes"]) == [80, 105]
+    # the guest has no leave time, so the session is counted as empty
+    assert list(meetings["peak_concurrency"]) == [2, 1]
+    assert meetings["peak_time"][0] == np.datetime64("2021-01-04T10:10:00")
+
+
+def test_by_user(table):
+    """sessions, meetings and minutes per user, guests keyed by name"""
+    users = dict(zip(table.by_user()["user"], table.by_user()["attendee_minutes"]))
+
+    assert table.users == ["p1", "p2", "p3", "Guest"]
+    assert users == {"p1": 145, "p2": 10, "p3": 30, "Guest": 0}
+    assert list(table.by_user()["meetings"]) == [2, 1, 1, 1]
+
+
+def test_timeline_and_heatmap(table):
+    """timelines step at each join and leave, minutes are split by hour"""
+    times, counts = table.timeline("a")
+
+    assert list(counts) == [1, 2, 1, 0, 1, 2, 1, 0]
+    assert times[0] == np.datetime64("2021-01-04T10:00:00")
+
+    heatmap = table.hourly_heatmap()
+    # 2021-01-04 was a Monday
+    assert list(heatmap[0, 10:13]) == [30 + 10 + 10 + 30 + 30, 60, 15]
+    assert heatmap.sum() == 185
+    assert list(table.hourly_heatmap(utc_offset_hours=-7)[0, 3:6]) == [110, 60, 15]
+
+
+def test_missing_times():
+    """sessions without a join time are left out of peaks and heatmaps"""
+    table = ParticipantTable.from_records(
+        [
+            ("a", session("p1", "10:00", "10:30")),
+            ("a", {"id": "p2", "join_time": "", "leave_time": ""}),
+            ("a", {"id": "p3", "join_time": "", "leave_time": "2021-01-04T10:45:00Z"}),
+            ("b", {"id": "p4", "join_time": "", "leave_time": ""}),
+        ]
+    )
+    meetings = table.by_meeting()
+
+    assert list(meetings["sessions"]) == [3, 1]
+    assert list(meetings["attendee_minutes"]) == [30, 0]
+    assert list(meetings["peak_concurrency"]) == [1, 0]
+    assert table.timeline("a")[0][0] == np.datetime64("2021-01-04T10:00:00")
+    assert table.hourly_heatmap().sum() == 30
+
+    peak, peak_time = MeetingTable.from_records(
+        [{"uuid": "m1", "start_time": "", "end_time": ""}]
+    ).peak_concurrency()
+    assert (peak, peak_time) == (0, None)
+
+
+def test_tables_from_dashboard():
+    """tables are loaded straight from the streaming dashboard generators"""
+    with MockZoomServer(MockZoomState(meetings=6, participants=40)) as server:
+        with Client(server.config()) as zoom:
+            meetings = MeetingTable.from_records(
+                zoom.dashboard.iter_past_meetings("2021-01-01", "2021-01-31")
+            )
+            participants = zoom.dashboard.get_participant_table(meetings.uuids)
+
+    by_meeting = participants.by_meeting()
+
+    assert len(participants) == 240
+    assert list(by_meeting["peak_concurrency"]) == [40] * 6
+    assert by_meeting["attendee_minutes"][0] == sum(30 + j - j % 10 for j in range(40))
+    # the mock meetings are on separate days, the first starting at 23:30
+    assert meetings.peak_concurrency() == (1, np.datetime64("2021-01-01T23:30:00"))
+
+
+def test_sweep_fallback_matches():
+    """times too far apart to pack into one sort key give the same sweep"""
+    starts = np.array([10, 0, 5, 0], np.int64)
+    ends = np.array([20, 10, 15, 30], np.int64)
+    groups = np.array([1, 0, 1, 1], np.int64)
+    packed = concurrency_sweep(starts, ends, groups)
+
+    # shifting one meeting a few centuries out defeats the packed key
+    far = concurrency_sweep(starts, ends + np.array([0, 0, 0, 2**61]), groups)
+
+    assert [list(x) for x in packed] == [
+        [0, 0, 1, 1, 1, 1, 1, 1],
+        [0, 10, 0, 5, 10, 15, 20, 30],
+        [1, 0, 1, 2, 3, 2, 1, 0],
+    ]
+    assert list(far[2]) == list(packed[2])
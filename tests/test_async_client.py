@@ -0,0 +1,88 @@
+""" pytest tests for zoom_client asyncio client """
+
+import asyncio
+import inspect
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+# pylint: disable=wrong-import-position
+from zoom_client.async_client import AsyncClient
+from zoom_client.exceptions import ZoomAPIError
+
+CONFIG = {
+    "root_request_url": "https://api.zoom.us/v2/",
+    "api_key": "key",
+    "api_secret": "secret",
+    "data_type": "JSON",
+}
+
+
+pytestmark = pytest.mark.zoom_state(users=650, meetings=5, participants=40)
+
+
+def test_async_get_current_users(server):
+    """all user pages are gathered concurrently and in order"""
+
+    async def run():
+        async with AsyncClient(server.config()) as zoom:
+            return await zoom.users.get_current_users()
+
+    users = asyncio.run(run())
+
+    assert [user["id"] for user in users] == [f"u{i}" for i in range(650)]
+
+
+def test_async_dashboard_and_batches(server):
+    """dashboard pagination and concurrent batches run on one event loop"""
+
+    async def run():
+        async with AsyncClient(server.config(), max_concurrency=4) as zoom:
+            meetings = await zoom.dashboard.get_past_meetings(
+                "2021-01-01", "2021-01-31"
+            )
+            participants = await asyncio.gather(
+                *(
+                    zoom.dashboard.get_past_meeting_participants(meeting["uuid"])
+                    for meeting in meetings
+                )
+            )
+            updated = await zoom.users.batch_update_users(["u1", "u2", "u3"])
+
+            return meetings, participants, updated
+
+    meetings, participants, updated = asyncio.run(run())
+
+    assert len(meetings) == 5
+    assert [len(x) for x in participants] == [40] * 5
+    assert updated.succeeded == 3
+
+
+@pytest.mark.parametrize("name", ["users", "group", "report", "dashboard"])
+def test_async_modules_are_awaitable(name):
+    """async modules offer awaitable methods only, none inherited sync ones"""
+    module = type(getattr(AsyncClient(CONFIG), name))
+
+    methods = [
+        x
+        for x in dir(module)
+        if not x.startswith("_") and x != "chunks" and callable(getattr(module, x))
+    ]
+
+    assert methods
+    assert all(inspect.iscoroutinefunction(getattr(module, x)) for x in methods)
+
+
+def test_async_error_page_raises(server):
+    """an error page is raised rather than read as an empty listing"""
+    server.state.failures["users"] = [(400, {"code": 300, "message": "bad page"})]
+
+    async def run():
+        async with AsyncClient(server.config()) as zoom:
+            return await zoom.users.get_current_users()
+
+    with pytest.raises(ZoomAPIError) as error:
+        asyncio.run(run())
+
+    assert error.value.code == 300
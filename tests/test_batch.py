@@ -0,0 +1,37 @@
+""" pytest tests for zoom_client batch executor """
+
+import pytest
+from zoom_client.batch import BatchExecutor
+from zoom_client.client import Client
+
+
+pytestmark = pytest.mark.zoom_state(users=50)
+
+
+def test_batch_update_users_reports_each_user(server):
+    """every user gets an outcome in input order"""
+    user_ids = [f"u{i}" for i in range(50)]
+
+    with Client(server.config()) as zoom:
+        report = zoom.users.batch_update_users(user_ids, max_workers=4)
+
+    assert report.succeeded == 50
+    assert [outcome.item for outcome in report] == user_ids
+    assert all(outcome.status_code == 204 for outcome in report)
+    assert all(outcome.attempts == 1 for outcome in report)
+
+
+def test_batch_stops_on_error_rate():
+    """new items stop being submitted once the error rate is exceeded"""
+
+    def fail(item):
+        raise RuntimeError(f"failed {item}")
+
+    report = BatchExecutor(max_workers=2, max_error_rate=0.5, min_samples=4).run(
+        fail, range(100)
+    )
+
+    assert report.aborted
+    assert report.succeeded == 0
+    assert len(report) + len(report.skipped) == 100
+    assert report.failed[0].error == "failed 0"
@@ -0,0 +1,99 @@
+""" pytest tests for zoom_client persistent response cache """
+
+import os
+from datetime import date, timedelta
+
+import pytest
+from tests.mock_zoom import MockZoomServer, MockZoomState
+from zoom_client.cache import DEFAULT_RULES, CacheRule, ResponseCache
+from zoom_client.client import Client
+
+
+pytestmark = pytest.mark.zoom_state(meetings=250, participants=10)
+
+
+def test_historical_meetings_are_cached(server, tmp_path):
+    """repeated historical queries cost no api calls, even in a new client"""
+    for _ in range(2):
+        with Client(server.config(cache_dir=str(tmp_path))) as zoom:
+            meetings = zoom.dashboard.get_past_meetings("2021-01-01", "2021-01-31")
+            participants = zoom.dashboard.get_past_meeting_participants("m1")
+            stats = zoom.cache.stats()
+
+    assert len(meetings) == 250
+    assert len(participants) == 10
+    assert len(server.state.requests) == 2
+    assert stats["hits"] == 2 and stats["misses"] == 0
+
+
+def test_token_chains_are_cached(tmp_path):
+    """whole next_page_token chains are replayed without their expired tokens"""
+    state = MockZoomState(meetings=700)
+
+    with MockZoomServer(state) as server:
+        for _ in range(2):
+            with Client(server.config(cache_dir=str(tmp_path))) as zoom:
+                meetings = zoom.dashboard.get_past_meetings("2021-01-01", "2021-01-31")
+                stats = zoom.cache.stats()
+
+        # a chain cut short by an error is not cached
+        state.failures["metrics/meetings"] = [
+            (200, {"next_page_token": "300", "meetings": []}),
+            (400, {"code": 300, "message": "Invalid next page token"}),
+        ]
+        with Client(server.config(cache_dir=str(tmp_path))) as zoom:
+            failed = zoom.dashboard.get_past_meetings("2021-02-01", "2021-02-28")
+            partial = zoom.cache.stats()
+
+    assert len(meetings) == 700
+    assert len(server.state.requests) == 3 + 2
+    assert stats["hits"] == 1 and stats["entries"] == 1
+    assert failed[-1]["error_code"] == 300
+    assert partial["entries"] == 1
+
+
+def test_cache_rules_ttl():
+    """old data is cached forever while recent data gets a short ttl"""
+    rule = CacheRule(
+        "metrics/meetings", 300, immutable_after_days=2, date_of=lambda x: x["to"]
+    )
+
+    assert rule.ttl({"to": date.today() - timedelta(days=5)}) is None
+    assert rule.ttl({"to": date.today()}) == 300
+
+
+def test_participants_of_old_meetings_are_kept():
+    """participants are cached forever once the meeting is over for days"""
+    rule = next(
+        x for x in DEFAULT_RULES if x.matches("metrics/meetings/m1/participants")
+    )
+
+    def page(leave_time):
+        return {
+            "next_page_token": "",
+            "participants": [
+                {"join_time": "2021-01-04T10:00:00Z", "leave_time": leave_time}
+            ],
+        }
+
+    assert rule.ttl({}, page("2021-01-04T11:00:00Z")) is None
+    assert rule.ttl({}, {"pages": [page("2021-01-04T11:00:00Z")]}) is None
+    assert rule.ttl({}, page(date.today().isoformat() + "T00:00:00Z")) == 86400
+    # a participant still in the meeting
+    assert rule.ttl({}, page("")) == 86400
+
+
+def test_cache_eviction(tmp_path):
+    """least recently used responses are evicted beyond the size bound"""
+    cache = ResponseCache(
+        str(tmp_path), max_bytes=400, rules=(CacheRule("users/*", None),)
+    )
+
+    for i in range(10):
+        cache.set(f"users/u{i}", {}, {"id": f"u{i}", "data": os.urandom(100).hex()})
+
+    assert cache.get("users/u9", {}) is not None
+    assert cache.get("users/u0", {}) is None
+    assert cache.get("metrics/meetings", {}) is None
+    assert cache.stats()["bytes"] <= 400
+    cache.close()
@@ -0,0 +1,54 @@
+""" pytest tests for zoom_client crawl checkpoints """
+
+from itertools import islice
+
+import pytest
+from zoom_client.checkpoint import Checkpoint
+from zoom_client.client import Client
+
+
+pytestmark = pytest.mark.zoom_state(meetings=1000)
+
+
+def crawl(zoom, checkpoint, stop_after=None, resume=True):
+    """crawl january meetings, optionally stopping part way as if killed"""
+    meetings = zoom.dashboard.iter_past_meetings(
+        "2021-01-01", "2021-01-31", checkpoint=checkpoint, resume=resume
+    )
+    return list(islice(meetings, stop_after))
+
+
+def test_crawl_resumes_where_it_stopped(server, tmp_path):
+    """a restarted crawl continues from the saved next_page_token"""
+    path = str(tmp_path / "meetings.json")
+
+    with Client(server.config()) as zoom:
+        assert len(crawl(zoom, Checkpoint(path), stop_after=650)) == 650
+        assert len(server.state.requests) == 3
+
+        meetings = crawl(zoom, Checkpoint(path))
+
+    assert len(server.state.requests) == 4
+    assert [x["uuid"] for x in meetings] == [f"m{i}" for i in range(1000)]
+    assert Checkpoint(path).status()["done"]
+
+
+def test_crawl_restarts_on_expired_token(server, tmp_path):
+    """an expired token restarts the crawl without duplicating records"""
+    path = str(tmp_path / "meetings.json")
+
+    with Client(server.config()) as zoom:
+        crawl(zoom, Checkpoint(path), stop_after=350)
+        server.state.failures["metrics/meetings"] = [
+            (
+                400,
+                {"code": 300, "message": "The next page token is invalid or expired."},
+            )
+        ]
+        meetings = crawl(zoom, Checkpoint(path))
+
+        assert [x["uuid"] for x in meetings] == [f"m{i}" for i in range(1000)]
+
+        # abandoning starts from the beginning
+        assert len(crawl(zoom, Checkpoint(path), stop_after=10, resume=False)) == 10
+        assert Checkpoint(path).status()["records"] == 300
@@ -10,7 +10,7 @@ def fixture_client_config():
     test_config = {
         "root_request_url": "",
         "api_key": "",
-        "api_secret": "",
+        "api_secret": "secret",
         "data_type": "",
     }
 
@@ -42,3 +42,15 @@ def test_client_generate_jwt(client):
     assert "Content-type" in jwt_token.keys()
     assert "Bearer " in jwt_token["Authorization"]
     assert jwt_token["Content-type"] == "application/json"
+
+
+def test_client_generate_jwt_is_cached(client):
+    """auth headers are reused until the token nears expiry"""
+
+    first = client.generate_jwt()
+
+    assert client.generate_jwt() is first
+
+    client.auth.invalidate()
+
+    assert client.generate_jwt() is not first
@@ -0,0 +1,108 @@
+""" pytest tests for zoom_client export sinks """
+
+import csv
+import gzip
+import json
+import os
+
+import pytest
+from tests.mock_zoom import MockZoomServer, MockZoomState
+from zoom_client.client import Client
+from zoom_client.export import PARTICIPANT_FIELDS, CSVSink, NDJSONSink, tag_records
+
+RECORDS = [
+    {"id": f"p{i}", "user_name": f"participant {i}", "location": {"city": "Boulder"}}
+    for i in range(2000)
+]
+
+
+def test_ndjson_rotation_and_compression(tmp_path):
+    """records are split over compressed files published when complete"""
+    path = str(tmp_path / "participants.ndjson")
+
+    with NDJSONSink(path, max_bytes=4096, compression="gzip") as sink:
+        assert sink.write_all(iter(RECORDS)) == 2000
+
+    assert len(sink.paths) > 1
+    assert sink.paths[0].endswith("participants-00001.ndjson.gz")
+    assert not [x for x in os.listdir(tmp_path) if x.endswith(".part")]
+
+    records = []
+    for file_path in sink.paths:
+        with gzip.open(file_path, "rt", encoding="utf-8") as export_file:
+            records += [json.loads(line) for line in export_file]
+
+    assert records == RECORDS
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+def test_compressed_rotation_size(tmp_path, compression):
+    """compressed files rotate near max_bytes without flushing each record"""
+    records = RECORDS * 5
+    with NDJSONSink(str(tmp_path / "single.ndjson"), compression=compression) as sink:
+        sink.write_all(records)
+    single = os.path.getsize(sink.paths[0])
+
+    path = str(tmp_path / "participants.ndjson")
+    with NDJSONSink(path, max_bytes=4096, compression=compression) as sink:
+        sink.write_all(records)
+    sizes = [os.path.getsize(x) for x in sink.paths]
+
+    assert len(sizes) > 1
+    assert max(sizes) < 2 * 4096
+    if compression == "gzip":
+        # compressing without sync flushes, rotation only adds file headers
+        assert sum(sizes) < single * 1.25
+
+
+def test_csv_stable_schema(tmp_path):
+    """every csv file has the same header and nested values are json encoded"""
+    path = str(tmp_path / "participants.csv")
+
+    with CSVSink(path, PARTICIPANT_FIELDS, max_bytes=8192) as sink:
+        sink.write_all(tag_records(RECORDS, meeting_uuid="m1"))
+
+    rows = []
+    for file_path in sink.paths:
+        with open(file_path, encoding="utf-8", newline="") as export_file:
+            reader = csv.reader(export_file)
+            assert tuple(next(reader)) == PARTICIPANT_FIELDS
+            rows += list(reader)
+
+    assert len(rows) == 2000
+    assert rows[0][:4] == ["m1", "p0", "", "participant 0"]
+    assert rows[0][PARTICIPANT_FIELDS.index("location")] == '{"city":"Boulder"}'
+
+
+def test_failed_export_is_not_published(tmp_path):
+    """an unfinished file is discarded when the export fails"""
+    path = str(tmp_path / "meetings.ndjson")
+
+    with pytest.raises(RuntimeError):
+        with NDJSONSink(path) as sink:
+            sink.write({"uuid": "m1"})
+            raise RuntimeError("crawl failed")
+
+    assert not os.listdir(tmp_path)
+
+
+def test_dashboard_export(tmp_path):
+    """meetings and participants stream from the api into export files"""
+    with MockZoomServer(MockZoomState(meetings=20, participants=30)) as server:
+        with Client(server.config()) as zoom:
+            with NDJSONSink(str(tmp_path / "meetings.ndjson")) as meetings:
+                count = zoom.dashboard.export_past_meetings(
+                    "2021-01-01", "2021-01-31", meetings
+                )
+            with CSVSink(
+                str(tmp_path / "participants.csv"),
+                PARTICIPANT_FIELDS,
+                compression="gzip",
+            ) as participants:
+                bulk = zoom.dashboard.export_meeting_participants(
+                    [f"m{i}" for i in range(20)], participants
+                )
+
+    assert count == 20
+    assert participants.records == 600
+    assert not bulk.failed
@@ -0,0 +1,28 @@
+""" pytest tests for zoom_client group membership sync """
+
+from tests.mock_zoom import MockZoomServer
+from zoom_client.client import Client
+
+
+def test_sync_members_only_sends_differences():
+    """only missing members are added and extra members removed"""
+    with MockZoomServer() as server:
+        server.state.groups["g1"] = [
+            {"id": f"id{i}", "email": f"user{i}@example.edu"} for i in range(100)
+        ]
+        desired = [f"USER{i}@example.edu" for i in range(50, 175)]
+
+        with Client(server.config()) as zoom:
+            report = zoom.group.sync_members("g1", desired, max_workers=4)
+            members = {x["email"] for x in zoom.group.iter_members("g1")}
+
+    methods = [x[0] for x in server.state.requests]
+
+    assert report["unchanged"] == 50
+    assert len(report["added"]) == 75
+    assert len(report["removed"]) == 50
+    assert not report["failed"]
+    assert set(report["timings"]) == {"list", "add", "remove"}
+    assert methods.count("POST") == 3
+    assert methods.count("DELETE") == 50
+    assert members == {x.lower() for x in desired}
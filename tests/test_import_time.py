@@ -0,0 +1,71 @@
+""" pytest tests for zoom_client import time """
+
+import json
+import os
+import subprocess  # nosec B404
+import sys
+
+# seconds allowed to import zoom_client and build a Client from a cold start,
+# generous by default (a cold start takes around 0.02s) so slow machines pass
+IMPORT_BUDGET = float(os.environ.get("ZOOM_CLIENT_IMPORT_BUDGET", "0.5"))
+
+# dependencies only imported once a request needs them
+HEAVY_MODULES = ("requests", "urllib3", "jwt", "aiohttp", "sqlite3")
+
+COLD_START = f"""
+import json, sys, time
+start = time.perf_counter()
+import zoom_client
+zoom = zoom_client.Client({{"api_key": "key", "api_secret": "secret"}})
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "elapsed": elapsed,
+    "loaded": [x for x in {HEAVY_MODULES!r} if x in sys.modules],
+    "modules": sorted(x for x in sys.modules if x.startswith("zoom_client.modules")),
+    "recursion_limit": sys.getrecursionlimit(),
+}}))
+"""
+
+
+def cold_start():
+    """import zoom_client in a fresh interpreter and report what it cost"""
+    output = subprocess.run(  # nosec B603
+        [sys.executable, "-c", COLD_START],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    return json.loads(output)
+
+
+def test_import_is_lazy():
+    """heavy dependencies and api modules are not imported up front"""
+    result = cold_start()
+
+    assert not result["loaded"]
+    assert not result["modules"]
+    assert result["recursion_limit"] == 1000
+
+
+def test_import_time_budget():
+    """the best of a few cold starts stays within the import budget"""
+    elapsed = min(cold_start()["elapsed"] for _ in range(3))
+
+    assert elapsed < IMPORT_BUDGET, f"cold start took {elapsed:.3f}s"
+
+
+def test_async_dashboard_leaves_requests_unloaded():
+    """the dashboard module (shared with AsyncClient) doesn't import requests"""
+    output = subprocess.run(  # nosec B603
+        [
+            sys.executable,
+            "-c",
+            "import sys, zoom_client.modules.dashboard; print('requests' in sys.modules)",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    assert output.strip() == "False"
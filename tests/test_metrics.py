@@ -0,0 +1,76 @@
+""" pytest tests for zoom_client request metrics """
+
+from types import SimpleNamespace
+
+from tests.mock_zoom import MockZoomServer, MockZoomState
+from zoom_client.client import Client
+from zoom_client.metrics import RequestMetrics, endpoint_template
+
+
+def test_endpoint_template():
+    """record ids are replaced so requests group by endpoint"""
+    assert endpoint_template("users") == "users"
+    assert endpoint_template("users/abc") == "users/{id}"
+    assert endpoint_template("groups/g1/members/m1") == "groups/{id}/members/{id}"
+    assert endpoint_template("metrics/meetings") == "metrics/meetings"
+    assert (
+        endpoint_template("metrics/meetings/abc==/participants")
+        == "metrics/meetings/{id}/participants"
+    )
+
+
+def test_metrics_and_hooks():
+    """each attempt is recorded per endpoint and passed to the hooks"""
+    state = MockZoomState(users=40)
+    state.failures["users/u1"] = [(429, {"code": 429, "message": "slow down"})]
+
+    with MockZoomServer(state) as server:
+        with Client(server.config(retry={"backoff_factor": 0})) as zoom:
+            seen = []
+            zoom.request_hooks.append(lambda info: seen.append(info["endpoint"]))
+
+            zoom.users.get_current_users()
+            zoom.do_request("get", "users/u1", {})
+            zoom.do_request("get", "users/u2", {})
+
+            snapshot = zoom.metrics.snapshot()
+            exposition = zoom.metrics.to_prometheus()
+
+    users = snapshot["endpoints"]["GET users"]
+    user = snapshot["endpoints"]["GET users/{id}"]
+
+    assert seen == ["users", "users/{id}", "users/{id}", "users/{id}"]
+    assert users["requests"] == 1
+    assert users["statuses"] == {200: 1}
+    assert users["response_bytes"] > 0
+    assert sum(users["latency_buckets"].values()) == 1
+    assert user["statuses"] == {429: 1, 200: 2}
+    assert user["retries"] == 1
+    assert 'zoom_client_retries_total{method="GET",endpoint="users/{id}"} 1' in (
+        exposition
+    )
+    assert (
+        'zoom_client_request_duration_seconds_count{method="GET",endpoint="users"} 1'
+        in exposition
+    )
+
+
+def test_malformed_remaining_header():
+    """a malformed X-RateLimit-Remaining header is skipped"""
+    metrics = RequestMetrics()
+    info = {"method": "get", "endpoint": "users", "category": "medium", "attempt": 0}
+
+    for remaining in ("12", "n/a", ""):
+        metrics.on_response(
+            info,
+            SimpleNamespace(
+                status_code=200,
+                headers={"X-RateLimit-Remaining": remaining, "Content-Length": "2"},
+            ),
+            0.01,
+        )
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["remaining"] == {"medium": 12}
+    assert snapshot["endpoints"]["GET users"]["requests"] == 3
@@ -0,0 +1,151 @@
+""" pytest tests for zoom_client pagination generators """
+
+import pytest
+import requests
+from zoom_client.client import Client
+from zoom_client.exceptions import ZoomAPIError
+from zoom_client.modules.dashboard import Dashboard
+from zoom_client.pagination import iter_unique
+
+
+pytestmark = pytest.mark.zoom_state(users=901, meetings=650, participants=301)
+
+
+def test_iter_users_streams_pages(server):
+    """users are yielded page by page without recursion"""
+    with Client(server.config()) as zoom:
+        users = zoom.users.iter_users(page_size=100)
+
+        assert next(users)["id"] == "u0"
+        assert len(server.state.requests) == 1
+
+        assert len(list(users)) == 900
+        assert len(server.state.requests) == 10
+
+        # repeated calls no longer accumulate into a shared default list
+        assert len(zoom.users.get_current_users()) == 901
+        assert len(zoom.users.get_current_users()) == 901
+
+
+def test_dashboard_generators(server):
+    """meetings and participants follow next_page_token chains"""
+    with Client(server.config()) as zoom:
+        meetings = zoom.dashboard.get_past_meetings("2021-01-01", "2021-01-31")
+        participants = list(zoom.dashboard.iter_meeting_participants("m1"))
+
+    assert len(meetings) == 650
+    assert len({meeting["uuid"] for meeting in meetings}) == 650
+    assert len(participants) == 301
+
+
+def test_pagination_errors(server):
+    """generators raise api errors while list methods keep reporting them inline"""
+    with Client(server.config()) as zoom:
+        with pytest.raises(ZoomAPIError) as error:
+            list(zoom.dashboard.iter_meeting_participants("unknown"))
+
+        assert error.value.code == 3001
+        assert zoom.dashboard.get_past_meeting_participants("unknown") == [
+            {"error_code": 3001, "error": "Meeting does not exist"}
+        ]
+
+
+def test_iter_users_concurrent_pages(server):
+    """remaining pages are fetched concurrently and yielded in page order"""
+    with Client(server.config()) as zoom:
+        users = list(zoom.users.iter_users(page_size=100, max_workers=4))
+
+    assert [user["id"] for user in users] == [f"u{i}" for i in range(901)]
+    assert sorted(int(x[2]["page_number"]) for x in server.state.requests) == list(
+        range(1, 11)
+    )
+
+
+def test_iter_unique():
+    """records shifted onto a later page are only yielded once"""
+    records = [{"id": "a"}, {"id": "b"}, {"id": "b"}, {"id": "c"}]
+
+    assert [x["id"] for x in iter_unique(records)] == ["a", "b", "c"]
+
+
+def test_sharded_past_meetings(server):
+    """date shards are crawled concurrently, retried alone and deduplicated"""
+    server.state.failures["metrics/meetings"] = [
+        (400, {"code": 300, "message": "Temporary failure"})
+    ]
+
+    with Client(server.config()) as zoom:
+        meetings = zoom.dashboard.get_past_meetings(
+            "2021-01-01", "2021-01-31", shard_days=1, max_workers=4
+        )
+
+    listing_requests = [x for x in server.state.requests if x[1] == "metrics/meetings"]
+
+    assert len(listing_requests) == 32
+    assert len(meetings) == 650
+    assert len({meeting["uuid"] for meeting in meetings}) == 650
+
+
+def test_sharded_past_meetings_transport_errors(server, monkeypatch):
+    """a shard whose request fails in the transport is retried alone"""
+    with Client(server.config()) as zoom:
+        send = zoom.transport.request
+        failures = [requests.Timeout("read timed out")]
+
+        def request(method, url, **kwargs):
+            if "2021-01-05" in kwargs["params"].values() and failures:
+                raise failures.pop()
+            return send(method, url, **kwargs)
+
+        monkeypatch.setattr(zoom.transport, "request", request)
+        meetings = zoom.dashboard.get_past_meetings(
+            "2021-01-01", "2021-01-10", shard_days=1, max_workers=4
+        )
+
+    assert not failures
+    assert len({meeting["uuid"] for meeting in meetings}) == len(meetings)
+    assert {meeting["start_time"][:10] for meeting in meetings} >= {"2021-01-05"}
+
+
+def test_date_shards():
+    """date ranges are split into consecutive shards"""
+    assert Dashboard.date_shards("2021-01-30", "2021-02-03", shard_days=2) == [
+        ("2021-01-30", "2021-01-31"),
+        ("2021-02-01", "2021-02-02"),
+        ("2021-02-03", "2021-02-03"),
+    ]
+
+
+def test_bulk_participants(server):
+    """participants of many meetings stream with failures reported separately"""
+    meeting_uuids = [f"m{i}" for i in range(40)] + ["unknown"]
+
+    with Client(server.config()) as zoom:
+        bulk = zoom.dashboard.iter_participants_bulk(meeting_uuids, max_workers=4)
+        results = list(bulk)
+
+    assert len(results) == 40 * 301
+    assert {meeting_uuid for meeting_uuid, _ in results} == set(meeting_uuids[:-1])
+    assert list(bulk.failed) == ["unknown"]
+    assert bulk.failed["unknown"].code == 3001
+
+
+def test_bulk_participants_transport_errors(server, monkeypatch):
+    """meetings whose requests fail in the transport are reported as failed"""
+    with Client(server.config()) as zoom:
+        send = zoom.transport.request
+
+        def request(method, url, **kwargs):
+            if "meetings/m3/" in url:
+                raise requests.ConnectionError("connection reset")
+            return send(method, url, **kwargs)
+
+        monkeypatch.setattr(zoom.transport, "request", request)
+        bulk = zoom.dashboard.iter_participants_bulk(
+            [f"m{i}" for i in range(6)], max_workers=2
+        )
+        results = list(bulk)
+
+    assert len(results) == 5 * 301
+    assert list(bulk.failed) == ["m3"]
+    assert isinstance(bulk.failed["m3"], requests.ConnectionError)
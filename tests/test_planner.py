@@ -0,0 +1,124 @@
+""" pytest tests for zoom_client request cost planner and dry runs """
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from zoom_client.client import Client
+from zoom_client.planner import RequestPlanner, dry_run_requests
+
+DRY_RUN_CONFIG = {
+    "root_request_url": "https://api.zoom.us/v2/",
+    "api_key": "key",
+    "api_secret": "secret",
+    "data_type": "JSON",
+    "dry_run": True,
+}
+
+
+@pytest.fixture(name="zoom")
+def fixture_zoom():
+    """fixture dry run client"""
+    with Client(DRY_RUN_CONFIG) as client:
+        yield client
+
+
+def test_dry_run_records_requests(zoom):
+    """requests are recorded with their parameters and answered, not sent"""
+    report = zoom.users.batch_delete_users(["u1", "u2"])
+    meetings = zoom.dashboard.get_past_meetings("2021-01-01", "2021-01-31")
+
+    assert report.succeeded == 2
+    assert meetings == []
+    assert sorted(dry_run_requests(zoom)) == [
+        ("delete", "users/u1"),
+        ("delete", "users/u2"),
+        ("get", "metrics/meetings"),
+    ]
+    assert zoom.transport.requests[0]["params"] == {"action": "delete"}
+
+
+@pytest.mark.parametrize(
+    "operation, items",
+    [
+        ("batch_delete_users", [f"u{i}" for i in range(50)]),
+        ("batch_update_users", [f"u{i}" for i in range(50)]),
+        ("add_members", [f"user{i}@example.edu" for i in range(65)]),
+        ("delete_members", [f"u{i}" for i in range(65)]),
+    ],
+)
+def test_plan_matches_dry_run(zoom, operation, items):
+    """the requests planned are exactly those a dry run makes"""
+    if operation.startswith("batch"):
+        getattr(zoom.users, operation)(items)
+        plan = RequestPlanner().plan(operation, items)
+    else:
+        getattr(zoom.group, operation)("g1", items)
+        plan = RequestPlanner().plan(operation, items, group_id="g1")
+
+    assert sorted(plan.requests) == sorted(dry_run_requests(zoom))
+
+
+def test_projected_schedule():
+    """rate limit pacing and latency over the workers bound the duration"""
+    planner = RequestPlanner(latency=0.25, max_workers=8)
+    start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+
+    deletes = planner.plan("batch_delete_users", [f"u{i}" for i in range(1000)])
+    schedule = deletes.schedule(start)
+
+    # 990 requests beyond the burst of 10 at 10 per second
+    assert schedule["categories"] == {"light": {"requests": 1000, "pacing": 99.0}}
+    assert schedule["duration"] == 99.0
+    assert deletes.completion(start) == start + timedelta(seconds=99)
+
+    # a month of 300 meetings a day is 31 resource intensive pages
+    meetings = planner.plan_past_meetings("2021-01-01", "2021-01-31")
+    assert meetings.counts() == {"resource_intensive": 31}
+    assert meetings.duration() == pytest.approx((31 - 19) * 65 / 19)
+
+    participants = planner.plan(
+        "iter_participants_bulk", ["m1", "m2"], participants_per_meeting=301
+    )
+    assert participants.counts() == {"heavy": 4}
+
+
+def test_rebalance_splits_into_windows():
+    """items are split into windows each projected within the budget"""
+    planner = RequestPlanner()
+    user_ids = [f"u{i}" for i in range(1000)]
+
+    windows = planner.rebalance(planner.plan("batch_delete_users", user_ids), 30)
+
+    assert [len(x.items) for x in windows] == [310, 310, 310, 70]
+    assert [x for window in windows for x in window.items] == user_ids
+    assert all(x.duration() <= 30 for x in windows)
+
+    days = planner.rebalance(planner.plan_past_meetings("2021-01-01", "2021-01-31"), 20)
+    assert [(x.items[0], x.items[-1]) for x in days] == [
+        ("2021-01-01", "2021-01-24"),
+        ("2021-01-25", "2021-01-31"),
+    ]
+
+
+def test_rebalance_adds_workers():
+    """latency bound operations get more workers before being split"""
+    planner = RequestPlanner({"light": (1000, 1)}, latency=0.25)
+    plan = planner.plan("batch_delete_users", [f"u{i}" for i in range(1000)])
+
+    assert plan.duration() == 31.25
+    assert len(planner.rebalance(plan, 10)) == 4
+
+    windows = planner.rebalance(plan, 10, max_workers=32)
+    assert len(windows) == 1
+    assert windows[0].max_workers == 25
+
+
+def test_planner_from_client():
+    """a client's adapted rate limits are planned with"""
+    with Client(dict(DRY_RUN_CONFIG, rate_limits={"medium": [30, 1]})) as zoom:
+        zoom.scheduler.buckets["light"].set_rate(20, 1)
+        planner = RequestPlanner.from_client(zoom, latency=0.1)
+
+    assert planner.limits["medium"] == (30, 1)
+    assert planner.limits["light"] == (20, 1)
+    assert planner.latency == 0.1
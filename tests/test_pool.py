@@ -0,0 +1,90 @@
+""" pytest tests for zoom_client client pool """
+
+import pickle
+
+import pytest
+from tests.mock_zoom import MockZoomServer, MockZoomState
+from zoom_client.exceptions import ZoomAPIError
+from zoom_client.pool import ClientPool
+
+
+@pytest.fixture(name="servers")
+def fixture_servers():
+    """fixture mock zoom api servers of two accounts"""
+    with MockZoomServer(MockZoomState(users=3)) as east:
+        with MockZoomServer(MockZoomState(users=5)) as west:
+            yield {"east": east, "west": west}
+
+
+def fail_for_west(client):
+    """job failing for one of the accounts"""
+    if client.config_data["api_key"] == "west":
+        raise ZoomAPIError(124, "Invalid access token.", status_code=401)
+
+    return client.config_data["api_key"]
+
+
+def test_accounts_have_own_clients(servers):
+    """each account gets its own rate budget and connection pool"""
+    with ClientPool({x: y.config() for x, y in servers.items()}) as pool:
+        east, west = pool.client("east"), pool.client("west")
+
+        assert pool.client("east") is east
+        assert east.scheduler is not west.scheduler
+        assert east.transport is not west.transport
+
+
+def test_from_config_shares_keys():
+    """account keys override the keys shared by every account"""
+    pool = ClientPool.from_config(
+        {
+            "api_secret": "secret",
+            "data_type": "JSON",
+            "accounts": {"east": {"api_key": "east"}, "west": {"api_key": "west"}},
+        }
+    )
+
+    assert pool.accounts["west"] == {
+        "api_key": "west",
+        "api_secret": "secret",
+        "data_type": "JSON",
+    }
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_run_merges_tagged_records(servers, processes):
+    """records of every account are merged and tagged with the account"""
+    with ClientPool(
+        {x: y.config() for x, y in servers.items()}, processes=processes
+    ) as pool:
+        result = pool.run("users.iter_users")
+
+    assert not result.failed
+    assert [len(x) for _, x in result] == [3, 5]
+    records = result.records()
+    assert [x["account"] for x in records] == ["east"] * 3 + ["west"] * 5
+    assert records[0]["id"] == "u0"
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_failed_accounts_are_reported(processes):
+    """a job raising for one account does not stop the others"""
+    with ClientPool(
+        {
+            "east": {"api_key": "east", "api_secret": "secret"},
+            "west": {"api_key": "west", "api_secret": "secret"},
+        },
+        processes=processes,
+    ) as pool:
+        result = pool.run(fail_for_west)
+
+    assert result.results == {"east": "east"}
+    assert result.failed["west"].code == 124
+    assert result.failed["west"].status_code == 401
+
+
+def test_zoom_api_error_pickles():
+    """errors keep their details when sent back from worker processes"""
+    error = pickle.loads(pickle.dumps(ZoomAPIError(300, "Invalid", status_code=400)))
+
+    assert (error.code, error.message, error.status_code) == (300, "Invalid", 400)
@@ -0,0 +1,61 @@
+""" pytest tests for zoom_client daily report ranges """
+
+from datetime import date
+
+from tests.mock_zoom import MockZoomServer
+from zoom_client.client import Client
+from zoom_client.daily_report import DailySeries, month_is_closed, months_between
+
+
+def test_months_between_and_closed_months():
+    """ranges are split into months, which close two days after they end"""
+    assert months_between(date(2020, 11, 15), date(2021, 2, 1)) == [
+        (2020, 11),
+        (2020, 12),
+        (2021, 1),
+        (2021, 2),
+    ]
+    assert not month_is_closed(2021, 1, today=date(2021, 2, 1))
+    assert month_is_closed(2021, 1, today=date(2021, 2, 2))
+    assert month_is_closed(2020, 12, today=date(2021, 1, 2))
+
+
+def test_daily_report_range():
+    """months are merged into one series and closed months requested once"""
+    with MockZoomServer() as server:
+        with Client(server.config()) as zoom:
+            series = zoom.report.get_daily_report_range("2020-12-30", "2021-02-02")
+            again = zoom.report.get_daily_report_range("2021-01-01", "2021-01-31")
+
+    requests = [x for x in server.state.requests if x[1] == "report/daily"]
+
+    assert len(series) == 35
+    assert series.get("2021-01-02") == {
+        "date": "2021-01-02",
+        "new_users": 2,
+        "meetings": 2,
+        "participants": 6,
+        "meeting_minutes": 60,
+    }
+    assert series.get("2021-02-03") is None
+    assert len(requests) == 3
+    assert again.totals()["meetings"] == sum(range(1, 32))
+    assert [x["meetings"] for x in series.monthly()] == [30 + 31, 496, 3]
+
+
+def test_daily_series_rollups():
+    """weekly rollups sum each iso week"""
+    series = DailySeries(
+        {"date": f"2021-01-{day:02d}", "meetings": 1, "participants": day}
+        for day in range(1, 15)
+    )
+
+    weekly = series.weekly()
+
+    assert [x["period"] for x in weekly] == ["2020-W53", "2021-W01", "2021-W02"]
+    assert [x["meetings"] for x in weekly] == [3, 7, 4]
+    assert weekly[1]["start"] == "2021-01-04"
+    assert [x["date"] for x in series.between(date(2021, 1, 13), date(2021, 2, 1))] == [
+        "2021-01-13",
+        "2021-01-14",
+    ]
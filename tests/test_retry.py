@@ -0,0 +1,85 @@
+""" pytest tests for zoom_client retry policy """
+
+import pytest
+from tests.conftest import FakeResponse, FakeTransport
+from tests.mock_zoom import MockZoomServer, MockZoomState
+from zoom_client.client import Client
+from zoom_client.retry import RetryPolicy
+
+
+@pytest.fixture(name="client_config")
+def fixture_client_config():
+    """fixture config for testing"""
+    return {
+        "root_request_url": "",
+        "api_key": "key",
+        "api_secret": "secret",
+        "data_type": "",
+        "retry": {"backoff_factor": 0},
+    }
+
+
+def test_retry_after_is_honored(client_config):
+    """throttled GET requests are retried and the retries are reported"""
+    transport = FakeTransport(
+        [
+            FakeResponse(429, {"Retry-After": "0"}),
+            FakeResponse(503),
+            FakeResponse(200, payload={"users": []}),
+        ]
+    )
+    zoom = Client(client_config, transport=transport)
+
+    rsp = zoom.send("get", "users", {})
+
+    assert rsp.status_code == 200
+    assert rsp.attempts == 3
+    assert len(transport.requests) == 3
+    assert zoom.retry_stats.snapshot()["retries"] == 2
+
+
+def test_patch_is_not_retried_by_default(client_config):
+    """non-idempotent requests are only retried when opted into"""
+    transport = FakeTransport([FakeResponse(503), FakeResponse(204)])
+    zoom = Client(client_config, transport=transport)
+
+    assert zoom.send("patch", "users/abc", "", body="{}").status_code == 503
+
+    zoom.retry_policy = RetryPolicy(backoff_factor=0, methods=("get", "patch"))
+    transport.responses = [FakeResponse(503), FakeResponse(204)]
+
+    assert zoom.send("patch", "users/abc", "", body="{}").status_code == 204
+
+
+def test_long_retry_after_is_returned():
+    """waits beyond max_retry_after (such as daily limits) are not slept through"""
+    policy = RetryPolicy(max_retry_after=10)
+
+    assert not policy.should_retry("get", 429, 0, retry_after=3600)
+    assert policy.should_retry("get", 429, 0, retry_after=5)
+    assert policy.backoff(0, retry_after=5) == 5
+    assert 0 <= policy.backoff(3) <= 4
+
+
+def test_long_retry_after_does_not_block_later_requests(client_config):
+    """a daily limit is returned to the caller without pausing its category"""
+    client_config["retry"]["max_retry_after"] = 1
+    transport = FakeTransport([FakeResponse(429, {"Retry-After": "7200"})])
+    zoom = Client(client_config, transport=transport)
+
+    assert zoom.send("delete", "users/abc", {}).status_code == 429
+    assert zoom.scheduler.reserve("light") < 2
+
+
+def test_throttled_server_is_retried():
+    """429 responses with Retry-After from the server are waited out and retried"""
+    state = MockZoomState(users=650, throttle_every=3)
+    state.retry_after = 0
+
+    with MockZoomServer(state) as server:
+        with Client(server.config()) as zoom:
+            users = zoom.users.get_current_users()
+
+    assert len(users) == 650
+    assert zoom.retry_stats.snapshot()["retries"] == 1
+    assert [x[1] for x in state.requests].count("users") == 4
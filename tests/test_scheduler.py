@@ -0,0 +1,75 @@
+""" pytest tests for zoom_client rate limit scheduler """
+
+import pytest
+from zoom_client import scheduler
+from zoom_client.scheduler import RateLimitScheduler, TokenBucket
+
+
+@pytest.mark.parametrize(
+    "request_type,resource,category",
+    [
+        ("get", "users", scheduler.MEDIUM),
+        ("get", "users/abc", scheduler.LIGHT),
+        ("patch", "users/abc", scheduler.LIGHT),
+        ("post", "groups/abc/members", scheduler.MEDIUM),
+        ("delete", "groups/abc/members/def", scheduler.LIGHT),
+        ("get", "report/daily", scheduler.HEAVY),
+        ("get", "metrics/meetings", scheduler.RESOURCE_INTENSIVE),
+        ("get", "metrics/meetings/abc/participants", scheduler.HEAVY),
+    ],
+)
+def test_classify(request_type, resource, category):
+    """requests are keyed by zoom rate limit category"""
+    assert scheduler.classify(request_type, resource) == category
+
+
+def test_parse_retry_after():
+    """Retry-After values are parsed as seconds or dates"""
+    assert scheduler.parse_retry_after("2") == 2.0
+    assert scheduler.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert scheduler.parse_retry_after("2015-10-21T07:28:00Z") == 0.0
+    assert scheduler.parse_retry_after("soon") is None
+
+
+def test_token_bucket_waits_once_empty():
+    """callers beyond the bucket capacity are queued in order"""
+    bucket = TokenBucket(2, 1)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5, abs=0.05)
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+
+
+def test_scheduler_adapts_from_headers():
+    """QPS limits reported by zoom change the pace and 429 pauses the category"""
+    rate_limits = RateLimitScheduler()
+
+    rate_limits.update(
+        scheduler.LIGHT,
+        {"X-RateLimit-Type": "QPS", "X-RateLimit-Limit": "30"},
+        200,
+    )
+    assert rate_limits.buckets[scheduler.LIGHT].rate == 30
+
+    # malformed limits are ignored rather than raised
+    for limit in ("n/a", "", "0", "nan"):
+        rate_limits.update(
+            scheduler.LIGHT,
+            {"X-RateLimit-Type": "QPS", "X-RateLimit-Limit": limit},
+            200,
+        )
+    assert rate_limits.buckets[scheduler.LIGHT].rate == 30
+
+    rate_limits.update(scheduler.HEAVY, {"Retry-After": "3"}, 429)
+    assert rate_limits.reserve(scheduler.HEAVY) == pytest.approx(3 + 5 / 39, abs=0.1)
+    assert rate_limits.reserve(scheduler.MEDIUM) == 0
+
+
+def test_long_retry_after_pause_is_capped():
+    """waits beyond max_pause (such as daily limits) don't hold back the category"""
+    rate_limits = RateLimitScheduler()
+
+    rate_limits.update(scheduler.LIGHT, {"Retry-After": "7200"}, 429, max_pause=5)
+
+    assert rate_limits.reserve(scheduler.LIGHT) == pytest.approx(5, abs=0.1)
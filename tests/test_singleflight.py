@@ -0,0 +1,127 @@
+""" pytest tests for zoom_client single-flight requests and memo """
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.conftest import FakeResponse, FakeTransport
+from tests.mock_zoom import MockZoomServer, MockZoomState
+from zoom_client.client import Client
+from zoom_client.singleflight import MemoCache
+
+
+def user_requests(state, user_id):
+    """number of GET requests the server received for a user"""
+    return state.requests.count(("GET", "users/" + user_id, {"userId": user_id}))
+
+
+def test_concurrent_gets_share_one_request():
+    """identical GETs in flight together cost one request"""
+    state = MockZoomState(users=5, latency=0.2)
+
+    with MockZoomServer(state) as server:
+        with Client(server.config()) as zoom:
+            with ThreadPoolExecutor(8) as executor:
+                results = list(
+                    executor.map(
+                        lambda _: zoom.do_request("get", "users/u1", {"userId": "u1"}),
+                        range(8),
+                    )
+                )
+
+    assert user_requests(state, "u1") == 1
+    assert all(
+        result == {"id": "u1", "email": "user1@example.edu", "type": 2}
+        for result in results
+    )
+    # every caller receives its own decoded result
+    assert len({id(result) for result in results}) == 8
+
+
+class SlowUserTransport(FakeTransport):
+    """transport holding the first GET until released, PATCH changes the email"""
+
+    def __init__(self):
+        super().__init__()
+        self.email = "old"
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def request(self, method, url, params=None, data=None, headers=None, stream=False):
+        self.requests.append((method, url, params, data))
+        if method == "patch":
+            self.email = "new"
+            return FakeResponse(204)
+
+        email = self.email
+        if not self.started.is_set():
+            self.started.set()
+            self.release.wait(5)
+
+        return FakeResponse(200, payload={"id": "u1", "email": email})
+
+
+def test_get_after_write_does_not_join_earlier_get():
+    """a GET started after a write is not answered by a GET from before it"""
+    transport = SlowUserTransport()
+    config = {"root_request_url": "", "api_key": "key", "api_secret": "secret"}
+
+    with Client(config, transport=transport) as zoom:
+        with ThreadPoolExecutor(2) as executor:
+            before = executor.submit(zoom.do_request, "get", "users/u1", {})
+            transport.started.wait(5)
+
+            zoom.do_request("patch", "users/u1", {}, body="{}")
+            after = executor.submit(zoom.do_request, "get", "users/u1", {})
+            time.sleep(0.2)
+            transport.release.set()
+
+            assert before.result()["email"] == "old"
+            assert after.result()["email"] == "new"
+
+    assert [x[0] for x in transport.requests] == ["get", "patch", "get"]
+
+
+def test_memo_is_invalidated_by_writes():
+    """memoized responses are reused until the user is changed"""
+    state = MockZoomState(users=5)
+
+    with MockZoomServer(state) as server:
+        with Client(server.config(memo_ttl=60)) as zoom:
+            users = zoom.users.get_users_from_list(["u1", "u2", "u1"])
+            users[0]["email"] = "changed"
+            repeat = users[2]["email"]
+            again = zoom.users.get_users_from_list(["u1"])
+
+            zoom.users.update_user("u1")
+            zoom.users.get_users_from_list(["u1", "u2"])
+
+            stats = zoom.memo.stats()
+
+    assert again[0]["email"] == "user1@example.edu"
+    # repeated ids are copies of one another, not one shared dictionary
+    assert repeat == "user1@example.edu"
+    assert user_requests(state, "u1") == 2
+    assert user_requests(state, "u2") == 1
+    assert stats["hits"] == 2
+
+
+def test_memo_size_and_invalidation_scope():
+    """the least recently used responses are evicted and writes drop their
+    resource, sub-resources and parent listing"""
+    memo = MemoCache(ttl=60, max_size=3)
+
+    for resource in ("users", "users/a", "users/b", "groups/g/members"):
+        memo.set(resource, resource, resource, memo.generation)
+
+    assert memo.get("users") is None
+    assert memo.get("users/a") == "users/a"
+
+    generation = memo.generation
+    memo.invalidate("users/a")
+    memo.set("users", "users", "stale", generation)
+
+    assert memo.get("users/a") is None
+    assert memo.get("users") is None
+    assert memo.get("users/b") == "users/b"
+    assert memo.get("groups/g/members") == "groups/g/members"
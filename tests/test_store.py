@@ -0,0 +1,49 @@
+""" pytest tests for zoom_client user store """
+
+import pytest
+from zoom_client.client import Client
+from zoom_client.store import UserStore
+
+
+pytestmark = pytest.mark.zoom_state(users=120)
+
+
+def test_user_store_incremental_sync(server, tmp_path):
+    """only added, changed and removed users are reconciled and persisted"""
+    path = str(tmp_path / "users.json")
+
+    with Client(server.config()) as zoom:
+        first = zoom.users.sync_store(UserStore(path))
+
+        server.state.users[0]["type"] = 2
+        del server.state.users[1]
+        server.state.users.append({"id": "new", "email": "New@example.edu", "type": 1})
+
+        store = UserStore(path)
+        second = zoom.users.sync_store(store)
+
+        # users removed since are dropped when refreshed individually
+        server.state.users.pop()
+        third = zoom.users.refresh_store_users(store, ["new", "u0"])
+
+    assert len(first.added) == 120
+    assert second.as_dict() == {"added": ["new"], "changed": ["u0"], "removed": ["u1"]}
+    assert third.as_dict() == {"added": [], "changed": [], "removed": ["new"]}
+    assert len(UserStore(path)) == 119
+
+
+def test_user_store_indexes():
+    """users are found by id, email, type and group"""
+    store = UserStore()
+    store.reconcile(
+        [
+            {"id": "a", "email": "A@example.edu", "type": 1, "group_ids": ["g1"]},
+            {"id": "b", "email": "b@example.edu", "type": 2, "group_ids": ["g1"]},
+        ]
+    )
+    store.upsert({"id": "b", "email": "c@example.edu", "type": 1, "group_ids": []})
+
+    assert store.find_by_email("a@EXAMPLE.edu")["id"] == "a"
+    assert store.find_by_email("b@example.edu") is None
+    assert sorted(x["id"] for x in store.find_by_type(1)) == ["a", "b"]
+    assert [x["id"] for x in store.find_by_group("g1")] == ["a"]
@@ -0,0 +1,85 @@
+""" pytest tests for zoom_client streaming page decoding """
+
+import json
+import tracemalloc
+
+import pytest
+from tests.mock_zoom import MockZoomServer, MockZoomState
+from zoom_client.client import Client
+from zoom_client.exceptions import ZoomAPIError
+from zoom_client.streaming import RecordStream
+
+
+def chunked(data, size):
+    """split bytes into chunks of size"""
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_record_stream_matches_json_loads():
+    """records and pagination fields decode the same across any chunking"""
+    page = {
+        "page_count": 12,
+        "page_size": 300,
+        "participants": [
+            {"id": i, "user_name": "Zoë ☃ " + str(i), "duration": 10**i, "ok": True}
+            for i in range(12)
+        ],
+        "total_records": 12,
+        "next_page_token": "abc",
+    }
+    body = json.dumps(page, ensure_ascii=False, indent=1).encode()
+
+    for size in (1, 2, 7, 64, len(body)):
+        stream = RecordStream(chunked(body, size), "participants")
+
+        assert stream.read_page() == page
+
+
+def test_record_stream_projects_fields():
+    """only the requested fields of each record are kept"""
+    body = json.dumps({"users": [{"id": "a", "email": "x", "dept": "y"}, {}]})
+    stream = RecordStream(chunked(body.encode(), 5), "users", fields=("id", "dept"))
+
+    assert list(stream) == [{"id": "a", "dept": "y"}, {}]
+    assert stream.fields == {}
+
+
+def test_record_stream_memory_is_flat():
+    """a large page is read without holding its body or whole records"""
+
+    def body():
+        yield b'{"next_page_token": "", "participants": ['
+        for i in range(20000):
+            record = {"id": f"p{i}", "user_name": "x" * 200, "location": "y" * 200}
+            yield (json.dumps(record) + ("," if i < 19999 else "")).encode()
+        yield b"]}"
+
+    tracemalloc.start()
+    page = RecordStream(body(), "participants", fields=("id",)).read_page()
+    kept, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(page["participants"]) == 20000
+    # beyond the projected records kept, reading the 8MB body used under 1MB
+    assert peak - kept < 1024 * 1024
+
+
+def test_streamed_listings():
+    """listings may be streamed with their records projected"""
+    with MockZoomServer(
+        MockZoomState(users=650, meetings=3, participants=40)
+    ) as server:
+        with Client(server.config()) as zoom:
+            users = list(zoom.users.iter_users(fields=("email",), max_workers=2))
+            participants = list(
+                zoom.dashboard.iter_meeting_participants("m1", fields=("user_name",))
+            )
+
+            with pytest.raises(ZoomAPIError) as error:
+                list(zoom.dashboard.iter_meeting_participants("nope", fields=()))
+
+    assert len(users) == 650
+    assert users[0] == {"id": "u0", "email": "user0@example.edu"}
+    assert len(participants) == 40
+    assert set(participants[0]) == {"id", "join_time", "user_name"}
+    assert error.value.code == 3001
@@ -0,0 +1,55 @@
+""" pytest tests for zoom_client transport """
+
+import pytest
+from tests.conftest import FakeTransport
+from tests.mock_zoom import MockZoomServer, MockZoomState
+from zoom_client.client import Client
+from zoom_client.transport import SessionTransport
+
+
+@pytest.fixture(name="client_config")
+def fixture_client_config():
+    """fixture config for testing"""
+    return {
+        "root_request_url": "https://api.example.test/v2/",
+        "api_key": "key",
+        "api_secret": "secret",
+        "data_type": "",
+    }
+
+
+def test_session_transport_from_config(client_config):
+    """transport settings are read from client config"""
+    client_config.update({"pool_size": 4, "timeout": [1, 2], "max_retries": 0})
+
+    transport = SessionTransport.from_config(client_config)
+    adapter = transport.session.get_adapter("https://api.example.test")
+
+    assert transport.timeout == (1, 2)
+    assert adapter._pool_maxsize == 4  # pylint: disable=protected-access
+    transport.close()
+
+
+def test_throttled_responses_are_returned():
+    """429 responses with Retry-After are handed back, not retried by urllib3"""
+    with MockZoomServer(MockZoomState(users=1, throttle_every=1)) as server:
+        with SessionTransport(max_retries=3) as transport:
+            rsp = transport.request("get", server.url + "users")
+
+        assert rsp.status_code == 429
+        assert rsp.headers["Retry-After"] == "1"
+        assert len(server.state.requests) == 1
+
+
+def test_client_uses_transport_and_closes(client_config):
+    """client sends through its transport and closes it on exit"""
+    transport = FakeTransport()
+
+    with Client(client_config, transport=transport) as zoom:
+        with pytest.raises(RuntimeError):
+            zoom.do_request("get", "users", {"page_size": 1})
+
+    assert transport.requests == [
+        ("get", "https://api.example.test/v2/users", {"page_size": 1}, None)
+    ]
+    assert transport.closed
@@ -0,0 +1,53 @@
+""" pytest tests for zoom_client columnar user table """
+
+from datetime import datetime, timezone
+
+from zoom_client.client import Client
+from zoom_client.user_table import UserTable
+
+USERS = [
+    {"id": "a", "type": 1, "status": "active", "dept": "OIT"},
+    {
+        "id": "b",
+        "type": 2,
+        "status": "active",
+        "dept": "OIT",
+        "last_login_time": "2021-01-25T10:00:00Z",
+    },
+    {
+        "id": "c",
+        "type": 2,
+        "status": "inactive",
+        "dept": "Physics",
+        "last_login_time": "2020-06-01T10:00:00Z",
+    },
+]
+
+
+def test_user_table_aggregates():
+    """aggregates are computed from the compact columns"""
+    table = UserTable.from_users(USERS)
+
+    assert len(table) == 3
+    assert table.type_counts() == {"Basic": 1, "Pro": 2}
+    assert table.status_counts() == {"active": 2, "inactive": 1}
+    assert table.department_counts() == {"OIT": 2, "Physics": 1}
+    assert table.last_login_counts(datetime(2021, 2, 1, tzinfo=timezone.utc)) == {
+        "never": 1,
+        "< 30 days": 1,
+        "30-90 days": 0,
+        "90-365 days": 1,
+        "> 365 days": 0,
+    }
+
+
+def test_type_counts_do_not_mutate_users():
+    """type counts may be gathered repeatedly without changing user data"""
+    zoom = Client({"root_request_url": "", "api_key": "key", "api_secret": "secret"})
+    zoom.model["users"] = [dict(user) for user in USERS]
+
+    first = zoom.users.get_current_user_type_counts()
+
+    assert zoom.users.get_current_user_type_counts() == first
+    assert first["Pro Accounts"] == 2
+    assert zoom.model["users"][0]["type"] == 1
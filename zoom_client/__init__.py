@@ -1,2 +1,25 @@
 """ zoom_client init """
-from .client import Client
+import importlib
+
+# public names and the modules they are imported from on first use
+_EXPORTS = {
+    "AsyncClient": "zoom_client.async_client",
+    "Client": "zoom_client.client",
+    "ZoomAPIError": "zoom_client.exceptions",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,449 @@
+"""
+zoom_client columnar analytics of dashboard meetings and participants held
+in NumPy arrays, requires the optional numpy dependency
+(pip install zoom_client[analytics])
+"""
+import numpy as np
+
+from zoom_client.user_table import Categories
+
+# records converted to arrays at a time while a table is built
+CHUNK_ROWS = 100_000
+
+HOUR = 3600
+
+# 1970-01-01 was a Thursday, weekdays are numbered from Monday
+EPOCH_WEEKDAY = 3
+
+# epoch seconds parsed from a missing timestamp (numpy's NaT)
+MISSING = np.iinfo(np.int64).min
+
+
+def parse_times(values):
+    """
+    Parse Zoom timestamps ("2021-01-01T10:30:00Z") into epoch seconds
+
+    params:
+        values: sequence of timestamp strings, "" where there is none
+
+    returns:
+        int64 array of epoch seconds, MISSING where there is none
+    """
+    # the trailing Z is cut off by the fixed width, numpy parses the rest
+    return np.array(values, dtype="U19").astype("datetime64[s]").astype(np.int64)
+
+
+def to_datetimes(seconds):
+    """Convert an array of epoch seconds to datetime64[s] values"""
+    return np.asarray(seconds, dtype=np.int64).astype("datetime64[s]")
+
+
+def distinct(values):
+    """
+    Return the sorted distinct values of an int array (sorting and masking
+    repeats is considerably faster than np.unique on large arrays)
+    """
+    values = np.sort(values)
+
+    return values[np.r_[True, values[1:] != values[:-1]]]
+
+
+def concurrency_sweep(starts, ends, groups):
+    """
+    Sweep the start and end events of intervals in time order
+
+    params:
+        starts: int64 array of interval start times
+        ends: int64 array of interval end times
+        groups: int array of the group (such as meeting) of each interval
+
+    returns:
+        (groups, times, counts) arrays of every event sorted by group and
+        time, counts being the intervals open within the group just after
+        the event; at equal times ends are counted before starts
+    """
+    groups = np.asarray(groups, dtype=np.int64)
+    times = np.concatenate([starts, ends])
+
+    if len(times) == 0:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, empty
+
+    base = int(times.min())
+    span = int(times.max()) - base + 1
+
+    if groups.min() >= 0 and (int(groups.max()) + 1) * span < 2**62:
+        # group, time and start/end packed into one int64 key, which sorts
+        # several times faster than a lexsort of the three columns
+        keys = np.concatenate(
+            [
+                (groups * span + (starts - base)) * 2 + 1,
+                (groups * span + (ends - base)) * 2,
+            ]
+        )
+        keys.sort()
+        positions = keys >> 1
+
+        # the events of each group sum to zero, so the running total restarts
+        # at zero where every group begins
+        return (
+            positions // span,
+            positions % span + base,
+            np.cumsum((keys & 1) * 2 - 1),
+        )
+
+    deltas = np.concatenate(
+        [np.ones(len(starts), np.int64), np.full(len(ends), -1, np.int64)]
+    )
+    event_groups = np.concatenate([groups, groups])
+    order = np.lexsort((deltas, times, event_groups))
+
+    return event_groups[order], times[order], np.cumsum(deltas[order])
+
+
+def peak_concurrency(starts, ends, groups):
+    """
+    Find the largest number of intervals open at once within each group
+
+    returns:
+        (groups, peaks, peak_times) arrays, one entry per group present,
+        peak_times being when each peak was first reached
+    """
+    if len(starts) == 0:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, empty
+
+    event_groups, times, counts = concurrency_sweep(starts, ends, groups)
+
+    first = np.flatnonzero(np.r_[True, event_groups[1:] != event_groups[:-1]])
+    peaks = np.maximum.reduceat(counts, first)
+
+    # the first event of each group reaching its peak
+    rows = np.repeat(np.arange(len(first)), np.diff(np.r_[first, len(counts)]))
+    at_peak = np.flatnonzero(counts == peaks[rows])
+    first_peak = at_peak[np.r_[True, rows[at_peak][1:] != rows[at_peak][:-1]]]
+
+    return event_groups[first], peaks, times[first_peak]
+
+
+def hourly_seconds(starts, ends, utc_offset_hours=0):
+    """
+    Sum the seconds of intervals falling into each weekday and hour
+
+    params:
+        starts: int64 array of interval start times
+        ends: int64 array of interval end times
+        utc_offset_hours: offset of the local time the hours are counted in
+
+    returns:
+        7 x 24 float array of seconds, rows Monday to Sunday
+    """
+    offset = int(utc_offset_hours * HOUR)
+    keep = ends > starts
+    starts, ends = starts[keep] + offset, ends[keep] + offset
+
+    if len(starts) == 0:
+        return np.zeros((7, 24))
+
+    first_hour = starts // HOUR
+    last_hour = (ends - 1) // HOUR
+    base = first_hour.min()
+    size = int(last_hour.max() - base) + 2
+    first_index, last_index = first_hour - base, last_hour - base
+
+    single = first_hour == last_hour
+    spanning = ~single
+
+    # intervals within one hour, then the partial first and last hours of
+    # spanning intervals, then the whole hours between via a difference array
+    seconds = np.bincount(
+        first_index[single], weights=(ends - starts)[single], minlength=size
+    )
+    seconds += np.bincount(
+        first_index[spanning],
+        weights=((first_hour + 1) * HOUR - starts)[spanning],
+        minlength=size,
+    )
+    seconds += np.bincount(
+        last_index[spanning],
+        weights=(ends - last_hour * HOUR)[spanning],
+        minlength=size,
+    )
+    seconds += HOUR * np.cumsum(
+        np.bincount(first_index[spanning] + 1, minlength=size)
+        - np.bincount(last_index[spanning], minlength=size)
+    )
+
+    hours = base + np.arange(size)
+    cells = ((hours // 24 + EPOCH_WEEKDAY) % 7) * 24 + hours % 24
+
+    return np.bincount(cells, weights=seconds, minlength=7 * 24).reshape(7, 24)
+
+
+class IntervalTable:
+    """
+    zoom_client columnar table of time intervals (meetings or participant
+    sessions) with int64 epoch second start and end columns
+    """
+
+    def __init__(self, starts, ends):
+        """
+        params:
+            starts: int64 array of start times in epoch seconds, missing
+                values (MISSING) are treated as the end
+            ends: int64 array of end times, values missing (before the start)
+                are treated as the start
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+
+        self.starts = np.where(starts == MISSING, ends, starts)
+        self.ends = np.maximum(ends, self.starts)
+
+        # intervals with neither time are left out of timelines and heatmaps
+        self.timed = self.starts != MISSING
+
+    def __len__(self):
+        return len(self.starts)
+
+    def durations(self):
+        """Return the seconds each interval lasted"""
+        return self.ends - self.starts
+
+    def _timeline(self, mask=None):
+        mask = self.timed if mask is None else mask & self.timed
+        starts, ends = self.starts[mask], self.ends[mask]
+
+        _, times, counts = concurrency_sweep(
+            starts, ends, np.zeros(len(starts), np.int64)
+        )
+
+        return to_datetimes(times), counts
+
+    def hourly_heatmap(self, utc_offset_hours=0):
+        """
+        Sum minutes in use per weekday and hour of the day
+
+        params:
+            utc_offset_hours: offset of the local time the hours are counted in
+
+        returns:
+            7 x 24 array of minutes, rows Monday to Sunday
+        """
+        return (
+            hourly_seconds(
+                self.starts[self.timed], self.ends[self.timed], utc_offset_hours
+            )
+            / 60
+        )
+
+
+class MeetingTable(IntervalTable):
+    """zoom_client columnar table of dashboard meetings"""
+
+    def __init__(self, uuids, starts, ends):
+        """
+        params:
+            uuids: list of meeting uuids
+            starts: int64 array of meeting start times in epoch seconds
+            ends: int64 array of meeting end times in epoch seconds
+        """
+        super().__init__(starts, ends)
+        self.uuids = list(uuids)
+
+    @classmethod
+    def from_records(cls, meetings):
+        """
+        Build a table from meeting dictionaries
+
+        params:
+            meetings: iterable of meetings (such as iter_past_meetings()),
+                consumed one at a time
+
+        returns:
+            MeetingTable of the meetings
+        """
+        uuids, starts, ends = [], [], []
+        start_chunk, end_chunk = [], []
+
+        for meeting in meetings:
+            uuids.append(meeting["uuid"])
+            start_chunk.append(meeting.get("start_time") or "")
+            end_chunk.append(meeting.get("end_time") or "")
+
+            if len(start_chunk) >= CHUNK_ROWS:
+                starts.append(parse_times(start_chunk))
+                ends.append(parse_times(end_chunk))
+                start_chunk, end_chunk = [], []
+
+        starts.append(parse_times(start_chunk))
+        ends.append(parse_times(end_chunk))
+
+        return cls(uuids, np.concatenate(starts), np.concatenate(ends))
+
+    def timeline(self):
+        """
+        Return the number of meetings in progress over time
+
+        returns:
+            (times, counts) arrays, counts holding from each time on
+        """
+        return self._timeline()
+
+    def peak_concurrency(self):
+        """
+        Find the largest number of meetings in progress at once
+
+        returns:
+            (peak, datetime64 when it was first reached)
+        """
+        _, peaks, times = peak_concurrency(
+            self.starts[self.timed],
+            self.ends[self.timed],
+            np.zeros(int(self.timed.sum()), np.int64),
+        )
+        if len(peaks) == 0:
+            return 0, None
+
+        return int(peaks[0]), to_datetimes(times)[0]
+
+
+class ParticipantTable(IntervalTable):
+    """
+    zoom_client columnar table of dashboard participant sessions; meetings
+    and users are dictionary encoded as integer codes
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, meeting_codes, meetings, user_codes, users, starts, ends):
+        """
+        params:
+            meeting_codes: int array of the meeting of each session
+            meetings: meeting uuids indexed by meeting code
+            user_codes: int array of the user of each session
+            users: user keys indexed by user code
+            starts: int64 array of join times in epoch seconds
+            ends: int64 array of leave times in epoch seconds
+        """
+        super().__init__(starts, ends)
+        self.meeting_codes = np.asarray(meeting_codes, dtype=np.int64)
+        self.meetings = list(meetings)
+        self.user_codes = np.asarray(user_codes, dtype=np.int64)
+        self.users = list(users)
+
+    @classmethod
+    def from_records(cls, records, user_key=("id", "user_name")):
+        """
+        Build a table from participant records
+
+        params:
+            records: iterable of (meeting_uuid, participant) tuples, such as
+                Dashboard.iter_participants_bulk(), consumed one at a time
+            user_key: participant fields identifying a user, the first with
+                a value is used (guests have no id)
+
+        returns:
+            ParticipantTable of the sessions
+        """
+        meetings, users = Categories(), Categories()
+        meeting_codes, user_codes = [], []
+        starts, ends = [], []
+        start_chunk, end_chunk = [], []
+
+        for meeting_uuid, participant in records:
+            meeting_codes.append(meetings.encode(meeting_uuid))
+            user_codes.append(
+                users.encode(
+                    next((participant[x] for x in user_key if participant.get(x)), "")
+                )
+            )
+            start_chunk.append(participant.get("join_time") or "")
+            end_chunk.append(participant.get("leave_time") or "")
+
+            if len(start_chunk) >= CHUNK_ROWS:
+                starts.append(parse_times(start_chunk))
+                ends.append(parse_times(end_chunk))
+                start_chunk, end_chunk = [], []
+
+        starts.append(parse_times(start_chunk))
+        ends.append(parse_times(end_chunk))
+
+        return cls(
+            np.array(meeting_codes, dtype=np.int64),
+            meetings.values,
+            np.array(user_codes, dtype=np.int64),
+            users.values,
+            np.concatenate(starts),
+            np.concatenate(ends),
+        )
+
+    def timeline(self, meeting_uuid):
+        """
+        Return the number of participants present in a meeting over time
+
+        returns:
+            (times, counts) arrays, counts holding from each time on
+        """
+        return self._timeline(self.meeting_codes == self.meetings.index(meeting_uuid))
+
+    def by_meeting(self):
+        """
+        Aggregate the sessions of each meeting
+
+        returns:
+            dictionary of columns, one row per meeting: meeting_uuid,
+            sessions, participants (distinct users), rejoins (sessions
+            beyond each user's first), attendee_minutes, peak_concurrency
+            and peak_time (datetime64)
+        """
+        count = len(self.meetings)
+        sessions = np.bincount(self.meeting_codes, minlength=count)
+
+        pairs = distinct(self.meeting_codes * len(self.users) + self.user_codes)
+        participants = np.bincount(pairs // max(len(self.users), 1), minlength=count)
+
+        peaks = np.zeros(count, np.int64)
+        peak_times = np.zeros(count, np.int64)
+        groups, group_peaks, group_times = peak_concurrency(
+            self.starts[self.timed],
+            self.ends[self.timed],
+            self.meeting_codes[self.timed],
+        )
+        peaks[groups] = group_peaks
+        peak_times[groups] = group_times
+
+        return {
+            "meeting_uuid": np.array(self.meetings, dtype=object),
+            "sessions": sessions,
+            "participants": participants,
+            "rejoins": sessions - participants,
+            "attendee_minutes": np.bincount(
+                self.meeting_codes, weights=self.durations(), minlength=count
+            )
+            / 60,
+            "peak_concurrency": peaks,
+            "peak_time": to_datetimes(peak_times),
+        }
+
+    def by_user(self):
+        """
+        Aggregate the sessions of each user
+
+        returns:
+            dictionary of columns, one row per user: user, sessions,
+            meetings (distinct meetings attended) and attendee_minutes
+        """
+        count = len(self.users)
+        pairs = distinct(self.user_codes * len(self.meetings) + self.meeting_codes)
+
+        return {
+            "user": np.array(self.users, dtype=object),
+            "sessions": np.bincount(self.user_codes, minlength=count),
+            "meetings": np.bincount(
+                pairs // max(len(self.meetings), 1), minlength=count
+            ),
+            "attendee_minutes": np.bincount(
+                self.user_codes, weights=self.durations(), minlength=count
+            )
+            / 60,
+        }
@@ -0,0 +1,180 @@
+"""
+Zoom asyncio client class which assists with performing concurrent work
+using Zoom API, requires the optional aiohttp dependency
+"""
+
+import asyncio
+import json
+
+import aiohttp
+
+from zoom_client.auth import TokenCache
+from zoom_client.lazy import LazyModule
+from zoom_client.metrics import RequestMetrics
+from zoom_client.retry import RequestAttempts, RetryPolicy, RetryStats
+from zoom_client.scheduler import RateLimitScheduler
+from zoom_client.transport import DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT
+
+
+class AsyncResponse:
+    """
+    zoom_client response read from aiohttp, offering the parts of the
+    requests.Response interface used by zoom_client
+    """
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.attempts = 1
+        self.retry_wait = 0.0
+
+    def json(self):
+        """Decode the response body as json"""
+        return json.loads(self.content)
+
+    def close(self):
+        """Nothing to release, the body has already been read"""
+
+
+class AsyncClient:
+    """Zoom asyncio client class which assists with performing work using Zoom API"""
+
+    # module classes, each imported and built on first use
+    users = LazyModule("users", "AsyncUsers")
+    group = LazyModule("group", "AsyncGroup")
+    report = LazyModule("report", "AsyncReport")
+    dashboard = LazyModule("dashboard", "AsyncDashboard")
+
+    def __init__(
+        self, config_data, token_provider=None, retry_policy=None, max_concurrency=None
+    ):
+        """
+        params:
+            config_data: data used to configure the zoom api client
+            token_provider: optional TokenProvider issuing auth tokens, defaults
+                to JWT tokens signed with the configured api key/secret
+            retry_policy: optional RetryPolicy for throttled or failed requests,
+                defaults to the "retry" settings of config_data
+            max_concurrency: largest number of requests in flight, defaults
+                to the configured pool size
+        """
+        # set api client specific vars
+        self.config_data = config_data
+        self.pool_size = config_data.get("pool_size", DEFAULT_POOL_SIZE)
+
+        timeout = config_data.get("timeout", DEFAULT_TIMEOUT)
+        if isinstance(timeout, (list, tuple)):
+            self.timeout = aiohttp.ClientTimeout(
+                sock_connect=timeout[0], sock_read=timeout[1]
+            )
+        else:
+            self.timeout = aiohttp.ClientTimeout(total=timeout)
+
+        # the session must be created inside a running event loop
+        self.session = None
+        self.max_concurrency = max_concurrency or self.pool_size
+        self._semaphore = None
+
+        self.auth = TokenCache.from_config(config_data, token_provider)
+        self.scheduler = RateLimitScheduler.from_config(config_data)
+        self.retry_policy = retry_policy or RetryPolicy.from_config(config_data)
+        self.retry_stats = RetryStats()
+
+        # request and response hooks, see Client.send
+        self.metrics = RequestMetrics()
+        self.request_hooks = []
+        self.response_hooks = [self.metrics.on_response]
+
+        # initialize user model
+        self.model = {"users": None, "user_table": None}
+
+    def generate_jwt(self):
+        """Return valid auth headers for use in Zoom API requests"""
+        return self.auth.headers()
+
+    def _get_session(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=self.timeout,
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        return self.session
+
+    async def close(self):
+        """Close the session and its pooled connections"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _request_once(self, request_type, resource, request_parameters, body):
+        session = self._get_session()
+
+        # aiohttp rejects None values which requests silently drops
+        if isinstance(request_parameters, dict):
+            request_parameters = {
+                key: value
+                for key, value in request_parameters.items()
+                if value is not None
+            }
+
+        async with self._semaphore:
+            async with session.request(
+                request_type.upper(),
+                self.config_data["root_request_url"] + resource,
+                params=request_parameters or None,
+                data=body,
+                headers=self.generate_jwt(),
+            ) as rsp:
+                return AsyncResponse(rsp.status, rsp.headers, await rsp.read())
+
+    async def send(
+        self, request_type, resource, request_parameters, body=None, category=None
+    ):
+        """
+        Send API request using the specified parameters once the rate limit
+        scheduler allows it, see Client.send
+        """
+        attempts = RequestAttempts(
+            self, request_type, resource, body=body, category=category
+        )
+
+        while True:
+            wait = self.scheduler.reserve(attempts.category)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            attempts.start(wait)
+            rsp = await self._request_once(
+                request_type, resource, request_parameters, body
+            )
+
+            delay = attempts.finish(rsp)
+            if delay is None:
+                break
+
+            await asyncio.sleep(delay)
+
+        return rsp
+
+    async def do_request(
+        self, request_type, resource, request_parameters, body=None, category=None
+    ):
+        """Perform API request using the specified parameters"""
+        rsp = await self.send(
+            request_type, resource, request_parameters, body=body, category=category
+        )
+
+        try:
+            return rsp.json()
+        except ValueError:
+            return rsp
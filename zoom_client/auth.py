@@ -0,0 +1,128 @@
+"""
+zoom_client classes which provide and cache authorization tokens
+for use in Zoom API requests
+"""
+import datetime
+import threading
+import time
+
+# defaults used when the client configuration does not provide a value
+DEFAULT_TOKEN_LIFETIME = 30
+DEFAULT_REFRESH_MARGIN = 5
+
+
+class TokenProvider:
+    """
+    zoom_client token provider interface; subclasses issue new tokens
+    """
+
+    def fetch_token(self):
+        """
+        Issue a new token
+
+        returns:
+            tuple of (token string, seconds until the token expires)
+        """
+        raise NotImplementedError
+
+
+class JWTTokenProvider(TokenProvider):
+    """
+    zoom_client token provider which signs JWT app tokens with the api key/secret
+    """
+
+    def __init__(self, api_key, api_secret, lifetime=DEFAULT_TOKEN_LIFETIME):
+        """
+        params:
+            api_key: zoom api key used as the token issuer
+            api_secret: zoom api secret used to sign the token
+            lifetime: seconds each signed token remains valid
+        """
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.lifetime = lifetime
+
+    def fetch_token(self):
+        """Sign a new JWT token valid for the configured lifetime"""
+        import jwt  # pylint: disable=import-outside-toplevel
+
+        headers = {
+            "alg": "HS256",
+            "typ": "JWT",
+        }
+
+        encoded = jwt.encode(
+            {
+                "iss": self.api_key,
+                "exp": datetime.datetime.now(datetime.timezone.utc)
+                + datetime.timedelta(seconds=self.lifetime),
+            },
+            self.api_secret,
+            algorithm="HS256",
+            headers=headers,
+        )
+
+        return encoded, self.lifetime
+
+
+class TokenCache:
+    """
+    zoom_client thread-safe cache which reuses a provider's token and
+    request headers until shortly before the token expires
+    """
+
+    def __init__(self, provider, refresh_margin=DEFAULT_REFRESH_MARGIN):
+        """
+        params:
+            provider: TokenProvider used to issue new tokens
+            refresh_margin: seconds before expiry at which a new token is issued
+        """
+        self.provider = provider
+        self.refresh_margin = refresh_margin
+        self._lock = threading.Lock()
+        self._headers = None
+        self._refresh_at = 0.0
+
+    @classmethod
+    def from_config(cls, config_data, provider=None):
+        """
+        Build a token cache from client config data, issuing JWT tokens signed
+        with the configured api key/secret unless a provider is given
+        """
+        return cls(
+            provider
+            or JWTTokenProvider(
+                config_data["api_key"],
+                config_data["api_secret"],
+                lifetime=config_data.get("token_lifetime", DEFAULT_TOKEN_LIFETIME),
+            ),
+            refresh_margin=config_data.get(
+                "token_refresh_margin", DEFAULT_REFRESH_MARGIN
+            ),
+        )
+
+    def headers(self):
+        """Return cached authorization headers, issuing a new token when needed"""
+        # fast path avoids taking the lock while the token is fresh
+        headers = self._headers
+        if headers is not None and time.monotonic() < self._refresh_at:
+            return headers
+
+        with self._lock:
+            if self._headers is None or time.monotonic() >= self._refresh_at:
+                token, expires_in = self.provider.fetch_token()
+                self._headers = {
+                    "Authorization": f"Bearer {token}",
+                    "Content-type": "application/json",
+                }
+                self._refresh_at = time.monotonic() + max(
+                    expires_in - self.refresh_margin, 0
+                )
+
+            return self._headers
+
+    def invalidate(self):
+        """Discard the cached token so the next request issues a new one"""
+        with self._lock:
+            self._headers = None
+            self._refresh_at = 0.0
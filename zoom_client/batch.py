@@ -0,0 +1,220 @@
+"""
+zoom_client batch executor which performs per-item Zoom API requests
+concurrently and reports a structured outcome for each item
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# defaults used when the caller does not provide a value
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MIN_SAMPLES = 20
+
+
+class BatchOutcome:
+    """
+    zoom_client outcome of the request made for a single batch item
+    """
+
+    __slots__ = ("item", "status_code", "error", "attempts", "latency")
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, item, status_code=None, error=None, attempts=0, latency=0.0):
+        """
+        params:
+            item: batch item (such as a user id) the request was made for
+            status_code: response http status code, None when no response
+            error: error message when the request failed
+            attempts: number of attempts made including retries
+            latency: seconds taken by the request including retries
+        """
+        self.item = item
+        self.status_code = status_code
+        self.error = error
+        self.attempts = attempts
+        self.latency = latency
+
+    @property
+    def ok(self):  # pylint: disable=invalid-name
+        """True when the request succeeded"""
+        return self.error is None
+
+    def as_dict(self):
+        """Return the outcome as a dictionary"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return (
+            f"BatchOutcome(item={self.item!r}, status_code={self.status_code}, "
+            f"error={self.error!r}, attempts={self.attempts}, latency={self.latency:.3f})"
+        )
+
+
+def outcome_from_response(item, rsp, latency, success_codes=(200, 201, 204)):
+    """
+    Build a BatchOutcome from the response to a batch item's request
+
+    params:
+        item: batch item the request was made for
+        rsp: requests.Response-like object returned by Client.send
+        latency: seconds taken by the request
+        success_codes: http status codes counted as success
+
+    returns:
+        BatchOutcome for the item
+    """
+    error = None
+    if rsp.status_code not in success_codes:
+        try:
+            error = rsp.json().get("message", f"HTTP {rsp.status_code}")
+        except (ValueError, AttributeError):
+            error = f"HTTP {rsp.status_code}"
+
+    return BatchOutcome(
+        item,
+        status_code=rsp.status_code,
+        error=error,
+        attempts=getattr(rsp, "attempts", 1),
+        latency=latency,
+    )
+
+
+class BatchReport:
+    """
+    zoom_client report of a batch run holding each item's outcome
+    """
+
+    def __init__(self, outcomes, skipped=None, elapsed=0.0):
+        """
+        params:
+            outcomes: list of BatchOutcome in input order
+            skipped: items not attempted because the batch was stopped early
+            elapsed: seconds taken by the whole batch
+        """
+        self.outcomes = outcomes
+        self.skipped = skipped or []
+        self.elapsed = elapsed
+
+    @property
+    def succeeded(self):
+        """Number of items whose request succeeded"""
+        return sum(1 for outcome in self.outcomes if outcome.ok)
+
+    @property
+    def failed(self):
+        """Outcomes of the items whose request failed"""
+        return [outcome for outcome in self.outcomes if not outcome.ok]
+
+    @property
+    def aborted(self):
+        """True when the batch was stopped before all items were attempted"""
+        return bool(self.skipped)
+
+    def __iter__(self):
+        return iter(self.outcomes)
+
+    def __len__(self):
+        return len(self.outcomes)
+
+
+class BatchExecutor:
+    """
+    zoom_client executor running a request function over batch items with
+    a pool of worker threads; pacing is left to the client's rate limit
+    scheduler which is shared by all workers
+    """
+
+    def __init__(
+        self,
+        max_workers=DEFAULT_MAX_WORKERS,
+        max_error_rate=None,
+        min_samples=DEFAULT_MIN_SAMPLES,
+    ):
+        """
+        params:
+            max_workers: number of requests made concurrently
+            max_error_rate: fraction (0-1) of failed items at which the batch
+                stops submitting new items, None to never stop early
+            min_samples: completed items required before the error rate is checked
+        """
+        self.max_workers = max_workers
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+
+    def _timed(self, func, item):
+        start = time.monotonic()
+        try:
+            rsp = func(item)
+        except Exception as exc:  # pylint: disable=broad-except
+            return BatchOutcome(
+                item, error=str(exc), attempts=1, latency=time.monotonic() - start
+            )
+
+        outcome = outcome_from_response(item, rsp, time.monotonic() - start)
+        rsp.close()
+
+        return outcome
+
+    def _error_rate_exceeded(self, completed, failures):
+        return (
+            self.max_error_rate is not None
+            and completed >= self.min_samples
+            and failures / completed > self.max_error_rate
+        )
+
+    def run(self, func, items):
+        """
+        Run func over every item concurrently
+
+        params:
+            func: callable taking one item and returning the response of its
+                request (see Client.send)
+            items: iterable of batch items
+
+        returns:
+            BatchReport with outcomes in input order
+        """
+        start = time.monotonic()
+        items = list(items)
+        outcomes = [None] * len(items)
+        failures = 0
+        completed = 0
+        stopped = False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {}
+            position = 0
+
+            while position < len(items) or pending:
+                # keep a bounded number of items in flight so the batch can stop early
+                while (
+                    not stopped
+                    and position < len(items)
+                    and len(pending) < self.max_workers * 2
+                ):
+                    future = executor.submit(self._timed, func, items[position])
+                    pending[future] = position
+                    position += 1
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    outcome = future.result()
+                    outcomes[pending.pop(future)] = outcome
+                    completed += 1
+                    failures += int(not outcome.ok)
+
+                if not stopped and self._error_rate_exceeded(completed, failures):
+                    logging.error(
+                        "Stopping batch, %s of %s requests failed", failures, completed
+                    )
+                    stopped = True
+
+        return BatchReport(
+            [outcome for outcome in outcomes if outcome is not None],
+            skipped=items[position:],
+            elapsed=time.monotonic() - start,
+        )
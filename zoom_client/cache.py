@@ -0,0 +1,346 @@
+"""
+zoom_client persistent SQLite response cache for Zoom API data which
+no longer changes once it is final (past meetings, closed report months)
+"""
+
+import calendar
+import fnmatch
+import json
+import os
+import threading
+import time
+import zlib
+from datetime import date, datetime
+
+# defaults used when the client configuration does not provide a value
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+CACHE_FILENAME = "responses.sqlite3"
+
+# whole next_page_token chains are cached under their query with this in place
+# of the token, as the tokens themselves expire
+CHAIN_TOKEN = "*"  # nosec B105 - a cache key marker, not a credential
+
+
+def _to_date(params):
+    return datetime.strptime(params["to"], "%Y-%m-%d").date()
+
+
+def _end_of_month(params):
+    year, month = int(params["year"]), int(params["month"])
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _participants_date(result):
+    # the last time any participant left, a participant who has not left
+    # yet means the meeting may be in progress
+    times = [
+        participant["leave_time"]
+        for page in result.get("pages", [result])
+        for participant in page["participants"]
+    ]
+    if not all(times):
+        raise ValueError("meeting in progress")
+
+    return datetime.strptime(max(times)[:10], "%Y-%m-%d").date()
+
+
+class CacheRule:
+    """
+    zoom_client rule deciding how long responses of matching endpoints are cached
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        pattern,
+        recent_ttl,
+        immutable_after_days=None,
+        date_of=None,
+        date_of_result=None,
+    ):
+        """
+        params:
+            pattern: fnmatch pattern of the api resource path ("metrics/meetings/*")
+            recent_ttl: seconds responses are cached for while the data may still
+                change, 0 to not cache them, None to cache them forever
+            immutable_after_days: days after which the data is final and cached
+                forever, requires date_of or date_of_result
+            date_of: callable returning the date the data covers up to from the
+                request parameters
+            date_of_result: callable returning the date the data covers up to
+                from the decoded response, for endpoints whose parameters
+                don't tell
+        """
+        self.pattern = pattern
+        self.recent_ttl = recent_ttl
+        self.immutable_after_days = immutable_after_days
+        self.date_of = date_of
+        self.date_of_result = date_of_result
+
+    def matches(self, resource):
+        """True when the rule applies to the resource"""
+        return fnmatch.fnmatchcase(resource, self.pattern)
+
+    def ttl(self, params, result=None):
+        """
+        Find the time to live of a response
+
+        params:
+            params: request parameters
+            result: decoded response, used by date_of_result
+
+        returns:
+            seconds to cache the response for, None for forever
+        """
+        if self.immutable_after_days is not None and (
+            self.date_of is not None or self.date_of_result is not None
+        ):
+            try:
+                if self.date_of is not None:
+                    covered = self.date_of(params)
+                else:
+                    covered = self.date_of_result(result)
+            except (AttributeError, KeyError, TypeError, ValueError):
+                return self.recent_ttl
+
+            if (date.today() - covered).days >= self.immutable_after_days:
+                return None
+
+        return self.recent_ttl
+
+
+DEFAULT_RULES = (
+    CacheRule("metrics/meetings", 300, immutable_after_days=2, date_of=_to_date),
+    CacheRule(
+        "metrics/meetings/*/participants",
+        24 * 60 * 60,
+        immutable_after_days=2,
+        date_of_result=_participants_date,
+    ),
+    CacheRule("report/daily", 60 * 60, immutable_after_days=2, date_of=_end_of_month),
+)
+
+
+def cache_key(resource, params):
+    """Build a cache key from a resource and normalized request parameters"""
+    if isinstance(params, dict):
+        params = {key: str(value) for key, value in params.items() if value is not None}
+    else:
+        params = {}
+
+    return resource.strip("/") + "?" + json.dumps(params, sort_keys=True)
+
+
+class ResponseCache:
+    """
+    zoom_client thread-safe SQLite cache of decoded GET responses with
+    per-endpoint time to live rules and size bounded eviction
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES, rules=DEFAULT_RULES):
+        """
+        params:
+            directory: directory holding the cache database (created if missing)
+            max_bytes: largest total size of cached (compressed) responses,
+                least recently used responses are evicted beyond it
+            rules: CacheRule sequence, responses of endpoints without a
+                matching rule are not cached
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, CACHE_FILENAME)
+        self.max_bytes = max_bytes
+        self.rules = rules
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires REAL,
+                accessed REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        self._db.commit()
+
+    @classmethod
+    def from_config(cls, config_data):
+        """Build a cache from client config data, None when no cache_dir is set"""
+        if not config_data.get("cache_dir"):
+            return None
+
+        return cls(
+            config_data["cache_dir"],
+            max_bytes=config_data.get("cache_max_bytes", DEFAULT_MAX_BYTES),
+        )
+
+    def rule_for(self, resource):
+        """Find the rule applying to a resource, None when it isn't cached"""
+        resource = resource.strip("/")
+        return next((rule for rule in self.rules if rule.matches(resource)), None)
+
+    def get(self, resource, params):
+        """
+        Find a cached response
+
+        returns:
+            the decoded response or None when it isn't cached (or expired)
+        """
+        if self.rule_for(resource) is None:
+            return None
+
+        key = cache_key(resource, params)
+        now = time.time()
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or (row[1] is not None and row[1] <= now):
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._db.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._db.commit()
+
+        return json.loads(zlib.decompress(row[0]))
+
+    def get_chain(self, resource, params):
+        """
+        Find the cached pages of a whole next_page_token chain
+
+        params:
+            resource: api resource path of the listing
+            params: query string parameters sent with every request
+
+        returns:
+            list of the chain's pages, None when it isn't cached (or expired)
+        """
+        result = self.get(resource, dict(params, next_page_token=CHAIN_TOKEN))
+
+        return None if result is None else result["pages"]
+
+    def set_chain(self, resource, params, pages):
+        """
+        Cache the pages of a whole next_page_token chain as one entry, keyed by
+        the query without the tokens (which expire) so later runs replay it
+
+        params:
+            resource: api resource path of the listing
+            params: query string parameters sent with every request
+            pages: every page of the chain, the last without a next_page_token
+        """
+        self._set(resource, dict(params, next_page_token=CHAIN_TOKEN), {"pages": pages})
+
+    def set(self, resource, params, result):
+        """Cache a decoded response when its endpoint has a rule allowing it"""
+        # next_page_token values expire, so pages of token paginated listings
+        # are only cached as whole chains (see set_chain), never one by one
+        if isinstance(result, dict) and "next_page_token" in result:
+            return
+
+        self._set(resource, params, result)
+
+    def _set(self, resource, params, result):
+        rule = self.rule_for(resource)
+
+        # only successful pages are cached, never error responses
+        if rule is None or not isinstance(result, dict) or "code" in result:
+            return
+
+        ttl = rule.ttl(params if isinstance(params, dict) else {}, result)
+        if ttl == 0:
+            return
+
+        now = time.time()
+        body = zlib.compress(json.dumps(result).encode())
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (
+                    cache_key(resource, params),
+                    body,
+                    len(body),
+                    None if ttl is None else now + ttl,
+                    now,
+                ),
+            )
+            self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        self._db.execute(
+            "DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?",
+            (time.time(),),
+        )
+
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # remove least recently used responses until back under the size bound
+        rows = self._db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def invalidate(self, resource=None):
+        """Remove cached responses of a resource (any parameters), or all of them"""
+        with self._lock:
+            if resource is None:
+                self._db.execute("DELETE FROM responses")
+            else:
+                self._db.execute(
+                    "DELETE FROM responses WHERE key LIKE ? ESCAPE '\\'",
+                    (
+                        resource.strip("/")
+                        .replace("\\", "\\\\")
+                        .replace("%", "\\%")
+                        .replace("_", "\\_")
+                        + "?%",
+                    ),
+                )
+            self._db.commit()
+
+    def stats(self):
+        """Return hit/miss counters and the size of the cache"""
+        with self._lock:
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": entries,
+                "bytes": size,
+            }
+
+    def close(self):
+        """Close the cache database"""
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,194 @@
+"""
+zoom_client checkpoints which let long paginated crawls resume where
+they stopped after the process dies
+"""
+import json
+import logging
+import os
+import tempfile
+
+from zoom_client.exceptions import ZoomAPIError
+
+
+class Checkpoint:
+    """
+    zoom_client checkpoint of one paginated crawl, kept as a json state file
+    (the crawl, its page cursor and number of records written) next to an
+    ndjson file of the records already written
+    """
+
+    def __init__(self, path):
+        """
+        params:
+            path: path of the state file, records are kept in path + ".ndjson"
+        """
+        self.path = path
+        self.records_path = path + ".ndjson"
+        self.state = None
+
+    def status(self):
+        """Return the saved state or None when there is no checkpoint"""
+        if not os.path.exists(self.path):
+            return None
+
+        with open(self.path, encoding="utf-8") as state_file:
+            return json.load(state_file)
+
+    def abandon(self):
+        """Discard the checkpoint so the next crawl starts from the beginning"""
+        for path in (self.path, self.records_path):
+            if os.path.exists(path):
+                os.unlink(path)
+        self.state = None
+
+    def begin(self, crawl, resume=True):
+        """
+        Open the checkpoint for a crawl
+
+        params:
+            crawl: description of the crawl (resource and parameters), a saved
+                checkpoint of a different crawl is never resumed
+            resume: False to abandon any saved checkpoint and start again
+
+        returns:
+            the state holding the page "cursor" to continue from
+        """
+        state = self.status() if resume else None
+
+        if state is not None and state["crawl"] != crawl:
+            raise ValueError(
+                f"Checkpoint {self.path} belongs to a different crawl, "
+                "abandon it or use another path"
+            )
+
+        if state is None:
+            self.abandon()
+            state = {"crawl": crawl, "cursor": {}, "records": 0, "done": False}
+            with open(self.records_path, "w", encoding="utf-8"):
+                pass
+            self._write_state(state)
+        else:
+            self._truncate(state["records"])
+            logging.info(
+                "Resuming crawl from checkpoint %s with %s records",
+                self.path,
+                state["records"],
+            )
+
+        self.state = state
+        return state
+
+    def _truncate(self, count):
+        # drop records of a page written after the state was last saved
+        with open(self.records_path, "r+", encoding="utf-8") as records_file:
+            for _ in range(count):
+                if not records_file.readline():
+                    raise ValueError(f"Checkpoint {self.path} is missing records")
+            records_file.truncate(records_file.tell())
+
+    def _write_state(self, state):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+        with os.fdopen(handle, "w", encoding="utf-8") as state_file:
+            json.dump(state, state_file)
+            state_file.flush()
+            os.fsync(state_file.fileno())
+
+        os.replace(temp_path, self.path)
+
+    def stored_records(self):
+        """Iterate over the records already written"""
+        with open(self.records_path, encoding="utf-8") as records_file:
+            for _, line in zip(range(self.state["records"]), records_file):
+                yield json.loads(line)
+
+    def commit_page(self, records, cursor):
+        """
+        Write a page of records and then the cursor of the next page
+
+        params:
+            records: records of the page
+            cursor: dictionary describing the next page to request
+        """
+        with open(self.records_path, "a", encoding="utf-8") as records_file:
+            for record in records:
+                records_file.write(json.dumps(record) + "\n")
+            records_file.flush()
+            os.fsync(records_file.fileno())
+
+        self.state["records"] += len(records)
+        self.state["cursor"] = cursor
+        self._write_state(self.state)
+
+    def finish(self):
+        """Mark the crawl complete"""
+        self.state["done"] = True
+        self._write_state(self.state)
+
+
+def iter_checkpointed_token_records(
+    pages, checkpoint, crawl, records_key, record_key, resume=True
+):
+    """
+    Iterate over the records of a next_page_token paginated crawl, saving
+    progress to a checkpoint after every page
+
+    params:
+        pages: callable taking a next_page_token (None for the first page)
+            and returning a page generator (see pagination.iter_token_pages)
+        checkpoint: Checkpoint used to save and resume the crawl
+        crawl: description of the crawl identifying the checkpoint
+        records_key: key of the records array in each page
+        record_key: callable returning the identity of a record, used to skip
+            records already written when an expired next_page_token forces
+            the crawl to start over
+        resume: False to abandon any saved checkpoint and start again
+
+    returns:
+        generator of records, starting with those written before a restart
+    """
+    state = checkpoint.begin(crawl, resume=resume)
+    written = set()
+
+    for record in checkpoint.stored_records():
+        written.add(record_key(record))
+        yield record
+
+    if state["done"]:
+        return
+
+    # a cursor without a next page means the last page was already written
+    if "next_page_token" in state["cursor"] and not state["cursor"]["next_page_token"]:
+        checkpoint.finish()
+        return
+
+    next_page_token = state["cursor"].get("next_page_token")
+
+    try:
+        page_iter = pages(next_page_token)
+        first = next(page_iter, None)
+    except ZoomAPIError as error:
+        if not next_page_token:
+            raise
+
+        # next_page_tokens expire, start over skipping records already written
+        logging.warning("Checkpoint token rejected (%s), restarting crawl", error)
+        page_iter = pages(None)
+        first = next(page_iter, None)
+
+    def remaining():
+        if first is not None:
+            yield first
+        yield from page_iter
+
+    for page in remaining():
+        records = [x for x in page[records_key] if record_key(x) not in written]
+        written.update(record_key(x) for x in records)
+
+        checkpoint.commit_page(
+            records, {"next_page_token": page.get("next_page_token") or None}
+        )
+        yield from records
+
+    checkpoint.finish()
@@ -2,113 +2,282 @@
 Zoom client class which assists with performing work using Zoom API
 """
 
-import datetime
-import logging
-import sys
+import threading
+import time
 
-import jwt
-import requests
-from requests.exceptions import RequestException
-
-from zoom_client.modules import dashboard
-from zoom_client.modules import group
-from zoom_client.modules import report
-from zoom_client.modules import users
-
-# set recursion limit higher for rate limitations functions
-sys.setrecursionlimit(20000)
+from zoom_client.auth import TokenCache
+from zoom_client.cache import ResponseCache, cache_key
+from zoom_client.exceptions import ZoomAPIError
+from zoom_client.lazy import LazyModule
+from zoom_client.metrics import RequestMetrics
+from zoom_client.retry import RequestAttempts, RetryPolicy, RetryStats
+from zoom_client.scheduler import RateLimitScheduler
+from zoom_client.singleflight import MemoCache, SingleFlight
+from zoom_client.streaming import CHUNK_SIZE, RecordStream
+from zoom_client.transport import DryRunTransport, SessionTransport
 
 
 class Client:
     """Zoom client class which assists with performing work using Zoom API"""
 
-    def __init__(self, config_data):
+    # module classes, each imported and built on first use
+    users = LazyModule("users", "Users")
+    group = LazyModule("group", "Group")
+    report = LazyModule("report", "Report")
+    dashboard = LazyModule("dashboard", "Dashboard")
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        config_data,
+        transport=None,
+        token_provider=None,
+        retry_policy=None,
+        cache=None,
+    ):
         """
         params:
             config_data: data used to configure the zoom api client
+            transport: optional transport used to send requests, defaults
+                to a pooled session configured from config_data
+            token_provider: optional TokenProvider issuing auth tokens, defaults
+                to JWT tokens signed with the configured api key/secret
+            retry_policy: optional RetryPolicy for throttled or failed requests,
+                defaults to the "retry" settings of config_data
+            cache: optional ResponseCache of immutable historical data, defaults
+                to a cache under the "cache_dir" of config_data when provided
         """
         # set api client specific vars
         self.config_data = config_data
 
-        # initialize module classes
-        self.users = users.Users(self)
-        self.group = group.Group(self)
-        self.report = report.Report(self)
-        self.dashboard = dashboard.Dashboard(self)
+        # with "dry_run" set requests are recorded by a DryRunTransport rather
+        # than sent, without rate limit pacing or the response cache
+        self.dry_run = config_data.get("dry_run", False)
+
+        # shared connection pool used by all modules, opened on first request
+        self._transport = transport
+        self._transport_lock = threading.Lock()
+
+        # cached auth token shared by all requests (and threads) of this client
+        self.auth = TokenCache.from_config(config_data, token_provider)
+
+        # rate limit scheduler shared by all modules (and threads) of this client
+        self.scheduler = RateLimitScheduler.from_config(config_data)
+
+        # retries of throttled or failed requests and their running totals
+        self.retry_policy = retry_policy or RetryPolicy.from_config(config_data)
+        self.retry_stats = RetryStats()
+
+        # opt-in persistent cache of immutable historical responses
+        self.cache = (
+            None if self.dry_run else cache or ResponseCache.from_config(config_data)
+        )
+
+        # identical concurrent GETs share one request, and with a configured
+        # "memo_ttl" recent responses are reused until a write invalidates them
+        self.single_flight = SingleFlight()
+        self.memo = MemoCache.from_config(config_data)
+
+        # hooks called before and after every attempt of a request, the
+        # per-endpoint metrics are gathered through a response hook
+        self.metrics = RequestMetrics()
+        self.request_hooks = []
+        self.response_hooks = [self.metrics.on_response]
 
         # initialize user model
-        self.model = {"users": None}
+        self.model = {"users": None, "user_table": None}
+
+    @property
+    def transport(self):
+        """Transport used to send requests, a pooled session by default"""
+        if self._transport is None:
+            with self._transport_lock:
+                if self._transport is None and self.dry_run:
+                    self._transport = DryRunTransport()
+                elif self._transport is None:
+                    self._transport = SessionTransport.from_config(self.config_data)
+
+        return self._transport
+
+    @transport.setter
+    def transport(self, transport):
+        self._transport = transport
 
     def generate_jwt(self):
-        """Generate valid jwt token for use in Zoom API requests"""
-        headers = {
-            "alg": "HS256",
-            "typ": "JWT",
-        }
-
-        encoded = jwt.encode(
-            {
-                "iss": self.config_data["api_key"],
-                "exp": datetime.datetime.utcnow() + datetime.timedelta(seconds=30),
-            },
-            self.config_data["api_secret"],
-            algorithm="HS256",
-            headers=headers,
-        )
+        """Return valid auth headers for use in Zoom API requests, reusing
+        the cached token until shortly before it expires"""
+        return self.auth.headers()
 
-        return {
-            "Authorization": f"Bearer {encoded}",
-            "Content-type": "application/json",
-        }
+    def invalidate(self, resource=None):
+        """
+        Drop memoized responses after a resource was changed, called by send
+        for every request other than GET
 
-    def do_request(self, request_type, resource, request_parameters, body=None):
-        """Perform API request using the specified parameters"""
-        if request_type == "get":
-            rsp = requests.get(
-                self.config_data["root_request_url"] + resource,
-                params=request_parameters,
-                headers=self.generate_jwt(),
-                verify=True,
-            )
+        params:
+            resource: resource path changed ("users/abc"), None to drop all
+        """
+        self.memo.invalidate(resource)
 
-        elif request_type == "delete":
-            rsp = requests.delete(
-                self.config_data["root_request_url"] + resource,
-                params=request_parameters,
-                headers=self.generate_jwt(),
-                verify=True,
-            )
+    def close(self):
+        """Close the transport and its pooled connections"""
+        if self._transport is not None:
+            self._transport.close()
+        if self.cache is not None:
+            self.cache.close()
 
-        elif request_type == "patch":
-            rsp = requests.patch(
-                self.config_data["root_request_url"] + resource,
-                params=request_parameters,
-                data=body,
-                headers=self.generate_jwt(),
-                verify=True,
-            )
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def send(
+        self,
+        request_type,
+        resource,
+        request_parameters,
+        body=None,
+        category=None,
+        stream=False,
+    ):
+        """
+        Send API request using the specified parameters once the rate limit
+        scheduler allows it
+
+        params:
+            request_type: http method of the request ("get", "post", ...)
+            resource: api resource path relative to the root request url
+            request_parameters: query string parameters
+            body: optional request body
+            category: optional rate limit category, found from the
+                request type and resource when not provided
+            stream: True to leave the response body unread for iter_content
 
-        elif request_type == "post":
-            rsp = requests.post(
+        returns:
+            requests.Response-like object from the transport, with the number of
+            attempts made and seconds waited between them set as `attempts`
+            and `retry_wait` attributes
+
+        Each attempt calls the request hooks with an info dictionary (method,
+        resource, endpoint, category, attempt, limiter_wait, retry_wait and
+        request_bytes) and then the response hooks with the info dictionary,
+        the response and the seconds the attempt took.
+        """
+        attempts = RequestAttempts(
+            self, request_type, resource, body=body, category=category, stream=stream
+        )
+
+        while True:
+            attempts.start(
+                0.0 if self.dry_run else self.scheduler.acquire(attempts.category)
+            )
+            rsp = self.transport.request(
+                request_type,
                 self.config_data["root_request_url"] + resource,
                 params=request_parameters,
                 data=body,
                 headers=self.generate_jwt(),
-                verify=True,
+                # only passed when set so simpler transports keep working
+                **({"stream": True} if stream else {}),
             )
 
-        if "Retry-After" in rsp.headers.keys():
-            logging.warning("Retry-After detected: %s", rsp.headers["Retry-After"])
-            logging.warning("X-RateLimit-Limit: %s", rsp.headers["X-RateLimit-Limit"])
-            logging.warning(
-                "X-RateLimit-Remaining: %s", rsp.headers["X-RateLimit-Remaining"]
-            )
+            delay = attempts.finish(rsp)
+            if delay is None:
+                break
 
+            rsp.close()
+            time.sleep(delay)
+
+        if request_type.lower() != "get":
+            self.invalidate(resource)
+
+        return rsp
+
+    def stream_page(self, resource, request_parameters, records_key, fields=None):
+        """
+        Perform a GET request for a page of records, decoding the records
+        array one record at a time as the body arrives
+
+        params:
+            resource: api resource path of the listing
+            request_parameters: query string parameters
+            records_key: key of the records array in the page ("users")
+            fields: optional record fields to keep, None for whole records
+
+        returns:
+            page dictionary with the (projected) records under records_key,
+            raising ZoomAPIError when the api returned an error
+        """
+        rsp = self.send("get", resource, request_parameters, stream=True)
+
+        try:
+            if rsp.status_code != 200:
+                raise ZoomAPIError.from_result(self._decode(rsp))
+
+            return RecordStream(
+                rsp.iter_content(CHUNK_SIZE), records_key, fields
+            ).read_page()
+        finally:
+            rsp.close()
+
+    @staticmethod
+    def _decode(rsp):
         try:
-            result = rsp.json()
-        except RequestException:
-            result = rsp
+            return rsp.json()
+        except ValueError:
+            # requests' json decoding errors are ValueErrors in every version
+            return rsp
 
+    def _send_and_close(self, request_type, resource, request_parameters, **kwargs):
+        rsp = self.send(request_type, resource, request_parameters, **kwargs)
         rsp.close()
 
+        return rsp
+
+    def do_request(
+        self, request_type, resource, request_parameters, body=None, category=None
+    ):
+        """
+        Perform API request using the specified parameters
+
+        GET requests are answered from the response cache or memo when
+        possible, and identical GETs made concurrently share one request;
+        each caller still receives its own decoded result.
+        """
+        if request_type != "get":
+            return self._decode(
+                self._send_and_close(
+                    request_type,
+                    resource,
+                    request_parameters,
+                    body=body,
+                    category=category,
+                )
+            )
+
+        if self.cache is not None:
+            cached = self.cache.get(resource, request_parameters)
+            if cached is not None:
+                return cached
+
+        key = cache_key(resource, request_parameters)
+        rsp = self.memo.get(key) if self.memo.enabled else None
+
+        if rsp is None:
+            # a GET started after a write never joins one started before it
+            generation = self.memo.generation
+            rsp, shared = self.single_flight.do(
+                (key, generation),
+                lambda: self._send_and_close(
+                    request_type, resource, request_parameters, category=category
+                ),
+            )
+            if self.memo.enabled and not shared and rsp.status_code == 200:
+                self.memo.set(key, resource, rsp, generation)
+
+        result = self._decode(rsp)
+
+        if self.cache is not None and rsp.status_code == 200:
+            self.cache.set(resource, request_parameters, result)
+
         return result
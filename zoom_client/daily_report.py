@@ -0,0 +1,147 @@
+"""
+zoom_client date-indexed series of Zoom daily report usage with weekly
+and monthly rollups
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+
+# usage columns of each day of the report
+DAILY_FIELDS = ("new_users", "meetings", "participants", "meeting_minutes")
+
+
+def month_is_closed(year, month, today=None, settle_days=2):
+    """
+    Whether the daily report of a month is final
+
+    params:
+        year: year of the month
+        month: month number (1-12)
+        today: optional date to judge from, defaults to the current date
+        settle_days: days after the month ends before its report is final,
+            matching the report/daily response cache rule
+
+    returns:
+        True once the month ended at least settle_days ago
+    """
+    month_end = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return ((today or date.today()) - month_end).days >= settle_days
+
+
+def months_between(start, end):
+    """
+    List the months a date range covers
+
+    params:
+        start: first date of the range
+        end: last date of the range
+
+    returns:
+        list of (year, month) tuples in order
+    """
+    months = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append((year, month))
+        year, month = year + month // 12, month % 12 + 1
+
+    return months
+
+
+def _iso_week(day):
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+class DailySeries:
+    """
+    zoom_client daily report usage held as one sorted date column and one
+    compact integer column per usage field
+    """
+
+    __slots__ = ("dates", "columns")
+
+    def __init__(self, days=()):
+        """
+        params:
+            days: daily report entries ({"date": "2021-01-01", "meetings": 1, ...})
+        """
+        days = sorted(days, key=lambda day: day["date"])
+        self.dates = [date.fromisoformat(day["date"]) for day in days]
+        self.columns = {
+            field: array("q", (day.get(field) or 0 for day in days))
+            for field in DAILY_FIELDS
+        }
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __iter__(self):
+        for index, day in enumerate(self.dates):
+            yield self._entry(index, day)
+
+    def _entry(self, index, day):
+        entry = {"date": day.isoformat()}
+        for field, column in self.columns.items():
+            entry[field] = column[index]
+
+        return entry
+
+    def get(self, day):
+        """
+        Return the entry of a date ("2021-01-01" or date) or None when missing
+        """
+        if isinstance(day, str):
+            day = date.fromisoformat(day)
+
+        index = bisect_left(self.dates, day)
+        if index == len(self.dates) or self.dates[index] != day:
+            return None
+
+        return self._entry(index, day)
+
+    def between(self, start, end):
+        """Return the entries from start to end (dates, inclusive) as a list"""
+        low = bisect_left(self.dates, start)
+        high = bisect_right(self.dates, end)
+
+        return [self._entry(index, self.dates[index]) for index in range(low, high)]
+
+    def totals(self):
+        """Sum each usage field over the whole series"""
+        return {field: sum(column) for field, column in self.columns.items()}
+
+    def _rollup(self, period_of):
+        rollup = []
+        start = 0
+        while start < len(self.dates):
+            period = period_of(self.dates[start])
+            end = start + 1
+            while end < len(self.dates) and period_of(self.dates[end]) == period:
+                end += 1
+
+            entry = {"period": period, "start": self.dates[start].isoformat()}
+            for field, column in self.columns.items():
+                entry[field] = sum(column[start:end])
+            rollup.append(entry)
+            start = end
+
+        return rollup
+
+    def weekly(self):
+        """
+        Sum usage per ISO week
+
+        returns:
+            list of {"period": "2021-W01", "start": first date, usage sums...}
+        """
+        return self._rollup(_iso_week)
+
+    def monthly(self):
+        """
+        Sum usage per month
+
+        returns:
+            list of {"period": "2021-01", "start": first date, usage sums...}
+        """
+        return self._rollup(lambda day: f"{day.year}-{day.month:02d}")
@@ -0,0 +1,35 @@
+"""
+zoom_client exceptions
+"""
+
+
+class ZoomAPIError(Exception):
+    """Error response returned by the Zoom API"""
+
+    def __init__(self, code, message, status_code=None):
+        """
+        params:
+            code: zoom error code (or http status code when none was provided)
+            message: zoom error message
+            status_code: http status code of the response, when known
+        """
+        super().__init__(f"{code}: {message}")
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+
+    def __reduce__(self):
+        # rebuilt from all of its arguments when sent between processes
+        return (type(self), (self.code, self.message, self.status_code))
+
+    @classmethod
+    def from_result(cls, result):
+        """Build an error from a do_request result which is not the expected page"""
+        if isinstance(result, dict):
+            return cls(result.get("code"), result.get("message"))
+
+        return cls(result.status_code, result.text, status_code=result.status_code)
+
+    def as_dict(self):
+        """Return the error in the form zoom_client list methods report errors"""
+        return {"error_code": self.code, "error": self.message}
@@ -0,0 +1,291 @@
+"""
+zoom_client export sinks which write records to NDJSON or CSV files as
+pages arrive, with optional compression, size based rotation and
+atomic publication of each file
+"""
+import bz2
+import csv
+import gzip
+import io
+import json
+import lzma
+import os
+
+# compressed stream openers and the file extensions they add
+COMPRESSION = {
+    None: (None, ""),
+    "gzip": (lambda raw: gzip.GzipFile(fileobj=raw, mode="wb"), ".gz"),
+    "bz2": (lambda raw: bz2.BZ2File(raw, mode="wb"), ".bz2"),
+    "xz": (lambda raw: lzma.LZMAFile(raw, mode="wb"), ".xz"),
+}
+
+# input bytes a compressor must have written out before the compression
+# ratio of the file is trusted over that of the previous file (stream
+# headers are written out long before the first compressed block)
+MIN_RATIO_BYTES = 64 * 1024
+
+# stable csv columns of dashboard records
+MEETING_FIELDS = (
+    "uuid",
+    "id",
+    "topic",
+    "host",
+    "email",
+    "user_type",
+    "start_time",
+    "end_time",
+    "duration",
+    "participants",
+    "has_pstn",
+    "has_voip",
+    "has_3rd_party_audio",
+    "has_video",
+    "has_screen_share",
+    "has_recording",
+    "has_sip",
+)
+PARTICIPANT_FIELDS = (
+    "meeting_uuid",
+    "id",
+    "user_id",
+    "user_name",
+    "device",
+    "ip_address",
+    "location",
+    "network_type",
+    "join_time",
+    "leave_time",
+    "leave_reason",
+    "share_application",
+    "share_desktop",
+    "share_whiteboard",
+    "recording",
+    "status",
+)
+
+
+class CountingWriter(io.BufferedIOBase):
+    """
+    zoom_client binary stream passing writes on to another stream (such as a
+    compressor) while counting the bytes written
+    """
+
+    def __init__(self, stream):
+        """
+        params:
+            stream: binary stream written to, closed along with this one
+        """
+        super().__init__()
+        self.stream = stream
+        self.count = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.count += len(data)
+        return self.stream.write(data)
+
+    def flush(self):
+        self.stream.flush()
+
+    def close(self):
+        if not self.closed:
+            super().close()
+            self.stream.close()
+
+
+class RecordSink:
+    """
+    zoom_client sink writing records to one file, or a series of files
+    rotated once they reach max_bytes. Each file is written under a
+    ".part" name and only renamed into place once complete.
+
+    Compressed files are rotated on an estimate of their size, as
+    compressors hold back input until they have a block to write (gzip every
+    few kB, bz2 every 900 kB, xz every few MB): output written so far plus
+    the input still held at the ratio compressed so far (or that of the
+    previous file). Until a file's first block is written its input counts
+    uncompressed, so bz2 and xz files smaller than a block rotate early.
+    """
+
+    extension = ""
+
+    def __init__(self, path, max_bytes=None, compression=None):
+        """
+        params:
+            path: path of the file written, numbered ("-00001") when rotating
+            max_bytes: size on disk at which a new file is started, None to
+                write a single file
+            compression: None, "gzip", "bz2" or "xz"
+        """
+        if compression not in COMPRESSION:
+            raise ValueError(f"Unsupported compression: {compression}")
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compression = compression
+        self.paths = []
+        self.records = 0
+
+        self._raw = None
+        self._counter = None
+        self._text = None
+        self._part_path = None
+
+        # compressed bytes on disk and input bytes when the compressor last
+        # wrote, and the compression ratio of the previous file
+        self._emitted = (0, 0)
+        self._ratio = 1.0
+
+    def _next_path(self):
+        opener_ext = COMPRESSION[self.compression][1]
+        if self.max_bytes is None:
+            return self.path + opener_ext
+
+        base, ext = os.path.splitext(self.path)
+        return f"{base}-{len(self.paths) + 1:05d}{ext}{opener_ext}"
+
+    def _open(self):
+        self._part_path = self._next_path() + ".part"
+        self._raw = open(self._part_path, "wb")  # pylint: disable=consider-using-with
+
+        opener = COMPRESSION[self.compression][0]
+        self._counter = CountingWriter(opener(self._raw) if opener else self._raw)
+        # written through so the counter sees every record as it is written
+        self._text = io.TextIOWrapper(
+            self._counter, encoding="utf-8", newline="", write_through=True
+        )
+        self._emitted = (self._raw.tell(), 0)
+        self._start_file(self._text)
+
+    def _start_file(self, text):
+        """Write anything a new file begins with (such as a csv header)"""
+
+    def _write_record(self, text, record):
+        raise NotImplementedError
+
+    def _file_size(self):
+        """Size of the current file on disk, estimated while compressing"""
+        if self.compression is None:
+            return self._raw.tell()
+
+        written, consumed = self._raw.tell(), self._counter.count
+        if written > self._emitted[0]:
+            self._emitted = (written, consumed)
+
+        emitted, emitted_at = self._emitted
+        ratio = emitted / emitted_at if emitted_at >= MIN_RATIO_BYTES else self._ratio
+
+        return written + (consumed - emitted_at) * ratio
+
+    def _close_file(self, publish=True):
+        self._text.close()
+        if not self._raw.closed:
+            self._raw.close()
+
+        if self._counter.count:
+            self._ratio = os.path.getsize(self._part_path) / self._counter.count
+
+        if publish:
+            final_path = self._part_path[: -len(".part")]
+            os.replace(self._part_path, final_path)
+            self.paths.append(final_path)
+        else:
+            os.unlink(self._part_path)
+
+        self._text = self._counter = self._raw = self._part_path = None
+
+    def write(self, record):
+        """Write a single record"""
+        if self._text is None:
+            self._open()
+
+        self._write_record(self._text, record)
+        self.records += 1
+
+        if self.max_bytes is not None and self._file_size() >= self.max_bytes:
+            self._close_file()
+
+    def write_all(self, records):
+        """
+        Write every record of an iterable (such as a pagination generator)
+
+        returns:
+            number of records written
+        """
+        count = 0
+        for record in records:
+            self.write(record)
+            count += 1
+
+        return count
+
+    def close(self):
+        """Finish and publish the current file"""
+        if self._text is not None:
+            self._close_file()
+
+    def abort(self):
+        """Discard the current unfinished file"""
+        if self._text is not None:
+            self._close_file(publish=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class NDJSONSink(RecordSink):
+    """zoom_client sink writing one json record per line"""
+
+    def _write_record(self, text, record):
+        text.write(json.dumps(record, separators=(",", ":")))
+        text.write("\n")
+
+
+class CSVSink(RecordSink):
+    """
+    zoom_client sink writing records as csv rows with a stable column
+    schema; missing fields are left empty, nested values are json encoded
+    and fields outside the schema are ignored
+    """
+
+    def __init__(self, path, fieldnames, max_bytes=None, compression=None):
+        """
+        params:
+            path: path of the file written, numbered ("-00001") when rotating
+            fieldnames: columns written, in order (see MEETING_FIELDS and
+                PARTICIPANT_FIELDS)
+            max_bytes: size on disk at which a new file is started, None to
+                write a single file
+            compression: None, "gzip", "bz2" or "xz"
+        """
+        super().__init__(path, max_bytes=max_bytes, compression=compression)
+        self.fieldnames = tuple(fieldnames)
+        self._writer = None
+
+    def _start_file(self, text):
+        self._writer = csv.writer(text)
+        self._writer.writerow(self.fieldnames)
+
+    def _write_record(self, text, record):
+        row = []
+        for field in self.fieldnames:
+            value = record.get(field, "")
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value, separators=(",", ":"))
+            row.append(value)
+
+        self._writer.writerow(row)
+
+
+def tag_records(records, **fields):
+    """Iterate over records with extra fields added, such as meeting_uuid"""
+    for record in records:
+        yield dict(record, **fields)
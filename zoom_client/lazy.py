@@ -0,0 +1,40 @@
+"""
+zoom_client lazily instantiated client modules, so a client only imports
+and builds the api modules it actually uses
+"""
+import importlib
+import threading
+
+_LOCK = threading.Lock()
+
+
+class LazyModule:
+    """
+    zoom_client descriptor creating an api module class instance (such as
+    Users) for a client on first access, after which the instance is kept
+    on the client and the descriptor is no longer consulted
+    """
+
+    def __init__(self, module, class_name):
+        """
+        params:
+            module: name of the module under zoom_client.modules ("users")
+            class_name: name of the class built with the client ("Users")
+        """
+        self.module = module
+        self.class_name = class_name
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, client, owner=None):
+        if client is None:
+            return self
+
+        with _LOCK:
+            if self.name not in client.__dict__:
+                module = importlib.import_module("zoom_client.modules." + self.module)
+                client.__dict__[self.name] = getattr(module, self.class_name)(client)
+
+        return client.__dict__[self.name]
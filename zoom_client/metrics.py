@@ -0,0 +1,232 @@
+"""
+zoom_client per-endpoint request metrics gathered through client request
+and response hooks, with a snapshot api and Prometheus text exporter
+"""
+import threading
+from bisect import bisect_left
+
+# upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# path segments which are followed by a record id
+ID_COLLECTIONS = {"users", "groups", "members", "meetings", "webinars"}
+
+
+def endpoint_template(resource):
+    """
+    Replace record ids in a resource path so requests are grouped by endpoint
+
+    params:
+        resource: api resource path ("metrics/meetings/abc==/participants")
+
+    returns:
+        endpoint template ("metrics/meetings/{id}/participants")
+    """
+    parts = resource.strip("/").split("/")
+    template = parts[:1]
+
+    for previous, part in zip(parts, parts[1:]):
+        template.append("{id}" if previous in ID_COLLECTIONS else part)
+
+    return "/".join(template)
+
+
+class EndpointMetrics:
+    """zoom_client counters of one endpoint (method and resource template)"""
+
+    __slots__ = (
+        "requests",
+        "statuses",
+        "buckets",
+        "latency_sum",
+        "request_bytes",
+        "response_bytes",
+        "retries",
+        "retry_wait",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.statuses = {}
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+        self.retry_wait = 0.0
+
+    def as_dict(self):
+        """Return the counters as a dictionary"""
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "latency_buckets": dict(
+                zip([*map(str, LATENCY_BUCKETS), "+Inf"], self.buckets)
+            ),
+            "latency_sum": self.latency_sum,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "retries": self.retries,
+            "retry_wait": self.retry_wait,
+        }
+
+
+class RequestMetrics:
+    """
+    zoom_client thread-safe request metrics: per-endpoint latency histograms,
+    byte counts, status codes and retries, plus per rate limit category
+    time spent waiting in the scheduler and quota remaining
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints = {}
+        self.limiter_wait = {}
+        self.remaining = {}
+
+    def on_response(self, info, rsp, elapsed):
+        """
+        Response hook recording one attempt of a request
+
+        params:
+            info: request info dictionary passed to client hooks
+            rsp: response of the attempt
+            elapsed: seconds taken by the attempt
+        """
+        response_bytes = rsp.headers.get("Content-Length")
+        if response_bytes is None and not info.get("stream"):
+            response_bytes = len(getattr(rsp, "content", None) or b"")
+
+        key = (info["method"].upper(), info["endpoint"])
+        category = info["category"]
+
+        # malformed rate limit headers are skipped rather than failing the request
+        try:
+            remaining = int(rsp.headers["X-RateLimit-Remaining"])
+        except (KeyError, TypeError, ValueError):
+            remaining = None
+
+        with self._lock:
+            endpoint = self.endpoints.get(key)
+            if endpoint is None:
+                endpoint = self.endpoints[key] = EndpointMetrics()
+
+            endpoint.requests += 1
+            endpoint.statuses[rsp.status_code] = (
+                endpoint.statuses.get(rsp.status_code, 0) + 1
+            )
+            endpoint.buckets[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+            endpoint.latency_sum += elapsed
+            endpoint.request_bytes += info.get("request_bytes", 0)
+            endpoint.response_bytes += int(response_bytes or 0)
+            endpoint.retries += int(info["attempt"] > 0)
+            endpoint.retry_wait += info.get("retry_wait", 0.0)
+
+            self.limiter_wait[category] = self.limiter_wait.get(
+                category, 0.0
+            ) + info.get("limiter_wait", 0.0)
+            if remaining is not None:
+                self.remaining[category] = remaining
+
+    def snapshot(self):
+        """
+        Return the current metrics
+
+        returns:
+            dictionary of "endpoints" ("METHOD endpoint" to counters),
+            "limiter_wait" and "remaining" (per rate limit category)
+        """
+        with self._lock:
+            return {
+                "endpoints": {
+                    f"{method} {endpoint}": metrics.as_dict()
+                    for (method, endpoint), metrics in self.endpoints.items()
+                },
+                "limiter_wait": dict(self.limiter_wait),
+                "remaining": dict(self.remaining),
+            }
+
+    def to_prometheus(self, prefix="zoom_client"):
+        """
+        Export the current metrics in Prometheus (OpenMetrics compatible)
+        text exposition format
+
+        params:
+            prefix: prefix of every metric name
+
+        returns:
+            exposition text
+        """
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+
+            family("requests_total", "counter", "API requests by status code.")
+            for (method, endpoint), metrics in endpoints:
+                for status, count in sorted(metrics.statuses.items()):
+                    lines.append(
+                        f'{prefix}_requests_total{{method="{method}",'
+                        f'endpoint="{endpoint}",status="{status}"}} {count}'
+                    )
+
+            family("request_duration_seconds", "histogram", "API request latency.")
+            for (method, endpoint), metrics in endpoints:
+                labels = f'method="{method}",endpoint="{endpoint}"'
+                cumulative = 0
+                for bound, count in zip(
+                    [*map(str, LATENCY_BUCKETS), "+Inf"], metrics.buckets
+                ):
+                    cumulative += count
+                    lines.append(
+                        f"{prefix}_request_duration_seconds_bucket"
+                        f'{{{labels},le="{bound}"}} {cumulative}'
+                    )
+                lines.append(
+                    f"{prefix}_request_duration_seconds_sum{{{labels}}} "
+                    f"{metrics.latency_sum}"
+                )
+                lines.append(
+                    f"{prefix}_request_duration_seconds_count{{{labels}}} "
+                    f"{metrics.requests}"
+                )
+
+            for name, attribute, help_text in (
+                ("request_bytes_total", "request_bytes", "Request body bytes sent."),
+                ("response_bytes_total", "response_bytes", "Response bytes received."),
+                ("retries_total", "retries", "Retried API requests."),
+                ("retry_wait_seconds_total", "retry_wait", "Seconds of retry backoff."),
+            ):
+                family(name, "counter", help_text)
+                for (method, endpoint), metrics in endpoints:
+                    lines.append(
+                        f'{prefix}_{name}{{method="{method}",endpoint="{endpoint}"}} '
+                        f"{getattr(metrics, attribute)}"
+                    )
+
+            family(
+                "rate_limit_wait_seconds_total",
+                "counter",
+                "Seconds spent waiting in the rate limit scheduler.",
+            )
+            for category, seconds in sorted(self.limiter_wait.items()):
+                lines.append(
+                    f'{prefix}_rate_limit_wait_seconds_total{{category="{category}"}} '
+                    f"{seconds}"
+                )
+
+            family(
+                "rate_limit_remaining",
+                "gauge",
+                "Last X-RateLimit-Remaining reported by the API.",
+            )
+            for category, remaining in sorted(self.remaining.items()):
+                lines.append(
+                    f'{prefix}_rate_limit_remaining{{category="{category}"}} {remaining}'
+                )
+
+        return "\n".join(lines) + "\n"
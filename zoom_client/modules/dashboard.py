@@ -3,7 +3,89 @@ zoom_client class and related methods for gathering data
 from dashboard api queries
 """
 import logging
-from ratelimit import limits, sleep_and_retry
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+
+from zoom_client.checkpoint import iter_checkpointed_token_records
+from zoom_client.exceptions import ZoomAPIError
+from zoom_client.pagination import iter_records, iter_token_pages, iter_unique
+
+# identity of records, participants who rejoin are listed once per join
+RECORD_KEYS = {
+    "meetings": lambda record: record["uuid"],
+    "participants": lambda record: (
+        record.get("id"),
+        record.get("user_id"),
+        record.get("join_time"),
+    ),
+}
+
+# fields the record identities need, always kept when records are projected
+RECORD_KEY_FIELDS = {
+    "meetings": ("uuid",),
+    "participants": ("id", "user_id", "join_time"),
+}
+
+
+class BulkParticipants:
+    """
+    zoom_client iterable of (meeting_uuid, participant) tuples fetched
+    concurrently for many meetings, with meetings whose participants could
+    not be fetched collected in `failed` instead of the results
+    """
+
+    def __init__(self, dashboard, meeting_uuids, max_workers, fields=None):
+        """
+        params:
+            dashboard: Dashboard used to fetch each meeting's participants
+            meeting_uuids: iterable of meeting uuids
+            max_workers: number of meetings fetched concurrently
+            fields: optional participant fields to keep, streaming each page
+        """
+        self.dashboard = dashboard
+        self.meeting_uuids = meeting_uuids
+        self.max_workers = max_workers
+        self.fields = fields
+        self.failed = {}
+
+    def _fetch(self, meeting_uuid):
+        return list(
+            self.dashboard.iter_meeting_participants(meeting_uuid, fields=self.fields)
+        )
+
+    def __iter__(self):
+        # imported here so the async modules don't pull in requests
+        import requests  # pylint: disable=import-outside-toplevel
+
+        meeting_uuids = iter(self.meeting_uuids)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {}
+
+            while True:
+                # only a bounded number of meetings is held in flight
+                for meeting_uuid in meeting_uuids:
+                    pending[executor.submit(self._fetch, meeting_uuid)] = meeting_uuid
+                    if len(pending) >= self.max_workers * 2:
+                        break
+
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    meeting_uuid = pending.pop(future)
+                    try:
+                        participants = future.result()
+                    except (ZoomAPIError, requests.RequestException) as error:
+                        logging.error(
+                            "Participants of meeting %s failed: %s", meeting_uuid, error
+                        )
+                        self.failed[meeting_uuid] = error
+                        continue
+
+                    for participant in participants:
+                        yield meeting_uuid, participant
 
 
 class Dashboard:
@@ -14,71 +96,301 @@ class Dashboard:
     def __init__(self, client):
         self.zoom = client
 
-    def get_past_meetings(self, from_date: str, to_date: str) -> list:
+    # pylint: disable=too-many-arguments
+    def _iter_records(self, resource, params, records_key, checkpoint, resume, fields):
+        crawl = {"resource": resource, "params": params}
+        if fields is not None:
+            fields = tuple(dict.fromkeys((*RECORD_KEY_FIELDS[records_key], *fields)))
+            crawl["fields"] = list(fields)
+
+        def pages(next_page_token=None):
+            return iter_token_pages(
+                self.zoom, resource, params, records_key, next_page_token, fields
+            )
+
+        if checkpoint is None:
+            return iter_records(pages(), records_key)
+
+        return iter_checkpointed_token_records(
+            pages,
+            checkpoint,
+            crawl,
+            records_key,
+            RECORD_KEYS[records_key],
+            resume=resume,
+        )
+
+    def iter_past_meetings(
+        self,
+        from_date: str,
+        to_date: str,
+        checkpoint=None,
+        resume: bool = True,
+        fields=None,
+    ):
         """
-        Finds Zoom meetings in provided date range.
-        Note: only one request per minute may be made due to Zoom rate limits.
+        Iterates over Zoom meetings in provided date range page by page.
+        Note: requests are paced to Zoom's resource-intensive rate limits.
 
         params:
             from_date: date to begin search for meetings in format ("%Y-%m-%d")
             to_date: date to end search for meetings in format ("%Y-%m-%d")
+            checkpoint: optional zoom_client.checkpoint.Checkpoint saving progress
+                after every page so a restarted crawl continues where it stopped
+            resume: False to abandon a saved checkpoint and start again
+            fields: optional meeting fields to keep (uuid is always kept), each
+                page is then streamed and decoded one meeting at a time
 
         returns:
-            list of dictionaries containing relevant meeting information from Zoom.
+            generator of meeting dictionaries, raising ZoomAPIError on api errors
         """
         logging.info("Gathering Zoom meetings data...")
-        # Note: artificial rate limit
-        # more detail can be found here:
-        # https://marketplace.zoom.us/docs/api-reference/rate-limits#rate-limits
-        @sleep_and_retry
-        @limits(calls=19, period=65)
-        def make_requests(
-            page_number: int = 1, next_page_token: str = None, result_list: list = None
-        ) -> list:
-
-            logging.info("Making meeting request %s", page_number)
-
-            result = self.zoom.do_request(
-                "get",
-                "metrics/meetings",
-                {
-                    "from": from_date,
-                    "to": to_date,
-                    "type": "past",
-                    "page_size": 300,
-                    "next_page_token": next_page_token,
-                },
-            )
 
-            page_number += 1
+        return self._iter_records(
+            "metrics/meetings",
+            {"from": from_date, "to": to_date, "type": "past", "page_size": 300},
+            "meetings",
+            checkpoint,
+            resume,
+            fields,
+        )
 
-            if "meetings" in result.keys():
-                result_list += result["meetings"]
-            else:
-                result_list += [
-                    {"error_code": result["code"], "error": result["message"]}
-                ]
+    @staticmethod
+    def date_shards(from_date: str, to_date: str, shard_days: int = 1) -> list:
+        """
+        Splits a date range into consecutive shards
 
-            if "code" in result.keys():
-                logging.error("Error: %s %s", result["code"], result["message"])
+        params:
+            from_date: first date of the range in format ("%Y-%m-%d")
+            to_date: last date of the range in format ("%Y-%m-%d")
+            shard_days: number of days covered by each shard
+
+        returns:
+            list of (from_date, to_date) tuples covering the range
+        """
+        start = datetime.strptime(from_date, "%Y-%m-%d").date()
+        end = datetime.strptime(to_date, "%Y-%m-%d").date()
+
+        shards = []
+        while start <= end:
+            shard_end = min(start + timedelta(days=shard_days - 1), end)
+            shards.append((start.isoformat(), shard_end.isoformat()))
+            start = shard_end + timedelta(days=1)
+
+        return shards
+
+    def _get_shard(self, shard: tuple, shard_retries: int) -> list:
+        # imported here so the async modules don't pull in requests
+        import requests  # pylint: disable=import-outside-toplevel
 
-            elif "next_page_token" in result.keys() and result["next_page_token"] != "":
-                make_requests(
-                    page_number=page_number,
-                    next_page_token=result["next_page_token"],
-                    result_list=result_list,
+        for attempt in range(shard_retries + 1):
+            try:
+                return list(self.iter_past_meetings(*shard))
+            except (ZoomAPIError, requests.RequestException) as error:
+                logging.warning(
+                    "Meetings shard %s to %s failed (attempt %s): %s",
+                    shard[0],
+                    shard[1],
+                    attempt + 1,
+                    error,
                 )
+                if attempt == shard_retries:
+                    raise
+
+        return []
+
+    def iter_past_meetings_sharded(
+        self,
+        from_date: str,
+        to_date: str,
+        shard_days: int = 1,
+        max_workers: int = 4,
+        shard_retries: int = 2,
+    ):
+        """
+        Iterates over Zoom meetings in provided date range, splitting the range
+        into shards which are crawled concurrently within the dashboard rate
+        limit budget. A failed shard is retried on its own.
+
+        params:
+            from_date: date to begin search for meetings in format ("%Y-%m-%d")
+            to_date: date to end search for meetings in format ("%Y-%m-%d")
+            shard_days: number of days covered by each shard
+            max_workers: number of shards crawled concurrently
+            shard_retries: retries of a failed shard before giving up
+
+        returns:
+            generator of meeting dictionaries in shard order deduplicated by
+            meeting uuid, raising the last ZoomAPIError or
+            requests.RequestException when a shard keeps failing
+        """
+
+        def shard_meetings():
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for meetings in executor.map(
+                    lambda shard: self._get_shard(shard, shard_retries),
+                    self.date_shards(from_date, to_date, shard_days),
+                ):
+                    yield from meetings
+
+        # meetings spanning midnight are listed by both days' shards
+        return iter_unique(shard_meetings(), key="uuid")
+
+    def iter_meeting_participants(
+        self, meeting_uuid: str, checkpoint=None, resume: bool = True, fields=None
+    ):
+        """
+        Iterates over Zoom meeting participants from given meeting_uuid page by page.
+        Note: requests are paced to Zoom's heavy rate limits.
+
+        params:
+            meeting_uuid: meeting uuid which you'd like to find participants for
+            checkpoint: optional zoom_client.checkpoint.Checkpoint saving progress
+                after every page so a restarted crawl continues where it stopped
+            resume: False to abandon a saved checkpoint and start again
+            fields: optional participant fields to keep (id, user_id and
+                join_time are always kept), each page is then streamed and
+                decoded one participant at a time
+
+        returns:
+            generator of participant dictionaries, raising ZoomAPIError on api errors
+        """
+        logging.info("Gathering Zoom meeting participant data...")
+
+        return self._iter_records(
+            "metrics/meetings/" + meeting_uuid + "/participants",
+            {"type": "past", "page_size": 300},
+            "participants",
+            checkpoint,
+            resume,
+            fields,
+        )
+
+    def iter_participants_bulk(
+        self, meeting_uuids, max_workers: int = 8, fields=None
+    ) -> BulkParticipants:
+        """
+        Fetches participants of many meetings concurrently under the client's
+        shared rate limit budget.
 
-            return result_list
+        params:
+            meeting_uuids: iterable of meeting uuids (consumed lazily)
+            max_workers: number of meetings fetched concurrently
+            fields: optional participant fields to keep, streaming each page
 
-        result_list = make_requests()
+        returns:
+            BulkParticipants iterable of (meeting_uuid, participant) tuples
+            streamed as each meeting completes; meetings which failed are
+            found in its `failed` dict of meeting_uuid to the ZoomAPIError or
+            requests.RequestException raised
+        """
+        return BulkParticipants(self, meeting_uuids, max_workers, fields)
+
+    def get_participant_table(self, meeting_uuids, max_workers: int = 8):
+        """
+        Loads participants of many meetings into a columnar ParticipantTable
+        for analytics (peak concurrency, attendee minutes, heatmaps), streaming
+        only the fields it needs. Requires the optional numpy dependency.
+
+        params:
+            meeting_uuids: iterable of meeting uuids (consumed lazily)
+            max_workers: number of meetings fetched concurrently
+
+        returns:
+            ParticipantTable of the sessions; meetings which failed are
+            logged and left out
+        """
+        # pylint: disable=import-outside-toplevel
+        from zoom_client.analytics import ParticipantTable
+
+        return ParticipantTable.from_records(
+            self.iter_participants_bulk(
+                meeting_uuids,
+                max_workers,
+                fields=("user_name", "leave_time"),
+            )
+        )
+
+    def export_past_meetings(self, from_date: str, to_date: str, sink) -> int:
+        """
+        Writes Zoom meetings in provided date range to an export sink as
+        each page arrives, holding only one page in memory.
+
+        params:
+            from_date: date to begin search for meetings in format ("%Y-%m-%d")
+            to_date: date to end search for meetings in format ("%Y-%m-%d")
+            sink: zoom_client.export sink (such as NDJSONSink or CSVSink)
+
+        returns:
+            number of meetings written
+        """
+        return sink.write_all(self.iter_past_meetings(from_date, to_date))
+
+    def export_meeting_participants(
+        self, meeting_uuids, sink, max_workers: int = 8
+    ) -> BulkParticipants:
+        """
+        Writes participants of many meetings to an export sink as each
+        meeting completes, adding the meeting_uuid to each participant.
+
+        params:
+            meeting_uuids: iterable of meeting uuids (consumed lazily)
+            sink: zoom_client.export sink (such as NDJSONSink or CSVSink)
+            max_workers: number of meetings fetched concurrently
+
+        returns:
+            BulkParticipants whose `failed` dict holds meetings which failed
+        """
+        bulk = self.iter_participants_bulk(meeting_uuids, max_workers=max_workers)
+
+        for meeting_uuid, participant in bulk:
+            sink.write(dict(participant, meeting_uuid=meeting_uuid))
+
+        return bulk
+
+    @staticmethod
+    def _collect(records) -> list:
+        result_list = []
+
+        try:
+            for record in records:
+                result_list.append(record)
+        except ZoomAPIError as error:
+            logging.error("Error: %s %s", error.code, error.message)
+            result_list.append(error.as_dict())
 
         return result_list
 
+    def get_past_meetings(
+        self, from_date: str, to_date: str, shard_days: int = None, **shard_options
+    ) -> list:
+        """
+        Finds Zoom meetings in provided date range.
+        Note: requests are paced to Zoom's resource-intensive rate limits.
+
+        params:
+            from_date: date to begin search for meetings in format ("%Y-%m-%d")
+            to_date: date to end search for meetings in format ("%Y-%m-%d")
+            shard_days: when provided, the range is split into shards of this
+                many days which are crawled concurrently, see
+                iter_past_meetings_sharded for further shard_options
+
+        returns:
+            list of dictionaries containing relevant meeting information from Zoom.
+        """
+        if shard_days:
+            return self._collect(
+                self.iter_past_meetings_sharded(
+                    from_date, to_date, shard_days=shard_days, **shard_options
+                )
+            )
+
+        return self._collect(self.iter_past_meetings(from_date, to_date))
+
     def get_past_meeting_participants(self, meeting_uuid: str) -> list:
         """
         Finds Zoom meeting participants from given meeting_uuid (specific instance of Zoom meeting).
-        Note only one request per second may be made due to Zoom rate limits.
+        Note: requests are paced to Zoom's heavy rate limits.
 
         params:
             meeting_uuid: meeting uuid which you'd like to find participants for
@@ -86,45 +398,64 @@ class Dashboard:
         returns:
             list of dictionaries containing relevant meeting information from Zoom.
         """
+        return self._collect(self.iter_meeting_participants(meeting_uuid))
 
-        logging.info("Gathering Zoom meeting participant data...")
-        # Note: artificial rate limit
-        # more detail can be found here:
-        # https://marketplace.zoom.us/docs/api-reference/rate-limits#rate-limits
-        @sleep_and_retry
-        @limits(calls=39, period=5)
-        def make_requests(
-            page_number: int = 1, next_page_token: str = None, result_list: list = None
-        ) -> list:
-            logging.info("Making meeting partcipants request %s", page_number)
-
-            result = self.zoom.do_request(
-                "get",
-                "metrics/meetings/" + meeting_uuid + "/participants",
-                {"type": "past", "page_size": 300, "next_page_token": next_page_token},
-            )
 
+class AsyncDashboard:
+    """
+    zoom_client dashboard class with awaitable versions of the
+    get_past_meetings and get_past_meeting_participants Dashboard methods,
+    for use with AsyncClient
+    """
+
+    def __init__(self, client):
+        self.zoom = client
+
+    async def _gather_pages(self, resource: str, params: dict, key: str) -> list:
+        result_list = []
+        next_page_token = None
+        page_number = 1
+
+        while True:
+            logging.info("Making %s request %s", resource, page_number)
+
+            result = await self.zoom.do_request(
+                "get", resource, dict(params, next_page_token=next_page_token)
+            )
             page_number += 1
 
-            if "participants" in result.keys():
-                result_list += result["participants"]
+            if key in result.keys():
+                result_list += result[key]
             else:
                 result_list += [
                     {"error_code": result["code"], "error": result["message"]}
                 ]
-
-            if "code" in result.keys():
                 logging.error("Error: %s %s", result["code"], result["message"])
+                break
 
-            if "next_page_token" in result.keys() and result["next_page_token"] != "":
-                make_requests(
-                    page_number=page_number,
-                    next_page_token=result["next_page_token"],
-                    result_list=result_list,
-                )
+            next_page_token = result.get("next_page_token")
+            if not next_page_token:
+                break
+
+        return result_list
 
-            return result_list
+    async def get_past_meetings(self, from_date: str, to_date: str) -> list:
+        """Finds Zoom meetings in provided date range, see Dashboard.get_past_meetings"""
+        logging.info("Gathering Zoom meetings data...")
 
-        result_list = make_requests()
+        return await self._gather_pages(
+            "metrics/meetings",
+            {"from": from_date, "to": to_date, "type": "past", "page_size": 300},
+            "meetings",
+        )
 
-        return result_list
+    async def get_past_meeting_participants(self, meeting_uuid: str) -> list:
+        """Finds Zoom meeting participants from given meeting_uuid,
+        see Dashboard.get_past_meeting_participants"""
+        logging.info("Gathering Zoom meeting participant data...")
+
+        return await self._gather_pages(
+            "metrics/meetings/" + meeting_uuid + "/participants",
+            {"type": "past", "page_size": 300},
+            "participants",
+        )
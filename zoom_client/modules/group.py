@@ -2,14 +2,23 @@
 zoom_client class and related methods for gathering data
 and making changes to Zoom groups
 """
+import asyncio
 import logging
 import json
 import time
 
+from zoom_client.batch import (
+    DEFAULT_MAX_WORKERS,
+    BatchExecutor,
+    outcome_from_response,
+)
+from zoom_client.pagination import iter_numbered_pages, iter_records
 
-class Group:
+
+class GroupBase:
     """
-    zoom_client group class for gathering data and making changes to Zoom groups
+    zoom_client base of the Group and AsyncGroup classes, holding the parts
+    which make no requests
     """
 
     def __init__(self, client):
@@ -21,6 +30,12 @@ class Group:
         for i in range(0, len(big_list), count):
             yield big_list[i : i + count]
 
+
+class Group(GroupBase):
+    """
+    zoom_client group class for gathering data and making changes to Zoom groups
+    """
+
     def add_members(self, group_id, user_emails):
         """Add members to Zoom group in batch by list of userid's"""
         # Special note: uses user emails as opposed to ID's
@@ -30,14 +45,12 @@ class Group:
         for chunk in list(self.chunks(user_emails, 30)):
             logging.info("Processing adding chunk of 30 or less users to group...")
             post_data = {"members": [{"email": x} for x in chunk]}
-            result = self.zoom.client.do_request(
+            result = self.zoom.do_request(
                 "post",
                 "groups/" + group_id + "/members",
                 "",
                 body=json.dumps(post_data),
             )
-            # simple check to make sure we don't exceed rate limits, this needs improvement!
-            time.sleep(5)
 
         return result
 
@@ -49,11 +62,143 @@ class Group:
         for chunk in list(self.chunks(user_ids, 30)):
             logging.info("Processing removing chunk of 30 or less users from group...")
             for user_id in chunk:
-                result = self.zoom.client.do_request(
+                result = self.zoom.do_request(
                     "delete", "groups/" + group_id + "/members/" + user_id, ""
                 )
-            # simple check to make sure we don't exceed rate limits, this needs improvement!
-            # 30 requests per second are permissable and well below actual Edu account limits
-            time.sleep(1)
 
         return result
+
+    def iter_members(self, group_id, page_size=300):
+        """
+        Iterate over members of a Zoom group page by page
+
+        returns:
+            generator of member dictionaries, raising ZoomAPIError on api errors
+        """
+        pages = iter_numbered_pages(
+            self.zoom,
+            "groups/" + group_id + "/members",
+            {"page_size": page_size},
+            "members",
+        )
+
+        return iter_records(pages, "members")
+
+    def _add_chunk(self, group_id, chunk):
+        start = time.monotonic()
+        rsp = self.zoom.send(
+            "post",
+            "groups/" + group_id + "/members",
+            "",
+            body=json.dumps({"members": [{"email": x} for x in chunk]}),
+        )
+        outcome = outcome_from_response(chunk, rsp, time.monotonic() - start)
+        rsp.close()
+
+        return outcome
+
+    def sync_members(self, group_id, desired_emails, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Make a Zoom group's membership match the desired emails, only adding
+        missing members (in batches of 30) and removing extra members
+        (concurrently), all paced by the client's rate limit scheduler
+
+        params:
+            group_id: id of the Zoom group
+            desired_emails: emails of every user who should be a member
+            max_workers: number of removals made concurrently
+
+        returns:
+            dictionary reporting the emails "added" and "removed", the number
+            "unchanged", outcomes of "failed" requests and "timings" in seconds
+        """
+        timings = {}
+
+        start = time.monotonic()
+        current = {
+            member["email"].lower(): member["id"]
+            for member in self.iter_members(group_id)
+        }
+        timings["list"] = time.monotonic() - start
+
+        desired = {email.lower() for email in desired_emails}
+        to_add = sorted(desired - set(current))
+        to_remove = sorted(set(current) - desired)
+
+        logging.info(
+            "Syncing group %s: %s to add, %s to remove, %s unchanged",
+            group_id,
+            len(to_add),
+            len(to_remove),
+            len(desired) - len(to_add),
+        )
+
+        start = time.monotonic()
+        add_outcomes = [
+            self._add_chunk(group_id, chunk) for chunk in self.chunks(to_add, 30)
+        ]
+        timings["add"] = time.monotonic() - start
+
+        start = time.monotonic()
+        remove_report = BatchExecutor(max_workers).run(
+            lambda email: self.zoom.send(
+                "delete", "groups/" + group_id + "/members/" + current[email], ""
+            ),
+            to_remove,
+        )
+        timings["remove"] = time.monotonic() - start
+
+        failed = [x for x in add_outcomes if not x.ok] + remove_report.failed
+
+        return {
+            "added": [
+                email
+                for outcome in add_outcomes
+                if outcome.ok
+                for email in outcome.item
+            ],
+            "removed": [x.item for x in remove_report if x.ok],
+            "unchanged": len(desired) - len(to_add),
+            "failed": [x.as_dict() for x in failed],
+            "timings": timings,
+        }
+
+
+class AsyncGroup(GroupBase):
+    """
+    zoom_client group class with awaitable versions of the add_members and
+    delete_members Group methods, for use with AsyncClient
+    """
+
+    async def add_members(self, group_id, user_emails):
+        """Add members to Zoom group in batch by list of user emails"""
+        logging.info("Adding %s users to group with id %s", len(user_emails), group_id)
+
+        results = await asyncio.gather(
+            *(
+                self.zoom.do_request(
+                    "post",
+                    "groups/" + group_id + "/members",
+                    "",
+                    body=json.dumps({"members": [{"email": x} for x in chunk]}),
+                )
+                for chunk in self.chunks(user_emails, 30)
+            )
+        )
+
+        return results[-1] if results else None
+
+    async def delete_members(self, group_id, user_ids):
+        """Delete members from Zoom group concurrently by list of userid's"""
+        logging.info("Removing %s users from group with id %s", len(user_ids), group_id)
+
+        results = await asyncio.gather(
+            *(
+                self.zoom.do_request(
+                    "delete", "groups/" + group_id + "/members/" + user_id, ""
+                )
+                for user_id in user_ids
+            )
+        )
+
+        return results[-1] if results else None
@@ -1,18 +1,44 @@
 """
 zoom_client class and related methods for gathering data from reports
 """
+import asyncio
 import logging
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 
+from zoom_client.daily_report import DailySeries, month_is_closed, months_between
+from zoom_client.pagination import check_page
 
-class Report:
+# concurrent requests made when fetching a range of months
+DEFAULT_MONTH_WORKERS = 4
+
+
+class ReportBase:
     """
-    zoom_client report class for gathering data from reports
+    zoom_client base of the Report and AsyncReport classes, holding the parts
+    which make no requests
     """
 
     def __init__(self, client):
         self.zoom = client
 
+        # daily reports of closed months never change, keep them for good
+        self.closed_months = {}
+
+    @staticmethod
+    def _range_months(start, end):
+        start, end = date.fromisoformat(start), date.fromisoformat(end)
+        if start > end:
+            raise ValueError(f"Report range starts after it ends: {start} > {end}")
+
+        return start, end, months_between(start, end)
+
+
+class Report(ReportBase):
+    """
+    zoom_client report class for gathering data from reports
+    """
+
     def get_daily_report_current_month(self):
         """
         Finds Zoom daily report information for current month
@@ -68,3 +94,126 @@ class Report:
                 return item
 
         return {}
+
+    def _get_month(self, month):
+        if month in self.closed_months:
+            return self.closed_months[month]
+
+        year, month_number = month
+        logging.info("Gathering daily report data from %s/%s", month_number, year)
+
+        days = check_page(
+            self.zoom.do_request(
+                "get",
+                "report/daily",
+                {"year": str(year), "month": str(month_number)},
+            ),
+            "dates",
+        )["dates"]
+
+        if month_is_closed(year, month_number):
+            self.closed_months[month] = days
+
+        return days
+
+    def get_daily_report_range(self, start, end, max_workers=DEFAULT_MONTH_WORKERS):
+        """
+        Finds Zoom daily report information for a range of dates, fetching
+        the months covered concurrently. Closed months are kept by the
+        Report and only ever requested once.
+
+        params:
+            start: first date of the range ("2021-01-01")
+            end: last date of the range, inclusive ("2021-12-31")
+            max_workers: number of months requested concurrently
+
+        returns:
+            DailySeries of the dates in the range, with weekly() and
+            monthly() rollups of meetings, participants and meeting_minutes
+        """
+        start, end, months = self._range_months(start, end)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            month_days = list(executor.map(self._get_month, months))
+
+        return DailySeries(
+            day
+            for days in month_days
+            for day in days
+            if start.isoformat() <= day["date"] <= end.isoformat()
+        )
+
+
+class AsyncReport(ReportBase):
+    """
+    zoom_client report class with awaitable versions of the Report methods,
+    for use with AsyncClient
+    """
+
+    async def get_daily_report_current_month(self):
+        """Finds Zoom daily report information for current month"""
+        year = str(int(datetime.now().strftime("%Y")))
+        month = str(int(datetime.now().strftime("%m")))
+
+        logging.info("Gathering daily report data from %s/%s", month, year)
+
+        return await self.zoom.do_request(
+            "get", "report/daily", {"year": year, "month": month}
+        )
+
+    async def get_daily_report_yesterday(self):
+        """Finds Zoom daily report information for yesterday"""
+        yesterday = datetime.now() - timedelta(1)
+        yesterday_str = yesterday.strftime("%Y-%m-%d")
+
+        year = str(int(yesterday.strftime("%Y")))
+        month = str(int(yesterday.strftime("%m")))
+
+        result = await self.zoom.do_request(
+            "get", "report/daily", {"year": year, "month": month}
+        )
+
+        for item in result["dates"]:
+            if item["date"] == yesterday_str:
+                return item
+
+        return {}
+
+    async def _get_month_async(self, month, semaphore):
+        if month in self.closed_months:
+            return self.closed_months[month]
+
+        year, month_number = month
+        async with semaphore:
+            result = await self.zoom.do_request(
+                "get",
+                "report/daily",
+                {"year": str(year), "month": str(month_number)},
+            )
+        days = check_page(result, "dates")["dates"]
+
+        if month_is_closed(year, month_number):
+            self.closed_months[month] = days
+
+        return days
+
+    async def get_daily_report_range(
+        self, start, end, max_workers=DEFAULT_MONTH_WORKERS
+    ):
+        """
+        Finds Zoom daily report information for a range of dates, fetching
+        the months covered concurrently, see Report.get_daily_report_range
+        """
+        start, end, months = self._range_months(start, end)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        month_days = await asyncio.gather(
+            *(self._get_month_async(month, semaphore) for month in months)
+        )
+
+        return DailySeries(
+            day
+            for days in month_days
+            for day in days
+            if start.isoformat() <= day["date"] <= end.isoformat()
+        )
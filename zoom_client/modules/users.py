@@ -2,12 +2,28 @@
 zoom_client class and related methods for gathering data about or
 changing properties of existing Zoom users
 """
+import asyncio
+import copy
 import json
 import logging
 import time
-from datetime import datetime
-
-from ratelimit import limits, sleep_and_retry
+from collections import Counter
+
+from zoom_client.batch import (
+    DEFAULT_MAX_WORKERS,
+    BatchExecutor,
+    BatchReport,
+    outcome_from_response,
+)
+from zoom_client.exceptions import ZoomAPIError
+from zoom_client.pagination import (
+    check_page,
+    iter_numbered_pages,
+    iter_numbered_pages_concurrently,
+    iter_unique,
+)
+from zoom_client.store import SyncDiff
+from zoom_client.user_table import UserTable
 
 
 class Users:
@@ -34,49 +50,43 @@ class Users:
 
         return result
 
-    def batch_update_users(self, user_list, update_properties=json.dumps({})):
-        """Update Zoom user properties in batch using provided list of userid's"""
-        number_users_updated = 0
-        time_interval_request_count = 0
-        start_time_interval = datetime.now()
-
-        for user_id in user_list:
-            resp = self.update_user(user_id, update_properties)
-            time_interval_request_count += 1
-
-            if resp.status_code == 204:
-                logging.info("Updated user %s successfully.", user_id)
-                number_users_updated += 1
-
-            # update the current time interval to accoutn for time restrictions in Zoom API
-            cur_time_interval = datetime.now()
+    def batch_update_users(
+        self,
+        user_list,
+        update_properties=json.dumps({}),
+        max_workers=DEFAULT_MAX_WORKERS,
+        max_error_rate=None,
+    ):
+        """
+        Update Zoom user properties concurrently using provided list of userid's
+
+        params:
+            user_list: list of Zoom userid's to update
+            update_properties: json string of properties to update
+            max_workers: number of updates made concurrently
+            max_error_rate: fraction (0-1) of failed updates at which the batch
+                stops, None to always attempt every user
+
+        returns:
+            BatchReport with the outcome (status code, error, attempts,
+            latency) of each user's update
+        """
+        logging.info(
+            "Updating %s users with properties: %s", len(user_list), update_properties
+        )
 
-            # Check to see if less than a second has passed and 10 requests have already been made
-            # If so, sleep for the remaining time until the next second begins
-            if (
-                cur_time_interval - start_time_interval
-            ).seconds < 1 and time_interval_request_count == 10:
-                logging.info(
-                    "Waiting to ensure Zoom request time restrictions are met."
-                )
-                time.sleep(
-                    (1 / 1000000)
-                    * (
-                        1000000
-                        - (cur_time_interval - start_time_interval).microseconds
-                        + 1000
-                    )
-                )
-                start_time_interval = datetime.now()
-                time_interval_request_count = 1
+        report = BatchExecutor(max_workers, max_error_rate).run(
+            lambda user_id: self.zoom.send(
+                "patch", "users/" + user_id, "", body=update_properties
+            ),
+            user_list,
+        )
 
-            # Else, if greater than a second has passed reset values to begin time
-            # restriction counts again.
-            elif (cur_time_interval - start_time_interval).seconds >= 1:
-                start_time_interval = datetime.now()
-                time_interval_request_count = 1
+        logging.info(
+            "Updated %s of %s users successfully.", report.succeeded, len(user_list)
+        )
 
-        return number_users_updated
+        return report
 
     def delete_user(self, user_id):
         """Delete single Zoom user by userid"""
@@ -88,144 +98,319 @@ class Users:
 
         return result
 
-    def batch_delete_users(self, user_list):
-        """Delete Zoom users in batch based on provided list of userid's"""
-        number_users_deprovisioned = 0
-        time_interval_request_count = 0
-        start_time_interval = datetime.now()
+    def batch_delete_users(
+        self, user_list, max_workers=DEFAULT_MAX_WORKERS, max_error_rate=None
+    ):
+        """
+        Delete Zoom users concurrently based on provided list of userid's
+
+        params:
+            user_list: list of Zoom userid's to delete
+            max_workers: number of deletions made concurrently
+            max_error_rate: fraction (0-1) of failed deletions at which the batch
+                stops, None to always attempt every user
+
+        returns:
+            BatchReport with the outcome (status code, error, attempts,
+            latency) of each user's deletion
+        """
+        report = BatchExecutor(max_workers, max_error_rate).run(
+            lambda user_id: self.zoom.send(
+                "delete", "users/" + user_id, {"action": "delete"}
+            ),
+            user_list,
+        )
 
-        for user_id in user_list:
+        logging.info(
+            "Deprovisioned %s of %s users successfully.",
+            report.succeeded,
+            len(user_list),
+        )
+
+        return report
 
-            resp = self.delete_user(user_id)
-            time_interval_request_count += 1
+    def _iter_user_pages(self, page_size, max_workers, fields=None):
+        params = {"page_size": str(page_size)}
 
-            if resp.status_code == 204:
-                logging.info("Deprovisioned user %s successfully.", user_id)
-                number_users_deprovisioned += 1
+        if max_workers:
+            return iter_numbered_pages_concurrently(
+                self.zoom, "users", params, "users", max_workers, fields=fields
+            )
 
-            # update the current time interval to accoutn for time restrictions in Zoom API
-            cur_time_interval = datetime.now()
+        return iter_numbered_pages(self.zoom, "users", params, "users", fields=fields)
+
+    def iter_users(self, page_size=300, max_workers=None, fields=None):
+        """
+        Iterate over current Zoom user data from account page by page
+
+        params:
+            page_size: number of users requested per page
+            max_workers: when provided, the first page is requested and then
+                the remaining pages are requested concurrently by this many
+                workers, still yielding users in page order
+            fields: optional user fields to keep (id is always kept), each
+                page is then streamed and decoded one user at a time
+
+        returns:
+            generator of user dictionaries deduplicated by user id (records
+            may shift between pages while users are added or removed),
+            raising ZoomAPIError on api errors
+        """
+        logging.info("Gathering current Zoom user data ...")
 
-            # Check to see if less than a second has passed and 10 requests have already been made
-            # If so, sleep for the remaining time until the next second begins
-            if (
-                cur_time_interval - start_time_interval
-            ).seconds < 1 and time_interval_request_count == 10:
+        def log_pages(pages):
+            for page in pages:
                 logging.info(
-                    "Waiting to ensure Zoom request time restrictions are met."
-                )
-                time.sleep(
-                    (1 / 1000000)
-                    * (
-                        1000000
-                        - (cur_time_interval - start_time_interval).microseconds
-                        + 1000
-                    )
+                    "Received user page %s of %s",
+                    page["page_number"],
+                    page["page_count"],
                 )
-                start_time_interval = datetime.now()
-                time_interval_request_count = 1
+                yield from page["users"]
 
-            # Else, if greater than a second has passed reset values to begin time
-            # restriction counts again.
-            elif (cur_time_interval - start_time_interval).seconds >= 1:
-                start_time_interval = datetime.now()
-                time_interval_request_count = 1
+        if fields is not None:
+            fields = tuple(dict.fromkeys(("id", *fields)))
 
-        return number_users_deprovisioned
+        yield from iter_unique(
+            log_pages(self._iter_user_pages(page_size, max_workers, fields))
+        )
 
-    def get_current_users(self):
-        """Gather current Zoom user data from account"""
-        logging.info("Gathering current Zoom user data ...")
+    def get_current_users(self, max_workers=None):
+        """
+        Gather current Zoom user data from account
 
-        # Note: artificial rate limit
-        # more detail can be found here:
-        # https://marketplace.zoom.us/docs/api-reference/rate-limits#rate-limits
-        @sleep_and_retry
-        @limits(calls=60, period=5)
-        def make_requests(
-            page_number: int = 1, page_count: int = 0, result_list: list = []
-        ) -> list:
-
-            logging.info("Making user request %s of %s", page_number, page_count)
-            # make the Zoom api request and parse the result for the data we need
-            result = self.zoom.do_request(
-                "get", "users", {"page_size": "300", "page_number": page_number}
-            )
+        params:
+            max_workers: when provided, pages after the first are requested
+                concurrently by this many workers
+        """
+        users_listing = list(self.iter_users(max_workers=max_workers))
 
-            # if no users are returned in the result, we break our loop
-            if "users" in result.keys():
-                user_results = result["users"]
-                result_list += user_results
+        self.zoom.model["users"] = users_listing
 
-            page_number += 1
+        return users_listing
 
-            if page_number <= int(result["page_count"]):
-                make_requests(
-                    page_number=page_number,
-                    page_count=result["page_count"],
-                    result_list=result_list,
-                )
+    def sync_store(self, store, max_workers=None):
+        """
+        Incrementally refresh a UserStore from the current account listing,
+        only changing the stored users which were added, changed or removed
 
-            return result_list
+        params:
+            store: zoom_client.store.UserStore to refresh (saved afterwards
+                when it has a path)
+            max_workers: when provided, user pages after the first are
+                requested concurrently by this many workers
 
-        users_listing = make_requests()
+        returns:
+            SyncDiff of the added, changed and removed user ids
+        """
+        diff = store.reconcile(self.iter_users(max_workers=max_workers))
 
-        self.zoom.model["users"] = users_listing
+        logging.info(
+            "User store synced: %s added, %s changed, %s removed",
+            len(diff.added),
+            len(diff.changed),
+            len(diff.removed),
+        )
 
-        return users_listing
+        if store.path:
+            store.save()
+
+        return diff
+
+    def refresh_store_users(self, store, user_ids):
+        """
+        Refresh only the given users of a UserStore (for example users known
+        to have changed), removing users which no longer exist
+
+        params:
+            store: zoom_client.store.UserStore to refresh
+            user_ids: ids of the users to request
+
+        returns:
+            SyncDiff of the added, changed and removed user ids
+        """
+        diff = SyncDiff()
+
+        for user_id in user_ids:
+            result = self.zoom.do_request("get", "users/" + user_id, {})
+
+            if isinstance(result, dict) and "id" in result:
+                change = store.upsert(result)
+                if change:
+                    getattr(diff, change).append(user_id)
+            elif isinstance(result, dict) and result.get("code") == 1001:
+                if store.remove(user_id):
+                    diff.removed.append(user_id)
+            else:
+                raise ZoomAPIError.from_result(result)
+
+        if store.path:
+            store.save()
+
+        return diff
 
     def get_users_from_list(self, user_list):
         """Gather user data based on list of Zoom userid's provided"""
         logging.info("Gathering current Zoom user data from list...")
 
-        result_list = []
+        # each distinct user is requested once, repeats share its result
+        results = {
+            user: self.zoom.do_request("get", "users/" + user, {"userId": user})
+            for user in dict.fromkeys(user_list)
+        }
+        # repeats get their own copy so changing one entry leaves the others
+        result_list, seen = [], set()
         for user in user_list:
-            result = self.zoom.client.do_request(
-                "get", "users/" + user, {"userId": user}
-            )
-            result_list.append(result)
+            result = results[user]
+            result_list.append(copy.deepcopy(result) if user in seen else result)
+            seen.add(user)
 
         self.zoom.model["users"] = result_list
 
         return result_list
 
+    def get_user_table(self, max_workers=None):
+        """
+        Gather current Zoom user data from account into a compact columnar
+        UserTable, without holding every user dictionary in memory
+
+        params:
+            max_workers: when provided, user pages after the first are
+                requested concurrently by this many workers
+
+        returns:
+            zoom_client.user_table.UserTable of current users
+        """
+        table = UserTable.from_users(self.iter_users(max_workers=max_workers))
+
+        self.zoom.model["user_table"] = table
+
+        return table
+
     def get_current_user_type_counts(self):
         """Gather current user type counts from Zoom account"""
         logging.info("Gathering current Zoom user metrics...")
 
-        # create various counts which will help provide metrics
-        pro_account_count = 0
-        basic_account_count = 0
-        corp_account_count = 0
-        account_count = 0
-
+        # counts are computed without changing the gathered user data
+        type_counts = Counter(
+            user_data["type"] for user_data in self.zoom.model["users"]
+        )
         account_count = len(self.zoom.model["users"])
 
-        for user_data in self.zoom.model["users"]:
-
-            # change type from integer to human-readable value
-            # also make counts of the number of accounts per type
-            if user_data["type"] == 1:
-                basic_account_count += 1
-                user_data["type"] = "Basic"
-            elif user_data["type"] == 2:
-                pro_account_count += 1
-                user_data["type"] = "Pro"
-            elif user_data["type"] == 3:
-                corp_account_count += 1
-                user_data["type"] = "Corp"
-
         # Share various metrics with the user on
         # total, basic, pro and deprovisioning information to better
         # inform them before proceeding.
         logging.info("Total accounts: %s", account_count)
-        logging.info("Basic accounts: %s", basic_account_count)
-        logging.info("Pro accounts: %s", pro_account_count)
-        logging.info("Corp accounts: %s", corp_account_count)
+        logging.info("Basic accounts: %s", type_counts[1])
+        logging.info("Pro accounts: %s", type_counts[2])
+        logging.info("Corp accounts: %s", type_counts[3])
 
         return {
-            "Basic Accounts": basic_account_count,
-            "Pro Accounts": pro_account_count,
-            "Corp Accounts": corp_account_count,
+            "Basic Accounts": type_counts[1],
+            "Pro Accounts": type_counts[2],
+            "Corp Accounts": type_counts[3],
             "Total Accounts": account_count,
         }
+
+
+class AsyncUsers:
+    """
+    zoom_client users class with awaitable versions of the request making
+    Users methods (updates, deletions and listings), for use with AsyncClient
+    """
+
+    def __init__(self, client):
+        self.zoom = client
+
+    async def update_user(self, user_id, update_properties=json.dumps({})):
+        """Update single Zoom user property by userid"""
+        logging.info(
+            "Updating user with ID: %s with properties: %s", user_id, update_properties
+        )
+
+        return await self.zoom.do_request(
+            "patch", "users/" + user_id, "", body=update_properties
+        )
+
+    async def _run_batch(self, func, user_list):
+        start = time.monotonic()
+
+        async def timed(user_id):
+            began = time.monotonic()
+            rsp = await func(user_id)
+            return outcome_from_response(user_id, rsp, time.monotonic() - began)
+
+        outcomes = await asyncio.gather(*(timed(user_id) for user_id in user_list))
+
+        return BatchReport(list(outcomes), elapsed=time.monotonic() - start)
+
+    async def batch_update_users(self, user_list, update_properties=json.dumps({})):
+        """Update Zoom user properties concurrently using provided list of userid's"""
+        return await self._run_batch(
+            lambda user_id: self.zoom.send(
+                "patch", "users/" + user_id, "", body=update_properties
+            ),
+            user_list,
+        )
+
+    async def delete_user(self, user_id):
+        """Delete single Zoom user by userid"""
+        logging.info("Deleting user with ID: %s", user_id)
+
+        return await self.zoom.do_request(
+            "delete", "users/" + user_id, {"action": "delete"}
+        )
+
+    async def batch_delete_users(self, user_list):
+        """Delete Zoom users concurrently based on provided list of userid's"""
+        return await self._run_batch(
+            lambda user_id: self.zoom.send(
+                "delete", "users/" + user_id, {"action": "delete"}
+            ),
+            user_list,
+        )
+
+    async def get_current_users(self):
+        """Gather current Zoom user data from account, requesting all pages
+        after the first concurrently; raises ZoomAPIError on api errors"""
+        logging.info("Gathering current Zoom user data ...")
+
+        async def make_request(page_number):
+            return check_page(
+                await self.zoom.do_request(
+                    "get", "users", {"page_size": "300", "page_number": page_number}
+                ),
+                "users",
+            )
+
+        first = await make_request(1)
+        pages = [first] + list(
+            await asyncio.gather(
+                *(
+                    make_request(page_number)
+                    for page_number in range(2, int(first.get("page_count", 1)) + 1)
+                )
+            )
+        )
+
+        users_listing = [user for page in pages for user in page["users"]]
+
+        self.zoom.model["users"] = users_listing
+
+        return users_listing
+
+    async def get_users_from_list(self, user_list):
+        """Gather user data concurrently based on list of Zoom userid's provided"""
+        logging.info("Gathering current Zoom user data from list...")
+
+        result_list = list(
+            await asyncio.gather(
+                *(
+                    self.zoom.do_request("get", "users/" + user, {"userId": user})
+                    for user in user_list
+                )
+            )
+        )
+
+        self.zoom.model["users"] = result_list
+
+        return result_list
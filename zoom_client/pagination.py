@@ -0,0 +1,183 @@
+"""
+zoom_client generators which iterate over paginated Zoom API listings
+one page at a time with constant stack depth
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from zoom_client.exceptions import ZoomAPIError
+
+
+def check_page(result, records_key):
+    """
+    Ensure a do_request result is a page of records
+
+    params:
+        result: result of Client.do_request
+        records_key: key of the records array in the page (such as "users")
+
+    returns:
+        the page, raising ZoomAPIError when the api returned an error
+    """
+    if not isinstance(result, dict) or records_key not in result:
+        raise ZoomAPIError.from_result(result)
+
+    return result
+
+
+def get_page(zoom, resource, params, records_key, fields=None):
+    """
+    Request a page of records
+
+    params:
+        zoom: Client used to make the request
+        resource: api resource path of the listing
+        params: query string parameters of the page
+        records_key: key of the records array in the page
+        fields: optional record fields to keep; when provided the page is
+            streamed and its records decoded one at a time (see
+            Client.stream_page) rather than decoded all at once
+
+    returns:
+        the page, raising ZoomAPIError when the api returned an error
+    """
+    if fields is not None:
+        return zoom.stream_page(resource, params, records_key, fields)
+
+    return check_page(zoom.do_request("get", resource, params), records_key)
+
+
+# pylint: disable=too-many-arguments
+def iter_token_pages(
+    zoom, resource, params, records_key, next_page_token=None, fields=None
+):
+    """
+    Iterate over the pages of a next_page_token paginated listing
+
+    params:
+        zoom: Client used to make the requests
+        resource: api resource path of the listing
+        params: query string parameters sent with every request
+        records_key: key of the records array in each page
+        next_page_token: token of the page to begin with, None for the first page
+        fields: optional record fields to keep, streaming each page
+
+    returns:
+        generator of page dictionaries
+
+    Whole chains of unstreamed pages are kept in the client's response cache
+    (when it has one) and replayed from it rather than requested again.
+    """
+    # chains are only cached from their first page, streamed pages never are
+    cache = getattr(zoom, "cache", None)
+    if next_page_token is not None or fields is not None:
+        cache = None
+    elif cache is not None and cache.rule_for(resource) is None:
+        cache = None
+
+    if cache is not None:
+        pages = cache.get_chain(resource, params)
+        if pages is not None:
+            yield from pages
+            return
+
+    pages = []
+    while True:
+        page = get_page(
+            zoom,
+            resource,
+            dict(params, next_page_token=next_page_token),
+            records_key,
+            fields,
+        )
+        if cache is not None:
+            pages.append(page)
+
+        yield page
+
+        next_page_token = page.get("next_page_token")
+        if not next_page_token:
+            break
+
+    if cache is not None:
+        cache.set_chain(resource, params, pages)
+
+
+def iter_numbered_pages(
+    zoom, resource, params, records_key, page_number=1, fields=None
+):
+    """
+    Iterate over the pages of a page_number paginated listing
+
+    params:
+        zoom: Client used to make the requests
+        resource: api resource path of the listing
+        params: query string parameters sent with every request
+        records_key: key of the records array in each page
+        page_number: number of the page to begin with
+        fields: optional record fields to keep, streaming each page
+
+    returns:
+        generator of page dictionaries
+    """
+    while True:
+        page = get_page(
+            zoom, resource, dict(params, page_number=page_number), records_key, fields
+        )
+
+        yield page
+
+        if page_number >= int(page.get("page_count") or 0):
+            return
+
+        page_number += 1
+
+
+def iter_numbered_pages_concurrently(
+    zoom, resource, params, records_key, max_workers, fields=None
+):
+    """
+    Iterate over the pages of a page_number paginated listing, requesting
+    the first page and then all remaining pages concurrently
+
+    params:
+        zoom: Client used to make the requests
+        resource: api resource path of the listing
+        params: query string parameters sent with every request
+        records_key: key of the records array in each page
+        max_workers: number of pages requested concurrently
+        fields: optional record fields to keep, streaming each page
+
+    returns:
+        generator of page dictionaries in page order
+    """
+
+    def fetch(page_number):
+        return get_page(
+            zoom, resource, dict(params, page_number=page_number), records_key, fields
+        )
+
+    first = fetch(1)
+    yield first
+
+    page_count = int(first.get("page_count") or 0)
+    if page_count <= 1:
+        return
+
+    # pacing is left to the client's rate limit scheduler shared by all workers
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(fetch, range(2, page_count + 1))
+
+
+def iter_records(pages, records_key):
+    """Iterate over the records of each page in turn"""
+    for page in pages:
+        yield from page[records_key]
+
+
+def iter_unique(records, key="id"):
+    """Iterate over records skipping any whose key was already seen"""
+    seen = set()
+    for record in records:
+        if record[key] not in seen:
+            seen.add(record[key])
+            yield record
@@ -0,0 +1,349 @@
+"""
+zoom_client request cost planner projecting the requests, rate limit pacing
+and completion time of bulk operations before they are run, and splitting
+operations into windows which each finish within a time budget
+"""
+import math
+from datetime import date, datetime, timedelta, timezone
+from itertools import accumulate
+
+from zoom_client.batch import DEFAULT_MAX_WORKERS
+from zoom_client.scheduler import DEFAULT_RATE_LIMITS, classify
+
+# seconds a request is assumed to take when no latency has been observed
+DEFAULT_LATENCY = 0.25
+
+# records per page of listings and members added per request
+PAGE_SIZE = 300
+MEMBER_CHUNK = 30
+
+# listing sizes assumed when the caller has no better estimate
+DEFAULT_MEETINGS_PER_DAY = 300
+DEFAULT_PARTICIPANTS_PER_MEETING = 30
+
+
+def pages(records):
+    """Number of requests needed to list records (at least one)"""
+    return max(1, math.ceil(records / PAGE_SIZE))
+
+
+def user_requests(method):
+    """requests of a batch making one request per user id"""
+    return lambda user_ids: [[(method, "users/" + x)] for x in user_ids]
+
+
+def add_members_requests(user_emails, group_id="{groupId}"):
+    """requests of Group.add_members, one per chunk of 30 emails"""
+    return [
+        [("post", "groups/" + group_id + "/members")] if i % MEMBER_CHUNK == 0 else []
+        for i in range(len(user_emails))
+    ]
+
+
+def delete_members_requests(user_ids, group_id="{groupId}"):
+    """requests of Group.delete_members, one per member"""
+    return [[("delete", "groups/" + group_id + "/members/" + x)] for x in user_ids]
+
+
+def past_meetings_requests(days, meetings_per_day=DEFAULT_MEETINGS_PER_DAY):
+    """requests of Dashboard.get_past_meetings over consecutive days"""
+    return [
+        [("get", "metrics/meetings")]
+        * (
+            pages((i + 1) * meetings_per_day)
+            - (pages(i * meetings_per_day) if i else 0)
+        )
+        for i in range(len(days))
+    ]
+
+
+def participants_requests(
+    meeting_uuids, participants_per_meeting=DEFAULT_PARTICIPANTS_PER_MEETING
+):
+    """requests of Dashboard.iter_participants_bulk"""
+    return [
+        [("get", "metrics/meetings/" + x + "/participants")]
+        * pages(participants_per_meeting)
+        for x in meeting_uuids
+    ]
+
+
+# bulk operations by name: function returning the requests made for each
+# input item (so the requests of any leading items are those of running the
+# operation on them alone) and whether items are handled concurrently
+OPERATIONS = {
+    "batch_update_users": (user_requests("patch"), True),
+    "batch_delete_users": (user_requests("delete"), True),
+    "add_members": (add_members_requests, False),
+    "delete_members": (delete_members_requests, False),
+    "get_past_meetings": (past_meetings_requests, False),
+    "iter_participants_bulk": (participants_requests, True),
+}
+
+
+def days_between(from_date, to_date):
+    """List the dates ("%Y-%m-%d") from from_date to to_date inclusive"""
+    start, end = date.fromisoformat(from_date), date.fromisoformat(to_date)
+
+    return [
+        (start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)
+    ]
+
+
+def dry_run_requests(client):
+    """
+    List the requests recorded by a dry run client (config "dry_run": True)
+
+    returns:
+        list of (method, resource) tuples in the order they were made
+    """
+    root = client.config_data["root_request_url"]
+
+    return [(x["method"], x["url"][len(root) :]) for x in client.transport.requests]
+
+
+class RequestPlan:
+    """
+    zoom_client projection of the requests a bulk operation makes and the
+    time they take under the rate limits of each Zoom rate limit category
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        operation,
+        items,
+        item_requests,
+        concurrent,
+        limits,
+        latency,
+        max_workers,
+        options=None,
+    ):
+        """
+        params:
+            operation: name of the bulk operation
+            items: input items of the operation (user ids, emails, days...)
+            item_requests: list of the (method, resource) requests of each item
+            concurrent: True when items are handled by max_workers threads
+            limits: dict of category to (calls, period) rate limits
+            latency: seconds each request is expected to take
+            max_workers: number of concurrent workers
+            options: operation specific options the requests were planned with
+        """
+        self.operation = operation
+        self.items = list(items)
+        self.options = options or {}
+        self.item_requests = item_requests
+        self.concurrent = concurrent
+        self.limits = limits
+        self.latency = latency
+        self.max_workers = max_workers
+
+        # running totals of requests per category over the items, so the
+        # time taken by any number of leading items is found at once
+        categories = [
+            [classify(method, resource) for method, resource in requests]
+            for requests in item_requests
+        ]
+        self._totals = {
+            category: [0, *accumulate(x.count(category) for x in categories)]
+            for category in limits
+        }
+
+    @property
+    def requests(self):
+        """List of (method, resource) requests in the order they are made"""
+        return [request for requests in self.item_requests for request in requests]
+
+    def counts(self, items=None):
+        """Number of requests per rate limit category of the leading items"""
+        items = len(self.items) if items is None else items
+
+        return {
+            category: totals[items]
+            for category, totals in self._totals.items()
+            if totals[items]
+        }
+
+    def pacing(self, items=None):
+        """
+        Seconds each rate limit category paces its requests of the leading
+        items for, requests within a category's burst not being held back
+        """
+        return {
+            category: max(count - self.limits[category][0], 0)
+            * self.limits[category][1]
+            / self.limits[category][0]
+            for category, count in self.counts(items).items()
+        }
+
+    def duration(self, items=None):
+        """
+        Projected seconds to complete the leading items (all by default),
+        the slower of rate limit pacing and request latency over the workers
+        """
+        workers = self.max_workers if self.concurrent else 1
+        requests = sum(self.counts(items).values())
+
+        return max([*self.pacing(items).values(), requests * self.latency / workers])
+
+    def completion(self, start=None):
+        """Projected completion time of the operation started at start (now)"""
+        start = start or datetime.now(timezone.utc)
+
+        return start + timedelta(seconds=self.duration())
+
+    def schedule(self, start=None):
+        """
+        Project the schedule of the operation
+
+        params:
+            start: datetime the operation starts at, defaults to now
+
+        returns:
+            dictionary of the operation, items, requests, per category
+            requests and pacing seconds, workers, duration seconds and the
+            start and completion times
+        """
+        start = start or datetime.now(timezone.utc)
+        pacing = self.pacing()
+
+        return {
+            "operation": self.operation,
+            "items": len(self.items),
+            "requests": sum(self.counts().values()),
+            "categories": {
+                category: {"requests": count, "pacing": pacing[category]}
+                for category, count in self.counts().items()
+            },
+            "workers": self.max_workers if self.concurrent else 1,
+            "duration": self.duration(),
+            "start": start.isoformat(),
+            "completion": self.completion(start).isoformat(),
+        }
+
+
+class RequestPlanner:
+    """
+    zoom_client planner of bulk operations, counting the requests each makes
+    (chunking, pagination estimates) and projecting how long they take
+    """
+
+    def __init__(
+        self, rate_limits=None, latency=DEFAULT_LATENCY, max_workers=DEFAULT_MAX_WORKERS
+    ):
+        """
+        params:
+            rate_limits: optional dict of category to (calls, period) overriding
+                DEFAULT_RATE_LIMITS
+            latency: seconds each request is expected to take
+            max_workers: workers of concurrent operations unless planned otherwise
+        """
+        self.limits = dict(DEFAULT_RATE_LIMITS)
+        self.limits.update(rate_limits or {})
+        self.latency = latency
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_client(cls, client, **kwargs):
+        """
+        Build a planner using a client's current rate limits (as adapted from
+        X-RateLimit headers) and the mean latency of the requests it has made
+        """
+        limits = {
+            category: (bucket.capacity, bucket.capacity / bucket.rate)
+            for category, bucket in client.scheduler.buckets.items()
+        }
+
+        endpoints = client.metrics.snapshot()["endpoints"].values()
+        requests = sum(x["requests"] for x in endpoints)
+        if requests and "latency" not in kwargs:
+            kwargs["latency"] = sum(x["latency_sum"] for x in endpoints) / requests
+
+        return cls(limits, **kwargs)
+
+    def plan(self, operation, items, max_workers=None, **options) -> RequestPlan:
+        """
+        Plan a bulk operation
+
+        params:
+            operation: name of the operation, one of OPERATIONS
+            items: input items, such as the user ids of batch_delete_users,
+                the emails of add_members or the days of get_past_meetings
+            max_workers: workers of a concurrent operation
+            options: operation specific options, such as group_id, or the
+                meetings_per_day and participants_per_meeting estimates
+
+        returns:
+            RequestPlan of the operation
+        """
+        requests, concurrent = OPERATIONS[operation]
+        items = list(items)
+
+        return RequestPlan(
+            operation,
+            items,
+            requests(items, **options),
+            concurrent,
+            self.limits,
+            self.latency,
+            max_workers or self.max_workers,
+            options,
+        )
+
+    def plan_past_meetings(
+        self, from_date, to_date, meetings_per_day=DEFAULT_MEETINGS_PER_DAY
+    ):
+        """Plan Dashboard.get_past_meetings over a date range"""
+        return self.plan(
+            "get_past_meetings",
+            days_between(from_date, to_date),
+            meetings_per_day=meetings_per_day,
+        )
+
+    def rebalance(self, plan, budget, max_workers=None):
+        """
+        Split a planned operation into consecutive windows which are each
+        projected to finish within a time budget, raising the workers of a
+        concurrent operation (up to max_workers) before splitting it
+
+        params:
+            plan: RequestPlan of the operation
+            budget: seconds each window may take
+            max_workers: most workers a concurrent operation may use, None to
+                keep the workers planned
+
+        returns:
+            list of RequestPlan windows in item order; an item which cannot
+            finish within the budget on its own is given a window regardless
+        """
+        workers = plan.max_workers
+        if plan.concurrent and max_workers:
+            needed = math.ceil(len(plan.requests) * plan.latency / budget)
+            workers = min(max(workers, needed), max_workers)
+
+        windows = []
+        items = plan.items
+        while items:
+            window = self.plan(
+                plan.operation, items, max_workers=workers, **plan.options
+            )
+
+            # the largest number of leading items projected within the budget
+            low, high = 1, len(items)
+            while low < high:
+                middle = (low + high + 1) // 2
+                if window.duration(middle) <= budget:
+                    low = middle
+                else:
+                    high = middle - 1
+
+            windows.append(
+                self.plan(
+                    plan.operation, items[:low], max_workers=workers, **plan.options
+                )
+            )
+            items = items[low:]
+
+        return windows
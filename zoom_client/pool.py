@@ -0,0 +1,210 @@
+"""
+zoom_client pool of clients for several Zoom (sub-)accounts, running the same
+job for every account in parallel and merging the results by account
+"""
+import logging
+import operator
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from zoom_client.client import Client
+
+# clients of the accounts whose jobs ran in this (worker) process, kept so
+# later jobs of an account reuse its token, rate budget and connections
+_PROCESS_CLIENTS = {}
+
+
+def resolve_job(job):
+    """
+    Return a job as a callable taking the client as its first argument
+
+    params:
+        job: callable(client, *args, **kwargs) or the dotted name of a client
+            method ("users.get_current_users")
+    """
+    if callable(job):
+        return job
+
+    method = operator.attrgetter(job)
+
+    return lambda client, *args, **kwargs: method(client)(*args, **kwargs)
+
+
+def run_job(client, job, args, kwargs):
+    """
+    Run a job with a client, gathering a generator's records into a list so
+    the whole crawl happens in the worker (and can be sent between processes)
+    """
+    value = resolve_job(job)(client, *args, **kwargs)
+    if isinstance(value, Iterator):
+        value = list(value)
+
+    return value
+
+
+def _run_in_process(account, config_data, job, args, kwargs):
+    """run a job in a worker process with the account's process-local client"""
+    if account not in _PROCESS_CLIENTS:
+        _PROCESS_CLIENTS[account] = Client(config_data)
+
+    return run_job(_PROCESS_CLIENTS[account], job, args, kwargs)
+
+
+class PoolResult:
+    """
+    zoom_client results of a job run for each account of a ClientPool
+    """
+
+    def __init__(self, results, failed=None, elapsed=0.0):
+        """
+        params:
+            results: dict of account name to the value its job returned
+            failed: dict of account name to the exception its job raised
+            elapsed: seconds taken by the whole run
+        """
+        self.results = results
+        self.failed = failed or {}
+        self.elapsed = elapsed
+
+    def __iter__(self):
+        return iter(self.results.items())
+
+    def __len__(self):
+        return len(self.results)
+
+    def records(self, key="account"):
+        """
+        Merge the records returned for every account, tagging each record
+        with the account it came from
+
+        params:
+            key: name of the field the account name is stored in
+
+        returns:
+            list of record dictionaries, in account order
+        """
+        return [
+            dict(record, **{key: account})
+            for account, records in self.results.items()
+            for record in records
+        ]
+
+
+class ClientPool:
+    """
+    zoom_client pool of clients, one per Zoom account, each with its own
+    auth token, rate limit budget and connection pool. Jobs run for many
+    accounts at once on a thread pool, or on a process pool whose workers
+    build their own clients from the account configurations.
+    """
+
+    def __init__(self, accounts, max_workers=None, processes=False):
+        """
+        params:
+            accounts: dict of account name to its client config data
+            max_workers: number of accounts served at once, defaults to all
+            processes: run jobs in worker processes rather than threads;
+                jobs must then be method names or picklable (module level)
+                functions and their results picklable
+        """
+        self.accounts = dict(accounts)
+        self.max_workers = max_workers or max(len(self.accounts), 1)
+        self.processes = processes
+        self.clients = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    @classmethod
+    def from_config(cls, config_data, **kwargs):
+        """
+        Build a pool from config data holding an "accounts" dict of account
+        name to the keys specific to that account (api_key, api_secret,
+        rate_limits...), all other keys being shared by every account
+        """
+        shared = {k: v for k, v in config_data.items() if k != "accounts"}
+
+        return cls(
+            {
+                name: dict(shared, **account)
+                for name, account in config_data["accounts"].items()
+            },
+            **kwargs,
+        )
+
+    def client(self, account):
+        """Return the client of an account, created on first use"""
+        with self._lock:
+            if account not in self.clients:
+                self.clients[account] = Client(self.accounts[account])
+
+            return self.clients[account]
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self.processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        return self._executor
+
+    def _submit(self, account, job, args, kwargs):
+        if self.processes:
+            return self._get_executor().submit(
+                _run_in_process, account, self.accounts[account], job, args, kwargs
+            )
+
+        return self._get_executor().submit(
+            run_job, self.client(account), job, args, kwargs
+        )
+
+    def run(self, job, *args, accounts=None, **kwargs) -> PoolResult:
+        """
+        Run a job for each account in parallel, one job per account at a time
+        so each account's rate limit budget is kept
+
+        params:
+            job: callable(client, *args, **kwargs) or the dotted name of a client
+                method ("dashboard.get_past_meetings")
+            args: positional arguments passed to the job after the client
+            accounts: optional names of the accounts to run for, defaults to all
+            kwargs: keyword arguments passed to the job
+
+        returns:
+            PoolResult of each account's value, accounts whose job raised are
+            found in its `failed` dict of account name to exception
+        """
+        start = time.perf_counter()
+        futures = {
+            account: self._submit(account, job, args, kwargs)
+            for account in (self.accounts if accounts is None else accounts)
+        }
+
+        results, failed = {}, {}
+        for account, future in futures.items():
+            try:
+                results[account] = future.result()
+            except Exception as error:  # pylint: disable=broad-except
+                logging.error("Error: account %s job failed: %s", account, error)
+                failed[account] = error
+
+        return PoolResult(results, failed, time.perf_counter() - start)
+
+    def close(self):
+        """Shut down the worker pool and close the clients of every account"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+        with self._lock:
+            for client in self.clients.values():
+                client.close()
+            self.clients = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,236 @@
+"""
+zoom_client retry policy which resends throttled or failed Zoom API
+requests with jittered exponential backoff honoring Retry-After
+"""
+import logging
+import random
+import threading
+import time
+
+from zoom_client.metrics import endpoint_template
+from zoom_client.scheduler import classify, parse_retry_after
+
+# defaults used when the client configuration does not provide a value
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_MAX_BACKOFF = 60
+DEFAULT_MAX_RETRY_AFTER = 300
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = ("get", "delete")
+
+
+class RetryPolicy:
+    """
+    zoom_client policy deciding which responses are retried and how long
+    to wait before each retry
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        max_retries=DEFAULT_MAX_RETRIES,
+        backoff_factor=DEFAULT_BACKOFF_FACTOR,
+        max_backoff=DEFAULT_MAX_BACKOFF,
+        max_retry_after=DEFAULT_MAX_RETRY_AFTER,
+        retry_statuses=DEFAULT_RETRY_STATUSES,
+        methods=IDEMPOTENT_METHODS,
+    ):
+        """
+        params:
+            max_retries: retries made after the first attempt
+            backoff_factor: base seconds of the exponential backoff
+            max_backoff: largest backoff in seconds between attempts
+            max_retry_after: largest Retry-After in seconds that is waited for,
+                longer waits (such as daily limits) are returned to the caller
+            retry_statuses: http status codes which are retried
+            methods: http methods which are retried, PATCH and POST are not
+                idempotent and must be opted into
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = tuple(retry_statuses)
+        self.methods = tuple(method.lower() for method in methods)
+
+    @classmethod
+    def from_config(cls, config_data):
+        """Build a policy using optional "retry" settings from client config data"""
+        return cls(**config_data.get("retry", {}))
+
+    def should_retry(self, request_type, status_code, attempt, retry_after=None):
+        """
+        Decide whether a response should be retried
+
+        params:
+            request_type: http method of the request
+            status_code: response http status code
+            attempt: number of retries already made
+            retry_after: seconds requested by the Retry-After header, if any
+
+        returns:
+            True when the request should be sent again
+        """
+        return (
+            attempt < self.max_retries
+            and request_type.lower() in self.methods
+            and status_code in self.retry_statuses
+            and (retry_after is None or retry_after <= self.max_retry_after)
+        )
+
+    def backoff(self, attempt, retry_after=None):
+        """
+        Find seconds to wait before the next attempt
+
+        params:
+            attempt: number of retries already made
+            retry_after: seconds requested by the Retry-After header, if any
+
+        returns:
+            Retry-After when provided, otherwise a "full jitter" exponential backoff
+        """
+        if retry_after is not None:
+            return retry_after
+
+        ceiling = min(self.max_backoff, self.backoff_factor * 2**attempt)
+
+        # jitter is not used for security purposes
+        return random.uniform(0, ceiling)  # nosec B311
+
+
+class RetryStats:
+    """
+    zoom_client thread-safe counters of retries made by a client
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.retry_wait = 0.0
+        self.exhausted = 0
+
+    def record(self, retries, retry_wait, exhausted=False):
+        """Record the retries made while sending one request"""
+        with self._lock:
+            self.requests += 1
+            self.retries += retries
+            self.retry_wait += retry_wait
+            self.exhausted += int(exhausted)
+
+    def snapshot(self):
+        """Return the current counters as a dictionary"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "retry_wait": self.retry_wait,
+                "exhausted": self.exhausted,
+            }
+
+
+class RequestAttempts:
+    """
+    zoom_client bookkeeping of the attempts made to send one request, shared
+    by Client and AsyncClient: hook calls, rate limit updates, retry
+    decisions and retry statistics. The clients only send and wait.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self, client, request_type, resource, body=None, category=None, stream=False
+    ):
+        """
+        params:
+            client: Client or AsyncClient sending the request
+            request_type: http method of the request ("get", "post", ...)
+            resource: api resource path relative to the root request url
+            body: optional request body
+            category: optional rate limit category, found from the
+                request type and resource when not provided
+            stream: True when the response body is left unread
+        """
+        self.client = client
+        self.category = category or classify(request_type, resource)
+        self.attempt = 0
+        self.retry_wait = 0.0
+        self.info = {
+            "method": request_type,
+            "resource": resource,
+            "endpoint": endpoint_template(resource),
+            "category": self.category,
+            "attempt": 0,
+            "limiter_wait": 0.0,
+            "retry_wait": 0.0,
+            "request_bytes": len(body) if isinstance(body, (str, bytes)) else 0,
+            "stream": stream,
+        }
+        self._start = 0.0
+
+    def start(self, limiter_wait):
+        """
+        Begin an attempt once the rate limit scheduler allows it, calling
+        the request hooks
+
+        params:
+            limiter_wait: seconds spent waiting on the rate limit scheduler
+        """
+        self.info = dict(self.info, attempt=self.attempt, limiter_wait=limiter_wait)
+        for hook in self.client.request_hooks:
+            hook(self.info)
+
+        self._start = time.perf_counter()
+
+    def finish(self, rsp):
+        """
+        End an attempt with its response, calling the response hooks and
+        updating the rate limit scheduler
+
+        returns:
+            seconds to wait before retrying, None when the response is final
+        """
+        elapsed = time.perf_counter() - self._start
+        for hook in self.client.response_hooks:
+            hook(self.info, rsp, elapsed)
+
+        policy = self.client.retry_policy
+        self.client.scheduler.update(
+            self.category,
+            rsp.headers,
+            rsp.status_code,
+            max_pause=policy.max_retry_after,
+        )
+        retry_after = parse_retry_after(rsp.headers.get("Retry-After"))
+        if not policy.should_retry(
+            self.info["method"], rsp.status_code, self.attempt, retry_after
+        ):
+            self._done(rsp)
+            return None
+
+        delay = policy.backoff(self.attempt, retry_after)
+        logging.warning(
+            "Retrying %s %s after %s response in %.2f seconds",
+            self.info["method"],
+            self.info["resource"],
+            rsp.status_code,
+            delay,
+        )
+
+        self.attempt += 1
+        self.retry_wait += delay
+        self.info = dict(self.info, retry_wait=delay)
+
+        return delay
+
+    def _done(self, rsp):
+        policy = self.client.retry_policy
+
+        # expose retries made for this request to the caller
+        rsp.attempts = self.attempt + 1
+        rsp.retry_wait = self.retry_wait
+        self.client.retry_stats.record(
+            self.attempt,
+            self.retry_wait,
+            exhausted=self.attempt >= policy.max_retries
+            and rsp.status_code in policy.retry_statuses,
+        )
@@ -0,0 +1,255 @@
+"""
+zoom_client rate limit scheduler which paces Zoom API requests using
+token buckets keyed by Zoom's rate limit categories
+more detail can be found here:
+https://marketplace.zoom.us/docs/api-reference/rate-limits#rate-limits
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+# zoom rate limit categories
+LIGHT = "light"
+MEDIUM = "medium"
+HEAVY = "heavy"
+RESOURCE_INTENSIVE = "resource_intensive"
+
+# default (calls, period in seconds) per category, conservative enough
+# for any account type until the api reports the account's actual limits
+DEFAULT_RATE_LIMITS = {
+    LIGHT: (10, 1),
+    MEDIUM: (60, 5),
+    HEAVY: (39, 5),
+    RESOURCE_INTENSIVE: (19, 65),
+}
+
+# values found in the X-RateLimit-Category response header
+HEADER_CATEGORIES = {
+    "light": LIGHT,
+    "medium": MEDIUM,
+    "heavy": HEAVY,
+    "resource-intensive": RESOURCE_INTENSIVE,
+}
+
+
+def classify(request_type, resource):
+    """
+    Find the Zoom rate limit category for an api request
+
+    params:
+        request_type: http method of the request ("get", "post", ...)
+        resource: api resource path relative to the root request url
+
+    returns:
+        one of LIGHT, MEDIUM, HEAVY or RESOURCE_INTENSIVE
+    """
+    resource = resource.strip("/")
+    parts = resource.split("/")
+
+    if parts[0] == "metrics":
+        if parts[-1] == "participants":
+            return HEAVY
+        return RESOURCE_INTENSIVE
+
+    if parts[0] == "report":
+        return HEAVY
+
+    # listing collections (users, groups/{id}/members) or adding to them
+    if len(parts) % 2 == 1 and request_type in ("get", "post"):
+        return MEDIUM
+
+    return LIGHT
+
+
+def parse_retry_after(value):
+    """
+    Convert a Retry-After header value into seconds to wait
+
+    params:
+        value: header value as delay seconds, an http date or an iso timestamp
+
+    returns:
+        seconds to wait (never negative) or None when the value can't be parsed
+    """
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    # only needed for the rarer http date form
+    import email.utils  # pylint: disable=import-outside-toplevel
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            retry_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class TokenBucket:
+    """
+    zoom_client thread-safe token bucket allowing `calls` requests per `period`
+    """
+
+    def __init__(self, calls, period):
+        """
+        params:
+            calls: number of requests allowed per period (and burst size)
+            period: length of the period in seconds
+        """
+        self._lock = threading.Lock()
+        self.capacity = float(calls)
+        self.rate = calls / period
+        self.tokens = float(calls)
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        # nothing accrues while paused (updated is then in the future)
+        if now > self.updated:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+
+    def reserve(self):
+        """
+        Reserve a token for one request
+
+        returns:
+            seconds the caller must wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            # tokens may go negative so that waiting callers queue in order
+            self.tokens -= 1
+
+            return max(self.updated - now, 0.0) + max(-self.tokens, 0.0) / self.rate
+
+    def set_rate(self, calls, period):
+        """Change the allowed number of calls per period"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.capacity = float(calls)
+            self.rate = calls / period
+            self.tokens = min(self.tokens, self.capacity)
+
+    def pause(self, seconds):
+        """Hold back all requests for the given number of seconds"""
+        with self._lock:
+            now = time.monotonic()
+
+            # restart from an empty bucket once the pause is over
+            self._refill(now)
+            self.tokens = min(self.tokens, 0.0)
+            self.updated = max(self.updated, now + seconds)
+
+
+class RateLimitScheduler:
+    """
+    zoom_client scheduler holding one token bucket per Zoom rate limit
+    category, adapting each bucket from X-RateLimit-* response headers
+    """
+
+    def __init__(self, rate_limits=None):
+        """
+        params:
+            rate_limits: optional dict of category to (calls, period) overriding
+                DEFAULT_RATE_LIMITS
+        """
+        limits = dict(DEFAULT_RATE_LIMITS)
+        limits.update(rate_limits or {})
+
+        self.buckets = {
+            category: TokenBucket(calls, period)
+            for category, (calls, period) in limits.items()
+        }
+
+    @classmethod
+    def from_config(cls, config_data):
+        """Build a scheduler using optional rate_limits from client config data"""
+        return cls(config_data.get("rate_limits"))
+
+    def reserve(self, category):
+        """
+        Reserve a request slot within the category
+
+        returns:
+            seconds the caller must wait before sending the request
+        """
+        return self.buckets[category].reserve()
+
+    def acquire(self, category):
+        """
+        Block until a request within the category may be sent
+
+        returns:
+            seconds spent waiting
+        """
+        wait = self.reserve(category)
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    def update(self, category, headers, status_code, max_pause=None):
+        """
+        Adapt the pace of a category using response headers
+
+        params:
+            category: category the request was scheduled under
+            headers: response headers
+            status_code: response http status code
+            max_pause: longest pause in seconds, longer Retry-After waits
+                (such as daily limits) are left to the caller rather than
+                holding back every later request of the category
+        """
+        category = HEADER_CATEGORIES.get(
+            str(headers.get("X-RateLimit-Category", "")).lower(), category
+        )
+        bucket = self.buckets[category]
+
+        # per-second limits reported by zoom reflect the account's actual quota,
+        # malformed (or non-positive) limits are ignored
+        try:
+            limit = int(float(headers.get("X-RateLimit-Limit")))
+        except (TypeError, ValueError, OverflowError):
+            limit = None
+        if (
+            limit is not None
+            and limit > 0
+            and str(headers.get("X-RateLimit-Type", "")).upper() == "QPS"
+            and limit != bucket.capacity
+        ):
+            logging.info("Adjusting %s rate limit to %s per second", category, limit)
+            bucket.set_rate(limit, 1)
+
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+
+        if status_code == 429 or retry_after is not None:
+            pause = retry_after if retry_after is not None else 1.0
+            if max_pause is not None:
+                pause = min(pause, max_pause)
+
+            logging.warning(
+                "Rate limited for %s requests, pausing for %s seconds",
+                category,
+                pause,
+            )
+            bucket.pause(pause)
+
+        elif headers.get("X-RateLimit-Remaining") in ("0", 0):
+            bucket.pause(1.0)
@@ -0,0 +1,172 @@
+"""
+zoom_client in-process coalescing of identical concurrent GET requests
+and a size and time bounded memo of their recent responses
+"""
+import threading
+import time
+from collections import OrderedDict
+
+# defaults used when the client configuration does not provide a value
+DEFAULT_MEMO_TTL = 0
+DEFAULT_MEMO_SIZE = 1024
+
+
+class _Call:
+    """zoom_client call in flight which other callers may wait on"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    zoom_client single-flight group; concurrent calls with the same key share
+    one execution of the function and its result (or exception)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        """
+        Call func, or wait for the call already in flight under the same key
+
+        params:
+            key: identity of the call
+            func: callable taking no arguments
+
+        returns:
+            (result of func, whether it was shared from another caller's call)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except Exception as error:  # pylint: disable=broad-except
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result, False
+
+
+class MemoCache:
+    """
+    zoom_client thread-safe least recently used memo of responses, bounded
+    in size and holding each response for ttl seconds. Responses rather than
+    decoded results are held so every caller decodes its own copy.
+    """
+
+    def __init__(self, ttl=DEFAULT_MEMO_TTL, max_size=DEFAULT_MEMO_SIZE):
+        """
+        params:
+            ttl: seconds responses are held, 0 to disable the memo
+            max_size: largest number of responses held
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config_data):
+        """Build a memo from the "memo_ttl" and "memo_size" client config data"""
+        return cls(
+            ttl=config_data.get("memo_ttl", DEFAULT_MEMO_TTL),
+            max_size=config_data.get("memo_size", DEFAULT_MEMO_SIZE),
+        )
+
+    @property
+    def enabled(self):
+        """Whether responses are memoized"""
+        return self.ttl > 0 and self.max_size > 0
+
+    def get(self, key):
+        """Return a fresh memoized response or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return entry[2]
+
+    def set(self, key, resource, rsp, generation):
+        """
+        Memoize a response unless an invalidation happened since it was requested
+
+        params:
+            key: cache key of the request
+            resource: resource path of the request, matched by invalidate
+            rsp: response with its body already read
+            generation: value of `generation` when the request was started
+        """
+        with self._lock:
+            if generation != self.generation:
+                return
+
+            self._entries[key] = (resource.strip("/"), time.monotonic() + self.ttl, rsp)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, resource=None):
+        """
+        Drop memoized responses of a resource after it was changed: those of
+        the resource, of its sub-resources and of the listing it belongs to
+
+        params:
+            resource: resource path ("users/abc"), None to drop every response
+        """
+        with self._lock:
+            self.generation += 1
+
+            if resource is None:
+                self._entries.clear()
+                return
+
+            resource = resource.strip("/")
+            parent = resource.rpartition("/")[0]
+            stale = [
+                key
+                for key, (path, _, _) in self._entries.items()
+                if path in (resource, parent) or path.startswith(resource + "/")
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def stats(self):
+        """Return the number of responses held, hits and misses"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,189 @@
+"""
+zoom_client indexed local store of Zoom users which is refreshed
+incrementally and persisted between runs
+"""
+import json
+import os
+import tempfile
+import time
+
+
+class SyncDiff:
+    """
+    zoom_client differences found while reconciling a user listing with the store
+    """
+
+    def __init__(self, added=None, changed=None, removed=None):
+        """
+        params:
+            added: ids of users new to the store
+            changed: ids of users whose data changed
+            removed: ids of users no longer present
+        """
+        self.added = added or []
+        self.changed = changed or []
+        self.removed = removed or []
+
+    def __bool__(self):
+        return bool(self.added or self.changed or self.removed)
+
+    def as_dict(self):
+        """Return the differences as a dictionary"""
+        return {"added": self.added, "changed": self.changed, "removed": self.removed}
+
+    def __repr__(self):
+        return (
+            f"SyncDiff(added={len(self.added)}, changed={len(self.changed)}, "
+            f"removed={len(self.removed)})"
+        )
+
+
+class UserStore:
+    """
+    zoom_client store of users keyed by id with secondary indexes on
+    email, type and group
+    """
+
+    def __init__(self, path=None):
+        """
+        params:
+            path: optional json file the store is loaded from and saved to
+        """
+        self.path = path
+        self.synced_at = None
+        self.users = {}
+        self._by_email = {}
+        self._by_type = {}
+        self._by_group = {}
+
+        if path and os.path.exists(path):
+            self.load()
+
+    def __len__(self):
+        return len(self.users)
+
+    def __iter__(self):
+        return iter(self.users.values())
+
+    def __contains__(self, user_id):
+        return user_id in self.users
+
+    def _index(self, user):
+        user_id = user["id"]
+        if user.get("email"):
+            self._by_email[user["email"].lower()] = user_id
+        self._by_type.setdefault(user.get("type"), set()).add(user_id)
+        for group_id in user.get("group_ids") or []:
+            self._by_group.setdefault(group_id, set()).add(user_id)
+
+    def _unindex(self, user):
+        user_id = user["id"]
+        if user.get("email"):
+            self._by_email.pop(user["email"].lower(), None)
+        self._by_type.get(user.get("type"), set()).discard(user_id)
+        for group_id in user.get("group_ids") or []:
+            self._by_group.get(group_id, set()).discard(user_id)
+
+    def upsert(self, user):
+        """
+        Add or replace a user
+
+        returns:
+            "added", "changed" or None when the stored user was unchanged
+        """
+        previous = self.users.get(user["id"])
+        if previous == user:
+            return None
+
+        if previous is not None:
+            self._unindex(previous)
+
+        self.users[user["id"]] = user
+        self._index(user)
+
+        return "added" if previous is None else "changed"
+
+    def remove(self, user_id):
+        """Remove a user, returning True when it was stored"""
+        user = self.users.pop(user_id, None)
+        if user is None:
+            return False
+
+        self._unindex(user)
+        return True
+
+    def get(self, user_id):
+        """Find a user by id"""
+        return self.users.get(user_id)
+
+    def find_by_email(self, email):
+        """Find a user by email address (case insensitive)"""
+        return self.users.get(self._by_email.get(email.lower()))
+
+    def find_by_type(self, user_type):
+        """Find all users of a type (1 basic, 2 licensed, 3 on-prem)"""
+        return [self.users[x] for x in self._by_type.get(user_type, ())]
+
+    def find_by_group(self, group_id):
+        """Find all users who are members of a group"""
+        return [self.users[x] for x in self._by_group.get(group_id, ())]
+
+    def reconcile(self, users):
+        """
+        Reconcile the store with a complete user listing, only touching
+        users which were added, changed or removed
+
+        params:
+            users: iterable of every current user
+
+        returns:
+            SyncDiff of the changes applied
+        """
+        diff = SyncDiff()
+        seen = set()
+
+        for user in users:
+            seen.add(user["id"])
+            change = self.upsert(user)
+            if change == "added":
+                diff.added.append(user["id"])
+            elif change == "changed":
+                diff.changed.append(user["id"])
+
+        for user_id in [x for x in self.users if x not in seen]:
+            self.remove(user_id)
+            diff.removed.append(user_id)
+
+        self.synced_at = time.time()
+
+        return diff
+
+    def load(self):
+        """Load the store from its json file"""
+        with open(self.path, encoding="utf-8") as store_file:
+            data = json.load(store_file)
+
+        self.users = {}
+        self._by_email = {}
+        self._by_type = {}
+        self._by_group = {}
+        self.synced_at = data.get("synced_at")
+
+        for user in data.get("users", []):
+            self.upsert(user)
+
+    def save(self):
+        """Atomically write the store to its json file"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as store_file:
+                json.dump(
+                    {"synced_at": self.synced_at, "users": list(self.users.values())},
+                    store_file,
+                )
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
@@ -0,0 +1,152 @@
+"""
+zoom_client incremental decoding of paginated Zoom API responses, reading
+the records array one record at a time as the body arrives
+"""
+import codecs
+import json
+
+# bytes read from the response at a time
+CHUNK_SIZE = 64 * 1024
+
+# decoded text kept before the buffer is compacted
+COMPACT_AT = 64 * 1024
+
+JSON_WHITESPACE = " \t\r\n"
+
+
+def project(record, fields):
+    """Return a record holding only the given fields (those it has)"""
+    if fields is None:
+        return record
+
+    return {field: record[field] for field in fields if field in record}
+
+
+class RecordStream:
+    """
+    zoom_client iterable over the records array of a json page read from a
+    stream of byte chunks. Every other top-level value of the page (such as
+    next_page_token or page_count) is collected in `fields`, which is only
+    complete once iteration finishes as they may follow the records.
+    """
+
+    def __init__(self, chunks, records_key, fields=None):
+        """
+        params:
+            chunks: iterable of bytes chunks of the response body
+            records_key: key of the records array in the page ("users")
+            fields: optional record fields to keep, None for whole records
+        """
+        self.records_key = records_key
+        self.record_fields = tuple(fields) if fields is not None else None
+        self.fields = {}
+
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._exhausted = False
+        self._started = False
+
+    def _fill(self):
+        if self._exhausted:
+            return False
+
+        # keep the buffer to the unread text so memory stays flat
+        if self._pos > COMPACT_AT:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._exhausted = True
+            self._buffer += self._text.decode(b"", final=True)
+        else:
+            self._buffer += self._text.decode(chunk)
+
+        return True
+
+    def _peek(self):
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            buffer = self._buffer
+            while self._pos < len(buffer) and buffer[self._pos] in JSON_WHITESPACE:
+                self._pos += 1
+
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+
+            if not self._fill():
+                raise ValueError("Unexpected end of json response")
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError(
+                f"Expected {char!r} at {self._pos} of json response, "
+                f"found {self._buffer[self._pos]!r}"
+            )
+        self._pos += 1
+
+    def _value(self):
+        """Decode the next complete json value"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+
+            self._pos = end
+            return value
+
+    def __iter__(self):
+        if self._started:
+            raise RuntimeError("RecordStream can only be iterated once")
+        self._started = True
+
+        self._expect("{")
+        if self._peek() == "}":
+            return
+
+        while True:
+            key = self._value()
+            self._expect(":")
+
+            if key == self.records_key and self._peek() == "[":
+                self._pos += 1
+                if self._peek() != "]":
+                    while True:
+                        yield project(self._value(), self.record_fields)
+                        if self._peek() != ",":
+                            break
+                        self._pos += 1
+                self._expect("]")
+            else:
+                self.fields[key] = self._value()
+
+            if self._peek() != ",":
+                break
+            self._pos += 1
+
+        self._expect("}")
+
+    def read_page(self):
+        """
+        Read the whole page with its records decoded (and projected) one at
+        a time, so the raw body and unused fields are never held together
+
+        returns:
+            page dictionary with the records as a list under records_key
+        """
+        records = list(self)
+        page = dict(self.fields)
+        page[self.records_key] = records
+
+        return page
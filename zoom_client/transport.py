@@ -0,0 +1,183 @@
+"""
+zoom_client transport classes which send HTTP requests to the Zoom API
+over pooled, keep-alive connections
+"""
+import json
+import threading
+
+# defaults used when the client configuration does not provide a value
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = (5, 60)
+DEFAULT_MAX_RETRIES = 3
+
+
+class Transport:
+    """
+    zoom_client transport interface; subclasses send a single HTTP request
+    and return a requests.Response-like object
+    """
+
+    # pylint: disable=too-many-arguments
+    def request(self, method, url, params=None, data=None, headers=None, stream=False):
+        """
+        Send a single HTTP request and return the response, leaving the body
+        unread for iter_content when stream is True
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held by the transport"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SessionTransport(Transport):
+    """
+    zoom_client transport backed by a pooled requests.Session so that
+    TCP/TLS connections are reused between API requests
+    """
+
+    def __init__(
+        self,
+        pool_size=DEFAULT_POOL_SIZE,
+        timeout=DEFAULT_TIMEOUT,
+        max_retries=DEFAULT_MAX_RETRIES,
+    ):
+        """
+        params:
+            pool_size: number of keep-alive connections kept per host
+            timeout: seconds (or (connect, read) tuple) to wait on the api
+            max_retries: retries for failed connections (not http errors)
+        """
+        # requests is only imported once a session is needed
+        # pylint: disable=import-outside-toplevel
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self.timeout = timeout
+        self.session = requests.Session()
+
+        # only connection level failures are retried here, http status
+        # codes are handed back to the client unchanged
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            # throttled responses are left to the client retry policy
+            max_retries=Retry(
+                total=max_retries,
+                connect=max_retries,
+                read=0,
+                status=0,
+                respect_retry_after_header=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @classmethod
+    def from_config(cls, config_data):
+        """Build a transport using optional settings from client config data"""
+        timeout = config_data.get("timeout", DEFAULT_TIMEOUT)
+        if isinstance(timeout, list):
+            timeout = tuple(timeout)
+
+        return cls(
+            pool_size=config_data.get("pool_size", DEFAULT_POOL_SIZE),
+            timeout=timeout,
+            max_retries=config_data.get("max_retries", DEFAULT_MAX_RETRIES),
+        )
+
+    # pylint: disable=too-many-arguments
+    def request(self, method, url, params=None, data=None, headers=None, stream=False):
+        """Send a single HTTP request over the pooled session"""
+        return self.session.request(
+            method.upper(),
+            url,
+            params=params,
+            data=data,
+            headers=headers,
+            timeout=self.timeout,
+            verify=True,
+            stream=stream,
+        )
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+
+class DryRunResponse:
+    """
+    zoom_client stand-in for the response to a request which a DryRunTransport
+    recorded rather than sent
+    """
+
+    def __init__(self, status_code, payload=None):
+        """
+        params:
+            status_code: http status code of the response
+            payload: optional json body of the response
+        """
+        self.status_code = status_code
+        self.content = b"" if payload is None else json.dumps(payload).encode()
+        self.headers = {"Content-Length": str(len(self.content))}
+
+    @property
+    def text(self):
+        """Body of the response as text"""
+        return self.content.decode()
+
+    def json(self):
+        """Decode the json body, raising ValueError when there is none"""
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=1):
+        """Iterate over the body in chunks of chunk_size bytes"""
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+    def close(self):
+        """Nothing to release, present for compatibility"""
+
+
+class DryRunTransport(Transport):
+    """
+    zoom_client transport recording every request instead of sending it;
+    writes succeed and listings answer a single empty page
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = []
+
+    # pylint: disable=too-many-arguments
+    def request(self, method, url, params=None, data=None, headers=None, stream=False):
+        """Record the request (without its auth headers) and answer it"""
+        with self._lock:
+            self.requests.append(
+                {"method": method.lower(), "url": url, "params": params, "data": data}
+            )
+
+        if method.lower() == "get":
+            # the records key of a listing is the last part of its path
+            return DryRunResponse(
+                200,
+                {
+                    "page_count": 0,
+                    "page_number": 1,
+                    "total_records": 0,
+                    # an empty pagination token, not a credential
+                    "next_page_token": "",  # nosec B105
+                    url.rstrip("/").rsplit("/", 1)[-1]: [],
+                },
+            )
+
+        if method.lower() == "post":
+            return DryRunResponse(201, {})
+
+        return DryRunResponse(204)
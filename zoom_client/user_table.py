@@ -0,0 +1,144 @@
+"""
+zoom_client compact columnar model of a Zoom user listing holding only
+the fields used for account metrics
+"""
+import math
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from datetime import datetime, timezone
+
+# human-readable names of zoom user types
+TYPE_LABELS = {1: "Basic", 2: "Pro", 3: "Corp"}
+
+# upper bounds (in days since last login) of the last login buckets
+LAST_LOGIN_BUCKETS = ((30, "< 30 days"), (90, "30-90 days"), (365, "90-365 days"))
+
+
+def _timestamp(value):
+    if not value:
+        return math.nan
+
+    return (
+        datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+        .replace(tzinfo=timezone.utc)
+        .timestamp()
+    )
+
+
+class Categories:
+    """
+    zoom_client dictionary encoding repeated strings (status, department)
+    as small integer codes
+    """
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def encode(self, value):
+        """Return the code of a value, adding it when new"""
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+
+        return code
+
+    def decode_counts(self, codes):
+        """Count each value of a column of codes"""
+        return {self.values[code]: count for code, count in Counter(codes).items()}
+
+
+class UserTable:
+    """
+    zoom_client columnar user listing; each field is held in one compact
+    array (or dictionary encoded) column rather than one dict per user
+    """
+
+    __slots__ = (
+        "ids",
+        "emails",
+        "types",
+        "statuses",
+        "departments",
+        "last_login",
+        "_statuses",
+        "_departments",
+    )
+
+    def __init__(self):
+        self.ids = []
+        self.emails = []
+        self.types = array("b")
+        self.statuses = array("b")
+        self.departments = array("i")
+        self.last_login = array("d")
+        self._statuses = Categories()
+        self._departments = Categories()
+
+    @classmethod
+    def from_users(cls, users):
+        """
+        Build a table from user dictionaries
+
+        params:
+            users: iterable of user dictionaries (such as Users.iter_users()),
+                consumed one at a time so the dictionaries need not all be held
+
+        returns:
+            UserTable of the users
+        """
+        table = cls()
+        for user in users:
+            table.append(user)
+
+        return table
+
+    def append(self, user):
+        """Add a user dictionary to the table"""
+        self.ids.append(user["id"])
+        self.emails.append(user.get("email"))
+        self.types.append(user.get("type") or 0)
+        self.statuses.append(self._statuses.encode(user.get("status")))
+        self.departments.append(self._departments.encode(user.get("dept")))
+        self.last_login.append(_timestamp(user.get("last_login_time")))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def type_counts(self):
+        """Count users per type label"""
+        return {
+            TYPE_LABELS.get(user_type, str(user_type)): count
+            for user_type, count in Counter(self.types).items()
+        }
+
+    def status_counts(self):
+        """Count users per status"""
+        return self._statuses.decode_counts(self.statuses)
+
+    def department_counts(self):
+        """Count users per department"""
+        return self._departments.decode_counts(self.departments)
+
+    def last_login_counts(self, now=None):
+        """
+        Count users per time since their last login
+
+        params:
+            now: optional datetime to measure from, defaults to the current time
+
+        returns:
+            dictionary of bucket label to number of users
+        """
+        now = (now or datetime.now(timezone.utc)).timestamp()
+        bounds = [now - days * 86400 for days, _ in reversed(LAST_LOGIN_BUCKETS)]
+        labels = ["> 365 days"] + [label for _, label in reversed(LAST_LOGIN_BUCKETS)]
+
+        counts = Counter(
+            "never" if math.isnan(x) else labels[bisect_right(bounds, x)]
+            for x in self.last_login
+        )
+
+        return {label: counts.get(label, 0) for label in ["never"] + labels[::-1]}